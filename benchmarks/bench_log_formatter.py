@@ -0,0 +1,138 @@
+"""Benchmark JSON log formatting throughput against python-json-logger.
+
+Run with: python -m benchmarks.bench_log_formatter
+"""
+
+import logging
+import time
+from uuid import uuid4
+
+from pythonjsonlogger.json import JsonFormatter
+
+from src.infrastructure.json_log_formatter import FastJsonFormatter, set_caller_lookup
+from src.infrastructure.logging_context import (
+    get_contextual_logger,
+    operation_id,
+    request_id,
+)
+
+FORMAT = "%(asctime)s %(name)s %(levelname)s %(message)s %(pathname)s %(lineno)s"
+RECORDS = 2_000
+ROUNDS = 25
+
+
+class FormatHandler(logging.Handler):
+    """Handler that formats each record and discards the result."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+
+class CaptureHandler(logging.Handler):
+    """Handler that keeps records for later formatting."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def make_records() -> list:
+    """Create records shaped like the ones the service logs per request."""
+    handler = CaptureHandler()
+    stdlib_logger = logging.getLogger("bench_log_formatter")
+    stdlib_logger.handlers = [handler]
+    stdlib_logger.setLevel(logging.INFO)
+    stdlib_logger.propagate = False
+    logger = get_contextual_logger(stdlib_logger.name)
+
+    request_id.set(str(uuid4()))
+    for i in range(RECORDS // 2):
+        operation_id.set(f"get_service_{i}")
+        logger.info(
+            "Operation completed: %s",
+            "get_service",
+            extra={
+                "operation": "get_service",
+                "service_id": uuid4(),
+                "duration_ms": i % 50,
+            },
+        )
+        logger.info(
+            "Request completed",
+            extra={"method": "GET", "path": "/v1/services", "status_code": 200},
+        )
+    return handler.records
+
+
+def log_requests(logger) -> None:
+    """Log the records of a batch of requests."""
+    for i in range(RECORDS // 2):
+        logger.info(
+            "Operation completed: %s",
+            "get_service",
+            extra={"operation": "get_service", "duration_ms": i % 50},
+        )
+        logger.info(
+            "Request completed",
+            extra={"method": "GET", "path": "/v1/services", "status_code": 200},
+        )
+
+
+def bench_end_to_end() -> None:
+    """Time logging calls including record creation and formatting."""
+    stdlib_logger = logging.getLogger("bench_log_formatter.e2e")
+    stdlib_logger.setLevel(logging.INFO)
+    stdlib_logger.propagate = False
+    logger = get_contextual_logger(stdlib_logger.name)
+    handler = FormatHandler()
+    stdlib_logger.handlers = [handler]
+
+    cases = (
+        ("python-json-logger", JsonFormatter(FORMAT), True),
+        ("FastJsonFormatter", FastJsonFormatter(FORMAT), True),
+        ("  without caller", FastJsonFormatter(FORMAT, include_caller=False), False),
+    )
+    baseline = None
+    for label, formatter, caller_lookup in cases:
+        handler.setFormatter(formatter)
+        set_caller_lookup(caller_lookup)
+        best = float("inf")
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            log_requests(logger)
+            best = min(best, time.perf_counter() - start)
+        set_caller_lookup(True)
+        rate = RECORDS / best
+        baseline = baseline or rate
+        print(f"{label:<20} {rate:12,.0f} records/s  {rate / baseline:5.1f}x")
+
+
+def main() -> None:
+    print("Formatting only")
+    records = make_records()
+    formatters = (
+        ("python-json-logger", JsonFormatter(FORMAT)),
+        ("FastJsonFormatter", FastJsonFormatter(FORMAT)),
+        ("  without caller", FastJsonFormatter(FORMAT, include_caller=False)),
+    )
+    baseline = None
+    for label, formatter in formatters:
+        best = float("inf")
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for record in records:
+                formatter.format(record)
+            best = min(best, time.perf_counter() - start)
+        rate = len(records) / best
+        baseline = baseline or rate
+        print(f"{label:<20} {rate:12,.0f} records/s  {rate / baseline:5.1f}x")
+
+    print("\nLogging call and formatting")
+    bench_end_to_end()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark the per-call overhead of ContextualLogger with INFO enabled.
+
+Records go to a handler that discards them, so only the cost paid at the
+call site (level check, context, record creation) is measured.
+
+Run with: python -m benchmarks.bench_logging
+"""
+
+import logging
+import timeit
+
+from src.infrastructure.logging_context import (
+    get_contextual_logger,
+    operation_id,
+    request_id,
+)
+
+ITERATIONS = 200_000
+
+
+class DiscardHandler(logging.Handler):
+    """Handler that drops every record."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+def main() -> None:
+    stdlib_logger = logging.getLogger("bench_logging")
+    stdlib_logger.handlers = [DiscardHandler()]
+    stdlib_logger.setLevel(logging.INFO)
+    stdlib_logger.propagate = False
+    logger = get_contextual_logger("bench_logging")
+
+    request_id.set("4f6d6c1e-2f4b-4a8e-9a57-8f0e0b1c2d3e")
+    operation_id.set("get_service_endpoint_1700000000000")
+    service_id = "0b7e2c58-96a3-4d6f-bb1f-0d2b6a7c5e91"
+
+    extra = {"path": "/v1/services", "status_code": 200, "duration_ms": 1}
+    stdlib_extra = {
+        "request_id": request_id.get(),
+        "operation_id": operation_id.get(),
+        **extra,
+    }
+    cases = (
+        (
+            "debug off, extra",
+            lambda: logger.debug(
+                "Presenting service", extra={"service_id": service_id}
+            ),
+        ),
+        (
+            "debug off, lazy",
+            lambda: logger.debug(
+                "Presenting service", extra=lambda: {"service_id": service_id}
+            ),
+        ),
+        ("info", lambda: logger.info("Request started")),
+        ("info, extra", lambda: logger.info("Request completed", extra=extra)),
+        ("stdlib info", lambda: stdlib_logger.info("Request started")),
+        (
+            "stdlib info, extra",
+            lambda: stdlib_logger.info("Request completed", extra=stdlib_extra),
+        ),
+    )
+    for label, func in cases:
+        seconds = min(timeit.repeat(func, number=ITERATIONS, repeat=5))
+        print(f"{label:<20} {seconds / ITERATIONS * 1e9:8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
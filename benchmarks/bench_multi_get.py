@@ -0,0 +1,46 @@
+"""Benchmark a batched multi-get against one request per service.
+
+Run with: python -m benchmarks.bench_multi_get
+"""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from src.config.settings import Settings
+from src.infrastructure.rest_server import create_app
+
+PAGE_SIZES = (50, 200)
+ROUNDS = 5
+
+
+def main() -> None:
+    app = create_app(Settings())
+    with TestClient(app) as client:
+        ids = [
+            client.post("/v1/services", json={"name": f"svc-{i}"}).json()["id"]
+            for i in range(max(PAGE_SIZES))
+        ]
+
+        for size in PAGE_SIZES:
+            page = ids[:size]
+
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                for service_id in page:
+                    client.get(f"/v1/services/{service_id}")
+            single = (time.perf_counter() - start) / ROUNDS
+
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                client.get("/v1/services", params={"ids": ",".join(page)})
+            batched = (time.perf_counter() - start) / ROUNDS
+
+            print(
+                f"{size:>4} ids: {size} single requests {single * 1e3:8.2f} ms, "
+                f"multi-get {batched * 1e3:7.2f} ms ({single / batched:5.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark the overhead of the sampling profiler.
+
+Measures the cost of one sample, which bounds the overhead (samples hold
+the GIL), and runs a pure-Python workload with the profiler off and on at
+the default interval. A few idle threads are alive as in a worker (event
+loop, threadpool, log writer).
+
+Run with: python -m benchmarks.bench_profiler
+"""
+
+import threading
+import time
+import timeit
+
+from src.infrastructure.sampling_profiler import (
+    DEFAULT_INTERVAL_SECONDS,
+    SamplingProfiler,
+    run_profile,
+)
+
+IDLE_THREADS = 8
+REPEATS = 5
+
+
+def workload() -> int:
+    total = 0
+    for i in range(300_000):
+        total += sum(divmod(i, 7))
+    return total
+
+
+def best_seconds() -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        workload()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    stop = threading.Event()
+    for _ in range(IDLE_THREADS):
+        threading.Thread(target=stop.wait, daemon=True).start()
+
+    sampler = SamplingProfiler()
+    per_sample = min(timeit.repeat(sampler.sample, number=1000, repeat=5)) / 1000
+    share = per_sample / DEFAULT_INTERVAL_SECONDS * 100
+    print(f"one sample, {threading.active_count()} threads {per_sample * 1e6:8.1f} us")
+    print(f"  = {share:.2f}% of one CPU at {DEFAULT_INTERVAL_SECONDS * 1000:g}ms")
+
+    baseline = best_seconds()
+    result = {}
+    profiler_thread = threading.Thread(
+        target=lambda: result.update(profiler=run_profile(baseline * REPEATS * 3))
+    )
+    profiler_thread.start()
+    profiled = best_seconds()
+    profiler_thread.join()
+    stop.set()
+
+    profiler = result["profiler"]
+    overhead = (profiled - baseline) / baseline * 100
+    print(f"workload, profiler off   {baseline * 1000:8.1f} ms")
+    print(f"workload, profiler on    {profiled * 1000:8.1f} ms  ({overhead:+.1f}%)")
+    print(
+        f"{profiler.samples} samples at {DEFAULT_INTERVAL_SECONDS * 1000:g}ms, "
+        f"{len(profiler.counts)} distinct stacks"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Benchmark the per-request cost of resolving request-scoped dependencies.
+
+Run with: python -m benchmarks.bench_request_scope
+"""
+
+import asyncio
+import timeit
+
+from src.infrastructure.container import Container, RequestScope
+
+ITERATIONS = 100_000
+
+
+def main() -> None:
+    container = Container()
+    asyncio.run(container.init_resources())
+
+    def pooled() -> None:
+        with container.request_scope() as scope:
+            scope.presenter
+
+    def unpooled() -> None:
+        RequestScope(container)
+
+    for label, func in (("pooled scope", pooled), ("fresh scope", unpooled)):
+        seconds = min(timeit.repeat(func, number=ITERATIONS, repeat=3))
+        print(f"{label:<14} {seconds / ITERATIONS * 1e6:8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
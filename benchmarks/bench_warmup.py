@@ -0,0 +1,81 @@
+"""Measure the effect of startup warmup on latency of the first requests.
+
+Each run starts a fresh interpreter so nothing is warm, waits for readiness,
+then times the first requests of a mixed workload.
+
+Run with: python -m benchmarks.bench_warmup
+"""
+
+import json
+import subprocess
+import sys
+import time
+
+REQUESTS = 300
+RUNS = 3
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def child(warmup_enabled: bool) -> None:
+    """Start the app, wait until ready and time the first requests."""
+    from fastapi.testclient import TestClient
+
+    from src.config.settings import Settings
+    from src.infrastructure.rest_server import create_app
+
+    app = create_app(Settings(warmup_enabled=warmup_enabled))
+    latencies = []
+    with TestClient(app) as client:
+        while client.get("/health/ready").status_code != 200:
+            time.sleep(0.005)
+
+        service_id = None
+        for i in range(REQUESTS):
+            start = time.perf_counter()
+            if i % 4 == 0 or service_id is None:
+                response = client.post("/v1/services", json={"name": f"svc-{i}"})
+                service_id = response.json()["id"]
+            elif i % 4 == 1:
+                client.get(f"/v1/services/{service_id}")
+            elif i % 4 == 2:
+                client.get("/v1/services", params={"fields": "id,name"})
+            else:
+                client.get(
+                    f"/v1/services/{service_id}",
+                    headers={"Accept": "application/msgpack"},
+                )
+            latencies.append(time.perf_counter() - start)
+    print(json.dumps(latencies))
+
+
+def main() -> None:
+    for label, flag in (("cold", "0"), ("warmed", "1")):
+        latencies, first = [], []
+        for _ in range(RUNS):
+            result = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_warmup", "--child", flag],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            run = json.loads(result.stdout.strip().splitlines()[-1])
+            first.extend(run[:4])
+            latencies.extend(run)
+        print(
+            f"{label:<7} first {REQUESTS} requests x{RUNS}: "
+            f"p50 {_percentile(latencies, 0.5) * 1e3:6.2f} ms  "
+            f"p99 {_percentile(latencies, 0.99) * 1e3:6.2f} ms  "
+            f"max {max(latencies) * 1e3:6.2f} ms  "
+            f"first-of-kind mean {sum(first) / len(first) * 1e3:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        child(sys.argv[2] == "1")
+    else:
+        main()
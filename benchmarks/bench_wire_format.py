@@ -0,0 +1,65 @@
+"""Benchmark MessagePack against JSON encoding and decoding of service lists.
+
+Run with: python -m benchmarks.bench_wire_format
+"""
+
+import json
+import timeit
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.service_entity import Service
+from src.interface_adapters.dtos.service_response_dto import (
+    ServiceListResponseDTO,
+    ServiceResponseDTO,
+)
+from src.interface_adapters.serializers import msgpack_serializer
+
+SERVICES = 200
+ITERATIONS = 200
+
+
+def _json_decode(payload: bytes) -> list:
+    """Decode JSON the way a client must, restoring UUIDs and datetimes."""
+    services = json.loads(payload)["services"]
+    for service in services:
+        service["id"] = UUID(service["id"])
+        service["created_at"] = datetime.fromisoformat(service["created_at"])
+        service["updated_at"] = datetime.fromisoformat(service["updated_at"])
+    return services
+
+
+def _msgpack_decode(payload: bytes) -> list:
+    """Decode MessagePack, restoring UUIDs from their 16-byte form."""
+    services = msgpack_serializer.decode(payload)["services"]
+    for service in services:
+        service["id"] = UUID(bytes=service["id"])
+    return services
+
+
+def main() -> None:
+    model = ServiceListResponseDTO(
+        services=[
+            ServiceResponseDTO.from_dto(Service.create(f"svc-{i}", "x" * 120))
+            for i in range(SERVICES)
+        ]
+    )
+    json_payload = model.model_dump_json().encode()
+    msgpack_payload = msgpack_serializer.encode(model.model_dump())
+
+    cases = (
+        ("json encode", lambda: model.model_dump_json()),
+        ("msgpack encode", lambda: msgpack_serializer.encode(model.model_dump())),
+        ("json decode", lambda: _json_decode(json_payload)),
+        ("msgpack decode", lambda: _msgpack_decode(msgpack_payload)),
+    )
+    for label, func in cases:
+        seconds = min(timeit.repeat(func, number=ITERATIONS, repeat=3))
+        rate = SERVICES * ITERATIONS / seconds
+        print(f"{label:<15} {rate:12,.0f} services/s")
+
+    print(f"payload size    json {len(json_payload):,} B, msgpack {len(msgpack_payload):,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
 from ..domain.service_entity import Service
 
 
@@ -9,3 +10,10 @@ class CreateServiceInputPort(ABC):
     def create_service(self, name: str, description: str) -> Service:
         """Create a new service."""
         pass
+
+    @abstractmethod
+    def create_services(
+        self, commands: List[Tuple[str, str]]
+    ) -> List[Optional[Service]]:
+        """Create several services from (name, description) pairs in one batch."""
+        pass
@@ -1,3 +1,4 @@
+from typing import List, Optional, Tuple
 from ..application.repositories.service_repository import ServiceRepository
 from ..domain.service_entity import Service
 from ..domain.exceptions import ServiceValidationError, ServiceAlreadyExistsError
@@ -31,6 +32,16 @@ class CreateServiceInteractor(CreateServiceInputPort):
         """Get the track_operation decorator."""
         return self.metrics.track_operation("create_service")
 
+    @staticmethod
+    def _validate(name: str, description: str) -> None:
+        """Validate service input, raising ServiceValidationError on failure."""
+        if not name:
+            raise ServiceValidationError("Service name cannot be empty")
+        if len(name) > 100:
+            raise ServiceValidationError("Service name too long")
+        if len(description) > 500:
+            raise ServiceValidationError("Service description too long")
+
     def create_service(self, name: str, description: str) -> Service:
         """Create a new service and present it through the output port."""
         with self.logging_context.operation_context(
@@ -38,12 +49,7 @@ class CreateServiceInteractor(CreateServiceInputPort):
         ):
             try:
                 # Basic validation
-                if not name:
-                    raise ServiceValidationError("Service name cannot be empty")
-                if len(name) > 100:
-                    raise ServiceValidationError("Service name too long")
-                if len(description) > 500:
-                    raise ServiceValidationError("Service description too long")
+                self._validate(name, description)
 
                 # Create and save the service as a domain entity
                 service_entity = Service.create(name=name, description=description)
@@ -85,3 +91,53 @@ class CreateServiceInteractor(CreateServiceInputPort):
                 self.logger.error("Unexpected error creating service", error=str(e))
                 self.output_port.present_creation_error(f"Internal error: {str(e)}")
                 return Service.create("", "")  # Return empty service for error case
+
+    def create_services(
+        self, commands: List[Tuple[str, str]]
+    ) -> List[Optional[Service]]:
+        """Create a batch of services with a single repository write.
+
+        Invalid commands are rejected individually; the valid remainder is
+        saved together. Results and errors are presented aligned with the
+        submitted commands.
+        """
+        with self.logging_context.operation_context(
+            "create_services", self.logger, count=len(commands)
+        ):
+            results: List[Optional[Service]] = [None] * len(commands)
+            errors: List[Optional[str]] = [None] * len(commands)
+            pending: List[Tuple[int, Service]] = []
+
+            for index, (name, description) in enumerate(commands):
+                try:
+                    self._validate(name, description)
+                except ServiceValidationError as e:
+                    errors[index] = str(e)
+                    continue
+                pending.append(
+                    (index, Service.create(name=name, description=description))
+                )
+
+            if pending:
+                try:
+                    self.repository.save_many([service for _, service in pending])
+                    for index, service in pending:
+                        results[index] = service
+                    self.logger.info("Saved services", count=len(pending))
+                except ServiceAlreadyExistsError as e:
+                    self.logger.error("Service already exists", error=str(e))
+                    for index, _ in pending:
+                        errors[index] = str(e)
+                except Exception as e:
+                    self.logger.error("Unexpected error creating services", error=str(e))
+                    for index, _ in pending:
+                        errors[index] = f"Internal error: {str(e)}"
+
+            if len(pending) < len(commands):
+                self.logger.warning(
+                    "Service validation failed for batch items",
+                    rejected=len(commands) - len(pending),
+                )
+
+            self.output_port.present_created_services(results, errors)
+            return results
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional
 from ..domain.service_entity import Service
 
 
@@ -10,6 +11,17 @@ class CreateServiceOutputPort(ABC):
         """Present the created service."""
         pass
 
+    @abstractmethod
+    def present_created_services(
+        self, services: List[Optional[Service]], errors: List[Optional[str]]
+    ) -> None:
+        """Present a batch creation result.
+
+        Both lists are aligned with the submitted commands: each position holds
+        either the created service or the error that prevented its creation.
+        """
+        pass
+
     @abstractmethod
     def present_creation_error(self, message: str) -> None:
         """Present an error that occurred during service creation."""
@@ -12,6 +12,11 @@ class GetServiceInputPort(ABC):
         """Get service by ID."""
         pass
 
+    @abstractmethod
+    def get_services(self, service_ids: List[UUID]) -> List[Service]:
+        """Get the services matching the given IDs."""
+        pass
+
     @abstractmethod
     def get_all_services(self) -> List[Service]:
         """Get all services."""
@@ -57,6 +57,35 @@ class GetServiceInteractor(GetServiceInputPort):
                 self.output_port.present_error(f"Internal error: {str(e)}")
                 return None
 
+    def get_services(self, service_ids: List[UUID]) -> List[Service]:
+        """Get services by ID in one repository call and present them.
+
+        Duplicate IDs are collapsed and IDs without a matching service are
+        presented as not found rather than failing the whole call.
+        """
+        with self.logging_context.operation_context(
+            "get_services", self.logger, requested=len(service_ids)
+        ):
+            try:
+                unique_ids = list(dict.fromkeys(service_ids))
+                found = self.repository.get_many(unique_ids)
+                services = [found[sid] for sid in unique_ids if sid in found]
+                not_found = [sid for sid in unique_ids if sid not in found]
+                self.logger.debug(
+                    "Retrieved services by ID",
+                    count=len(services),
+                    not_found=len(not_found),
+                )
+
+                # Present through the output port
+                self.output_port.present_service_batch(services, not_found)
+                return services
+
+            except Exception as e:
+                self.logger.error("Error getting services by ID", error=str(e))
+                self.output_port.present_error(f"Internal error: {str(e)}")
+                return []
+
     def get_all_services(self) -> List[Service]:
         """Get all services and present them through the output port."""
         with self.logging_context.operation_context("get_all_services", self.logger):
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
+from uuid import UUID
 from ..domain.service_entity import Service
 
 
@@ -16,6 +17,13 @@ class GetServiceOutputPort(ABC):
         """Present multiple services."""
         pass
 
+    @abstractmethod
+    def present_service_batch(
+        self, services: List[Service], not_found: List[UUID]
+    ) -> None:
+        """Present the result of a multi-get, including IDs that were not found."""
+        pass
+
     @abstractmethod
     def present_error(self, message: str) -> None:
         """Present an error message."""
@@ -0,0 +1,45 @@
+"""Catalog of the metrics use cases record through the metrics port.
+
+Every metric is declared here once, with its kind, labels and buckets;
+the metrics adapter creates the matching Prometheus metrics from it. Use
+cases add a metric by adding its definition here.
+"""
+
+from typing import Dict
+
+from ..domain.ports.metrics_port import MetricDefinition
+
+# Repository operations take microseconds, far below the 5ms of
+# Prometheus' default first bucket
+OPERATION_LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+METRIC_CATALOG: Dict[str, MetricDefinition] = {
+    definition.name: definition
+    for definition in (
+        MetricDefinition(
+            "operation_count",
+            "counter",
+            "Total number of service operations",
+            labels=("operation", "status"),
+            export_name="service_operations_total",
+        ),
+        MetricDefinition(
+            "operation_duration_seconds",
+            "histogram",
+            "Duration of service operations in seconds",
+            labels=("operation",),
+            buckets=OPERATION_LATENCY_BUCKETS,
+            export_name="service_operation_duration_seconds",
+        ),
+        # Each worker counts the services in its own in-memory repository
+        MetricDefinition(
+            "services_count",
+            "gauge",
+            "Total number of services in the system",
+            export_name="services_total",
+        ),
+    )
+}
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from uuid import UUID
 
 from ...domain.service_entity import Service
@@ -13,11 +13,28 @@ class ServiceRepository(ABC):
         """Save a service to the repository."""
         pass
 
+    @abstractmethod
+    def save_many(self, services: List[Service]) -> List[Service]:
+        """Save several services to the repository in one operation.
+
+        Either all services are saved or, if any of them already exists,
+        none are.
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, service_id: UUID) -> Optional[Service]:
         """Retrieve a service by its ID."""
         pass
 
+    @abstractmethod
+    def get_many(self, service_ids: Iterable[UUID]) -> Dict[UUID, Service]:
+        """Retrieve the services matching the given IDs, keyed by ID.
+
+        IDs without a matching service are left out of the result.
+        """
+        pass
+
     @abstractmethod
     def get_all(self) -> List[Service]:
         """Retrieve all services."""
@@ -1,9 +1,56 @@
+import atexit
+import logging
 import logging.config
 import sys
+from typing import Optional
 
+from ..infrastructure.json_log_formatter import FastJsonFormatter, set_caller_lookup
+from ..infrastructure.log_pipeline import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_QUEUE_SIZE,
+    DROP,
+    LogPipeline,
+)
+from ..infrastructure.log_ring_buffer import (
+    DEFAULT_CAPACITY,
+    LogRingBuffer,
+    get_log_ring_buffer,
+    set_log_ring_buffer,
+)
+
+JSON_FORMAT = "%(asctime)s %(name)s %(levelname)s %(message)s %(pathname)s %(lineno)s"
+
+_pipeline: Optional[LogPipeline] = None
+
+
+def configure_logging(
+    debug: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    queue_policy: str = DROP,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    caller_info: bool = True,
+    ring_size: int = DEFAULT_CAPACITY,
+    ring_level: str = "INFO",
+) -> LogPipeline:
+    """Configure application-wide logging.
+
+    Root logger handlers are moved behind a bounded queue drained by a
+    background thread, so logging calls only enqueue the record. Without
+    ``caller_info`` records skip the stack walk and the JSON log omits
+    ``pathname`` and ``lineno``.
+
+    The last ``ring_size`` records at ``ring_level`` and above are also kept
+    in memory for ``/debug/logs``, so the root logger passes records at that
+    level even though only INFO and above are written to ``app.log``.
+    """
+    global _pipeline
+    shutdown_logging()
+    set_caller_lookup(caller_info)
+    handler_level = logging.DEBUG if debug else logging.INFO
+    root_level = handler_level
+    if ring_size:
+        root_level = min(root_level, logging.getLevelName(ring_level))
 
-def configure_logging(debug: bool = False) -> None:
-    """Configure application-wide logging."""
     config = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -13,19 +60,20 @@ def configure_logging(debug: bool = False) -> None:
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             },
             "json": {
-                "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
-                "format": "%(asctime)s %(name)s %(levelname)s %(message)s %(pathname)s %(lineno)s",
+                "()": "src.infrastructure.json_log_formatter.FastJsonFormatter",
+                "fmt": JSON_FORMAT,
+                "include_caller": caller_info,
             },
         },
         "handlers": {
             "console": {
-                "class": "logging.StreamHandler",
+                "class": "src.infrastructure.log_pipeline.BatchStreamHandler",
                 "stream": sys.stdout,
                 "formatter": "default",
-                "level": "DEBUG" if debug else "INFO",
+                "level": handler_level,
             },
             "file": {
-                "class": "logging.handlers.RotatingFileHandler",
+                "class": "src.infrastructure.log_pipeline.BatchRotatingFileHandler",
                 "filename": "app.log",
                 "maxBytes": 1024 * 1024,  # 1MB
                 "backupCount": 3,
@@ -36,7 +84,7 @@ def configure_logging(debug: bool = False) -> None:
         "loggers": {
             "": {  # Root logger
                 "handlers": ["console", "file"],
-                "level": "DEBUG" if debug else "INFO",
+                "level": root_level,
             },
             "uvicorn": {
                 "handlers": ["console"],
@@ -47,3 +95,33 @@ def configure_logging(debug: bool = False) -> None:
     }
 
     logging.config.dictConfig(config)
+
+    root_logger = logging.getLogger()
+    _pipeline = LogPipeline(queue_size, queue_policy, batch_size)
+    _pipeline.install(root_logger)
+    _pipeline.start()
+
+    # Added after install so it stays on the logger rather than behind the queue
+    if ring_size:
+        ring_buffer = LogRingBuffer(ring_size, logging.getLevelName(ring_level))
+        ring_buffer.setFormatter(
+            FastJsonFormatter(JSON_FORMAT, include_caller=caller_info)
+        )
+        root_logger.addHandler(ring_buffer)
+        set_log_ring_buffer(ring_buffer)
+    return _pipeline
+
+
+def shutdown_logging() -> None:
+    """Write out queued log records and stop the background writer."""
+    global _pipeline
+    if _pipeline is not None:
+        _pipeline.stop()
+        _pipeline = None
+    ring_buffer = get_log_ring_buffer()
+    if ring_buffer is not None:
+        logging.getLogger().removeHandler(ring_buffer)
+        set_log_ring_buffer(None)
+
+
+atexit.register(shutdown_logging)
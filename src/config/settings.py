@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Literal, Optional
 import yaml
 from pydantic import ConfigDict, BaseModel
 
@@ -30,6 +30,73 @@ class Settings(BaseModel):
     cors_allow_credentials: bool = True
     cors_allow_methods: List[str] = ["*"]
     cors_allow_headers: List[str] = ["*"]
+
+    # API documentation settings
+    docs_enabled: bool = True  # Serve /docs and /redoc; disable on production workers
+    openapi_cache_path: Optional[str] = None  # Precomputed schema, None for default
+
+    # Warmup settings
+    warmup_enabled: bool = True  # Prime hot paths before reporting ready
+    warmup_iterations: int = 3
+    warmup_timeout_seconds: float = 10.0
+
+    # Logging settings
+    log_queue_size: int = 10000  # Records buffered for the background writer
+    log_queue_policy: Literal["drop", "block"] = "drop"  # When the queue is full
+    log_batch_size: int = 256
+    log_caller_info: bool = True  # pathname/lineno in JSON logs; costs a stack walk
+    log_ring_size: int = 10000  # Recent records kept in memory for /debug/logs, 0 = off
+    log_ring_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+    operation_log_sample_rate: float = 1.0  # Fraction of successful operations logged
+    operation_log_sample_rates: Dict[str, float] = {}  # Overrides per operation name
+    slow_operation_threshold_ms: Optional[float] = None  # Always log slower operations
+    operation_log_rate_limit: float = 0.0  # Logged operations/second per name, 0 = off
+
+    # Tracing settings
+    trace_sample_rate: float = 0.01  # Fraction of unremarkable traces kept
+    trace_latency_threshold_ms: Optional[float] = 500.0  # Always keep slower traces
+    trace_store_size: int = 100  # Kept traces per decision for /debug/traces, 0 = off
+    trace_max_spans: int = 256  # Spans buffered per trace; further ones are counted
+    trace_export_path: Optional[str] = None  # OTLP/JSON lines file, None to disable
+    trace_export_batch_size: int = 64
+    trace_export_interval_seconds: float = 5.0
+
+    # Metrics settings
+    metrics_thread_accumulation: bool = False  # Per-thread counters, flushed in bulk
+    metrics_flush_interval_seconds: float = 1.0  # Also flushed before every scrape
+    metrics_cache_seconds: float = 1.0  # Scrapes within this window share a render
+    metric_buckets: Dict[str, List[float]] = {}  # Histogram buckets by metric name
+    latency_percentiles: List[float] = [50.0, 90.0, 99.0, 99.9]  # For /debug/latency
+    latency_snapshot_interval_seconds: float = 10.0  # Sharing between workers
+
+    # Runtime monitoring settings
+    runtime_monitor_enabled: bool = True  # Loop lag, slow callbacks and GC pauses
+    loop_lag_interval_seconds: float = 0.5
+    slow_callback_threshold_ms: float = 100.0  # Loop blocked this long: take stack
+    slow_callback_history: int = 20  # Slow callbacks kept for /health/detailed
+
+    # System metrics settings
+    system_metrics_interval_seconds: float = 5.0  # Background psutil sampling, 0 = off
+    system_metrics_history: int = 120  # Samples kept for /debug/system
+    system_metrics_disk_path: str = "/"
+
+    # Request resource accounting settings
+    request_cpu_accounting: bool = False  # Thread CPU time per request and route
+    request_alloc_sample_rate: float = 0.0  # Fraction of requests run with tracemalloc
+    slow_request_threshold_ms: Optional[float] = 1000.0  # Logged as WARNING
+
+    # Debug endpoint settings
+    debug_endpoints_enabled: bool = False  # Serve unauthenticated /debug/*
+    profile_sample_interval_ms: float = 10.0  # POST /debug/profile sampling interval
+    profile_max_seconds: float = 300.0
+    profile_max_stacks: int = 10000  # Distinct stacks kept; others counted as one
+
+    # Dependency injection settings
+    request_scope_pool_size: int = 64
+
+    # Bulk ingest settings
+    ingest_max_in_flight: int = 1000
+    ingest_max_batch_size: int = 100
     
     @classmethod
     def from_yaml(cls, config_path: Path) -> "Settings":
@@ -1,10 +1,38 @@
 """Metrics port defining the interface for metrics functionality."""
 from abc import ABC, abstractmethod
-from typing import Callable
+from dataclasses import dataclass
+from typing import Callable, Literal, Optional, Tuple
+
+MetricKind = Literal["counter", "gauge", "histogram"]
+
+
+@dataclass(frozen=True)
+class MetricDefinition:
+    """A metric that can be recorded through the port, by its port name."""
+
+    name: str
+    kind: MetricKind
+    description: str
+    labels: Tuple[str, ...] = ()
+    buckets: Optional[Tuple[float, ...]] = None  # Histograms only
+    export_name: Optional[str] = None  # Name in the monitoring system, if not name
+    # Gauges only: how the values of several worker processes are combined
+    aggregation: Literal["sum", "max", "min"] = "sum"
+
+
+class UnknownMetricError(LookupError):
+    """Raised when recording a metric that is not in the catalog."""
+
+    pass
 
 
 class MetricsPort(ABC):
-    """Abstract interface for metrics functionality."""
+    """Abstract interface for metrics functionality.
+
+    Metric names refer to entries of the catalog in
+    ``application/metrics_catalog.py``; recording a name that is not
+    declared there, or as another kind, raises ``UnknownMetricError``.
+    """
 
     @abstractmethod
     def increment_counter(self, name: str, value: float = 1, **labels) -> None:
@@ -1,36 +1,54 @@
 """Adapter that implements the logger port interface using the actual logging implementation."""
 
+from typing import Any, Dict, Optional
+
 from ...domain.ports.logger_port import (
     LoggerPort,
     ContextManagerPort,
     LoggingContextPort,
 )
+from ..logging_context import Extra
 from ..logging_context import get_contextual_logger as actual_get_logger
 from ..logging_context import operation_context as actual_operation_context
 
 
 class LoggerAdapter(LoggerPort):
-    """Adapter for the logging functionality."""
+    """Adapter for the logging functionality.
+
+    Keyword arguments become the record's extra fields. They are passed on
+    unmerged, so nothing is built for disabled levels; a callable ``extra``
+    is passed on as is and only called when the record is emitted. Records
+    are attributed to the adapter's caller.
+    """
 
     def __init__(self, module_name: str):
         """Initialize with the module name."""
         self._logger = actual_get_logger(module_name)
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, extra: Optional[Extra] = None, **kwargs) -> None:
         """Log an info message."""
-        self._logger.info(message, extra=kwargs)
+        self._logger.info(message, extra=_extra(extra, kwargs), stacklevel=2)
 
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, extra: Optional[Extra] = None, **kwargs) -> None:
         """Log a debug message."""
-        self._logger.debug(message, extra=kwargs)
+        self._logger.debug(message, extra=_extra(extra, kwargs), stacklevel=2)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, extra: Optional[Extra] = None, **kwargs) -> None:
         """Log a warning message."""
-        self._logger.warning(message, extra=kwargs)
+        self._logger.warning(message, extra=_extra(extra, kwargs), stacklevel=2)
 
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, extra: Optional[Extra] = None, **kwargs) -> None:
         """Log an error message."""
-        self._logger.error(message, extra=kwargs)
+        self._logger.error(message, extra=_extra(extra, kwargs), stacklevel=2)
+
+
+def _extra(extra: Optional[Extra], fields: Dict[str, Any]) -> Optional[Extra]:
+    """Combine keyword fields with an explicit extra without evaluating it."""
+    if extra is None:
+        return fields
+    if not fields:
+        return extra
+    return lambda: {**fields, **(extra() if callable(extra) else extra)}
 
 
 class ContextManagerAdapter(ContextManagerPort):
@@ -1,42 +1,89 @@
 """Adapter that implements the metrics port interface using the actual metrics implementation."""
 
-from typing import Callable
-from functools import wraps
-from ...domain.ports.metrics_port import MetricsPort
-from ..metrics import (
-    SERVICE_OPERATION_LATENCY,
-    SERVICE_OPERATIONS,
-    SERVICES_COUNT,
-)
+from typing import Any, Callable, Dict, Tuple
+from ...domain.ports.metrics_port import MetricsPort, UnknownMetricError
+from ...application.metrics_catalog import METRIC_CATALOG
+from ..metrics import CATALOG_METRICS
 from ..metrics_decorator import track_operation as actual_track_operation
+from ..warmup_context import warmup_request
+
+
+class _CatalogMetric:
+    """A catalog metric with its labelled children, created on first use."""
+
+    __slots__ = ("metric", "labelled", "children")
+
+    def __init__(self, metric: Any, labelled: bool):
+        self.metric = metric
+        self.labelled = labelled
+        self.children: Dict[Tuple[Tuple[str, Any], ...], Any] = {}
+
+    def child(self, labels: Dict[str, Any]) -> Any:
+        """The child for these labels; label names are part of the key."""
+        if not self.labelled and not labels:
+            return self.metric
+        key = tuple(labels.items())
+        child = self.children.get(key)
+        if child is None:
+            # Raises ValueError if the label names do not match the catalog
+            child = self.children[key] = self.metric.labels(**labels)
+        return child
 
 
 class MetricsAdapter(MetricsPort):
-    """Adapter for metrics functionality."""
+    """Adapter for metrics functionality, backed by the metric catalog.
+
+    Names and labels are still validated during warmup, but nothing is
+    recorded.
+    """
+
+    def __init__(self):
+        """Index the catalog metrics by kind for one-lookup dispatch."""
+        self._metrics: Dict[str, Dict[str, _CatalogMetric]] = {
+            "counter": {},
+            "gauge": {},
+            "histogram": {},
+        }
+        for name, definition in METRIC_CATALOG.items():
+            self._metrics[definition.kind][name] = _CatalogMetric(
+                CATALOG_METRICS[name], bool(definition.labels)
+            )
+
+    def _lookup(self, kind: str, name: str) -> _CatalogMetric:
+        try:
+            return self._metrics[kind][name]
+        except KeyError:
+            raise UnknownMetricError(
+                f"No {kind} named {name!r} in the metric catalog"
+            ) from None
 
     def increment_counter(self, name: str, value: float = 1, **labels) -> None:
         """Increment a counter metric."""
-        if name == "operation_count":
-            SERVICE_OPERATIONS.labels(**labels).inc(value)
-        # Add other counters as needed
+        metric = self._lookup("counter", name).child(labels)
+        if not warmup_request.get():
+            metric.inc(value)
 
     def set_gauge(self, name: str, value: float, **labels) -> None:
         """Set a gauge metric."""
-        if name == "services_count":
-            SERVICES_COUNT.set(value)
-        # Add other gauges as needed
+        metric = self._lookup("gauge", name).child(labels)
+        if not warmup_request.get():
+            metric.set(value)
 
     def observe_histogram(self, name: str, value: float, **labels) -> None:
         """Observe a value for a histogram metric."""
-        if name == "operation_duration_seconds":
-            SERVICE_OPERATION_LATENCY.labels(**labels).observe(value)
-        # Add other histograms as needed
+        metric = self._lookup("histogram", name).child(labels)
+        if not warmup_request.get():
+            metric.observe(value)
 
     def track_operation(self, operation_name: str) -> Callable[[Callable], Callable]:
         """Create decorator to track operation metrics."""
         return actual_track_operation(operation_name)
 
 
+# Shared so that labelled children are created once per process
+_metrics_adapter = MetricsAdapter()
+
+
 def get_metrics() -> MetricsPort:
     """Get a metrics adapter."""
-    return MetricsAdapter()
+    return _metrics_adapter
@@ -4,30 +4,63 @@ import sys
 import signal
 from pathlib import Path
 from src.config.settings import Settings
-from src.config.logging_config import configure_logging
+from src.config.logging_config import configure_logging, shutdown_logging
 from src.infrastructure.server import AppServer
 from src.infrastructure.container import Container
-from src.infrastructure.logging_context import get_contextual_logger
+from src.infrastructure.multiprocess_metrics import clear_multiprocess_dir
+from src.infrastructure.logging_context import (
+    OperationSamplingConfig,
+    configure_operation_sampling,
+    get_contextual_logger,
+)
 
 logger = None  # Will be configured by configure_logging
 
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "service_config.yaml"
+
+
+def load_settings(config_path: Path = CONFIG_PATH) -> Settings:
+    """Load settings from YAML and environment variables."""
+    return Settings.from_yaml(config_path)
+
 
 def bootstrap_application():
     """Bootstrap the application with proper separation of concerns."""
     try:
         # Load settings from YAML and environment variables
-        config_path = Path(__file__).parent.parent / "config" / "service_config.yaml"
-        settings = Settings.from_yaml(config_path)
+        config_path = CONFIG_PATH
+        settings = load_settings(config_path)
 
         # Configure logging first
-        configure_logging(debug=settings.debug)
+        configure_logging(
+            debug=settings.debug,
+            queue_size=settings.log_queue_size,
+            queue_policy=settings.log_queue_policy,
+            batch_size=settings.log_batch_size,
+            caller_info=settings.log_caller_info,
+            ring_size=settings.log_ring_size,
+            ring_level=settings.log_ring_level,
+        )
+        configure_operation_sampling(
+            OperationSamplingConfig(
+                sample_rate=settings.operation_log_sample_rate,
+                sample_rates=settings.operation_log_sample_rates,
+                slow_threshold_ms=settings.slow_operation_threshold_ms,
+                rate_limit_per_second=settings.operation_log_rate_limit,
+            )
+        )
 
         # Get logger after configuration
         global logger
         logger = get_contextual_logger(__name__)
 
-        logger.info(f"Loading configuration from {config_path}")
-        logger.info(f"Starting {settings.app_name} version {settings.app_version}")
+        logger.info("Loading configuration from %s", config_path)
+        logger.info(
+            "Starting %s version %s", settings.app_name, settings.app_version
+        )
+
+        # Start from empty metric files; workers have not been started yet
+        clear_multiprocess_dir()
 
         # Wire up dependency injection
         container = Container()
@@ -49,10 +82,11 @@ def bootstrap_application():
     except Exception as e:
         # If logger isn't configured yet, print to stderr
         if logger:
-            logger.error(f"Failed to start application: {str(e)}", exc_info=True)
+            logger.error("Failed to start application: %s", e, exc_info=True)
         else:
             print(f"Failed to start application: {str(e)}", file=sys.stderr)
         sys.exit(1)
     finally:
         if logger:
             logger.info("Application shutdown complete")
+        shutdown_logging()
@@ -1,7 +1,8 @@
 """Dependency injection container for clean architecture implementation."""
 
-from typing import Optional
-from contextlib import AsyncExitStack
+from collections import deque
+from typing import Deque, Iterator, Optional
+from contextlib import AsyncExitStack, contextmanager
 
 # Domain and application interfaces
 from ..application.repositories.service_repository import ServiceRepository
@@ -25,6 +26,40 @@ from ..config.settings import Settings
 logger = get_contextual_logger(__name__)
 
 
+class RequestScope:
+    """Request-scoped dependencies bound to a single in-flight request.
+
+    Each scope owns its own presenter and the interactors wired to it, so
+    concurrent requests never share output port state. Scopes are pooled by
+    the container and reset on release, which keeps per-request wiring cost
+    down to a pool pop and push.
+    """
+
+    __slots__ = ("presenter", "get_service_interactor", "create_service_interactor")
+
+    def __init__(self, container: "Container"):
+        """Wire request-bound instances from the container's shared singletons."""
+        self.presenter = container.get_service_presenter()
+        self.get_service_interactor = GetServiceInteractor(
+            repository=container.get_repository(),
+            output_port=self.presenter,
+            logger=container.get_logger("app.get_service"),
+            logging_context=container.get_logging_context(),
+            metrics=container.get_metrics(),
+        )
+        self.create_service_interactor = CreateServiceInteractor(
+            repository=container.get_repository(),
+            output_port=self.presenter,
+            logger=container.get_logger("app.create_service"),
+            logging_context=container.get_logging_context(),
+            metrics=container.get_metrics(),
+        )
+
+    def reset(self) -> None:
+        """Drop any request state so the scope can be reused."""
+        self.presenter.reset()
+
+
 class Container:
     """Dependency Injection Container with lifecycle management."""
 
@@ -40,6 +75,7 @@ class Container:
             cls._instance._logger = None
             cls._instance._logging_context = None
             cls._instance._metrics = None
+            cls._instance._scope_pool = deque()
             logger.debug("Created new Container instance")
         return cls._instance
 
@@ -63,6 +99,7 @@ class Container:
             logger.info("Cleaning up container resources")
             await self._exit_stack.aclose()
             self._exit_stack = None
+            self._scope_pool.clear()
 
     @classmethod
     def reset(cls):
@@ -127,3 +164,33 @@ class Container:
             logging_context=self.get_logging_context(),
             metrics=self.get_metrics(),
         )
+
+    # Request-scoped Dependencies
+
+    def acquire_scope(self) -> RequestScope:
+        """Get an idle request scope from the pool, creating one if needed."""
+        try:
+            return self._scope_pool.pop()
+        except IndexError:
+            return RequestScope(self)
+
+    def release_scope(self, scope: RequestScope) -> None:
+        """Reset a request scope and return it to the pool."""
+        scope.reset()
+        pool: Deque[RequestScope] = self._scope_pool
+        max_size = (
+            self._settings.request_scope_pool_size
+            if self._settings
+            else Settings.model_fields["request_scope_pool_size"].default
+        )
+        if len(pool) < max_size:
+            pool.append(scope)
+
+    @contextmanager
+    def request_scope(self) -> Iterator[RequestScope]:
+        """Provide a request scope for the duration of a single request."""
+        scope = self.acquire_scope()
+        try:
+            yield scope
+        finally:
+            self.release_scope(scope)
@@ -0,0 +1,36 @@
+"""Accept-Encoding negotiation for responses served precompressed."""
+
+from functools import lru_cache
+
+# Coding names accepted as gzip, including the legacy x- prefixed form
+GZIP_CODINGS = frozenset({"gzip", "x-gzip"})
+
+
+@lru_cache(maxsize=128)
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Decide from an Accept-Encoding header whether to respond with gzip.
+
+    An explicit gzip entry decides by its quality, so ``gzip;q=0`` refuses
+    it; otherwise a ``*`` entry does. Without either, the response is left
+    uncompressed.
+    """
+    gzip_q = None
+    wildcard_q = None
+    for coding in accept_encoding.split(","):
+        name, *params = coding.split(";")
+        name = name.strip().lower()
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name in GZIP_CODINGS:
+            gzip_q = q if gzip_q is None else max(gzip_q, q)
+        elif name == "*":
+            wildcard_q = q if wildcard_q is None else max(wildcard_q, q)
+    if gzip_q is not None:
+        return gzip_q > 0
+    return wildcard_q is not None and wildcard_q > 0
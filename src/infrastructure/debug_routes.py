@@ -0,0 +1,156 @@
+"""Diagnostic endpoints under ``/debug`` for inspecting a running worker.
+
+They expose internal state (recent traces, log records, latency
+percentiles and system samples) or profile the worker, and are left out of the OpenAPI
+schema. They are off by default; enable them with
+``debug_endpoints_enabled: true`` on development workers only.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from starlette.concurrency import run_in_threadpool
+
+from src.config.settings import Settings
+from .flamegraph import render_flamegraph
+from .latency_histogram import latency_report
+from .log_ring_buffer import get_log_ring_buffer
+from .metrics import LATENCY_FAMILIES
+from .multiprocess_metrics import collect_latency
+from .sampling_profiler import ProfilerBusyError, run_profile
+from .system_metrics import get_system_metrics_sampler, sample_to_dict
+from .tracing import (
+    DECISION_BASELINE,
+    DECISION_ERROR,
+    DECISION_SLOW,
+    get_trace_store,
+    trace_to_dict,
+)
+
+DEBUG_PREFIX = "/debug"
+
+_DECISION_PATTERN = f"^({DECISION_ERROR}|{DECISION_SLOW}|{DECISION_BASELINE})$"
+_LEVEL_PATTERN = "^(?i:DEBUG|INFO|WARNING|ERROR|CRITICAL)$"
+
+
+async def list_traces(
+    decision: Optional[str] = Query(None, pattern=_DECISION_PATTERN),
+    min_duration_ms: Optional[float] = Query(None, ge=0),
+    limit: int = Query(20, ge=1, le=1000),
+) -> Dict[str, Any]:
+    """List kept traces, newest first, without their spans."""
+    store = get_trace_store()
+    if store is None:
+        raise HTTPException(status_code=404, detail="Trace store is disabled")
+    traces = store.query(decision, min_duration_ms, limit)
+    return {
+        "traces": [trace_to_dict(trace, include_spans=False) for trace in traces],
+        "stored": len(store),
+    }
+
+
+async def get_trace(trace_id: str) -> Dict[str, Any]:
+    """Return one kept trace with all of its spans."""
+    store = get_trace_store()
+    trace = store.get(trace_id) if store is not None else None
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Trace {trace_id} not found")
+    return trace_to_dict(trace)
+
+
+async def list_logs(
+    request_id: Optional[str] = None,
+    operation: Optional[str] = None,
+    level: str = Query("DEBUG", pattern=_LEVEL_PATTERN),
+    limit: int = Query(100, ge=1, le=10000),
+) -> Response:
+    """Return recent log records at ``level`` and above, oldest first.
+
+    ``operation`` matches an operation name or operation ID.
+    """
+    ring_buffer = get_log_ring_buffer()
+    if ring_buffer is None:
+        raise HTTPException(status_code=404, detail="Log ring buffer is disabled")
+    records = ring_buffer.query(
+        request_id, operation, logging.getLevelName(level.upper()), limit
+    )
+    return Response(ring_buffer.render(records), media_type="application/json")
+
+
+# Plain def so that it runs in the threadpool: it may read every worker's
+# snapshot file and walks all series' buckets
+def latency_percentiles(
+    request: Request, metric: Optional[str] = None
+) -> Dict[str, Any]:
+    """Latency percentiles per series, in milliseconds, busiest series first."""
+    names = {family.name: family.labelnames for family in LATENCY_FAMILIES}
+    if metric is not None and metric not in names:
+        raise HTTPException(status_code=404, detail=f"Unknown metric {metric}")
+    percentiles = request.app.state.settings.latency_percentiles
+    return {
+        "percentiles": percentiles,
+        "metrics": latency_report(collect_latency(), names, percentiles, metric),
+    }
+
+
+async def profile(
+    request: Request,
+    seconds: float = Query(30.0, gt=0),
+    format: str = Query("collapsed", pattern="^(collapsed|svg)$"),
+) -> Response:
+    """Sample all threads' stacks for ``seconds`` and return the profile.
+
+    ``collapsed`` returns one ``frame;frame;... count`` line per stack, the
+    input of flame graph tools; ``svg`` returns a flame graph.
+    """
+    settings = request.app.state.settings
+    if seconds > settings.profile_max_seconds:
+        raise HTTPException(
+            status_code=422,
+            detail=f"seconds must be at most {settings.profile_max_seconds}",
+        )
+    try:
+        # Samples from a threadpool thread, leaving the event loop free
+        profiler = await run_in_threadpool(
+            run_profile,
+            seconds,
+            settings.profile_sample_interval_ms / 1000,
+            settings.profile_max_stacks,
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    headers = {"X-Profile-Samples": str(profiler.samples)}
+    if format == "svg":
+        svg = render_flamegraph(profiler.counts, f"{seconds:g}s profile")
+        return Response(svg, media_type="image/svg+xml", headers=headers)
+    return Response(profiler.collapsed(), media_type="text/plain", headers=headers)
+
+
+async def system_samples() -> Dict[str, Any]:
+    """Recent background samples of host resource usage, oldest first."""
+    sampler = get_system_metrics_sampler()
+    if sampler is None:
+        raise HTTPException(status_code=404, detail="System sampling is disabled")
+    return {
+        "interval_seconds": sampler.interval,
+        "samples": [sample_to_dict(sample) for sample in sampler.samples()],
+    }
+
+
+def setup_debug_routes(app: FastAPI, settings: Settings) -> None:
+    """Register the debug endpoints if enabled."""
+    if not settings.debug_endpoints_enabled:
+        return
+    app.add_api_route(f"{DEBUG_PREFIX}/traces", list_traces, include_in_schema=False)
+    app.add_api_route(
+        f"{DEBUG_PREFIX}/traces/{{trace_id}}", get_trace, include_in_schema=False
+    )
+    app.add_api_route(f"{DEBUG_PREFIX}/logs", list_logs, include_in_schema=False)
+    app.add_api_route(
+        f"{DEBUG_PREFIX}/latency", latency_percentiles, include_in_schema=False
+    )
+    app.add_api_route(
+        f"{DEBUG_PREFIX}/profile", profile, methods=["POST"], include_in_schema=False
+    )
+    app.add_api_route(f"{DEBUG_PREFIX}/system", system_samples, include_in_schema=False)
@@ -0,0 +1,92 @@
+"""Self-contained SVG flame graphs from folded stack counts.
+
+Each frame is a box as wide as the share of samples its stack prefix
+appears in, stacked from the outermost frame at the bottom. Hovering a
+box shows its name and sample count. The output needs no scripts or
+external resources, so it can be opened directly in a browser.
+"""
+
+import zlib
+from html import escape
+from typing import Dict, List, Mapping
+
+_WIDTH = 1200
+_FRAME_HEIGHT = 16
+_MARGIN = 10
+_TITLE_HEIGHT = 24
+_CHAR_WIDTH = 7
+# Boxes narrower than this are left out
+_MIN_WIDTH = 0.3
+
+
+class _Node:
+    __slots__ = ("name", "count", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.children: Dict[str, "_Node"] = {}
+
+    def depth(self) -> int:
+        return 1 + max((child.depth() for child in self.children.values()), default=0)
+
+
+def _color(name: str) -> str:
+    """A stable warm color per frame name."""
+    value = zlib.crc32(name.encode())
+    return f"rgb({205 + value % 50},{value // 50 % 180},{value // 9000 % 55})"
+
+
+def render_flamegraph(counts: Mapping[str, int], title: str = "Flame graph") -> str:
+    """Render folded stacks (``a;b;c`` to sample count) as an SVG document."""
+    root = _Node("all")
+    for stack, count in counts.items():
+        node = root
+        node.count += count
+        for name in stack.split(";"):
+            node = node.children.setdefault(name, _Node(name))
+            node.count += count
+
+    height = _TITLE_HEIGHT + root.depth() * _FRAME_HEIGHT + 2 * _MARGIN
+    scale = (_WIDTH - 2 * _MARGIN) / root.count if root.count else 0.0
+    boxes: List[str] = []
+
+    # Explicit stack; deep recursion would be needed otherwise
+    pending = [(root, float(_MARGIN), 0)]
+    while pending:
+        node, x, level = pending.pop()
+        width = node.count * scale
+        if width < _MIN_WIDTH:
+            continue
+        y = height - _MARGIN - (level + 1) * _FRAME_HEIGHT
+        share = 100 * node.count / root.count
+        label = escape(node.name)
+        box = (
+            f'<g><title>{label} ({node.count} samples, {share:.2f}%)</title>'
+            f'<rect x="{x:.1f}" y="{y}" width="{width:.1f}" '
+            f'height="{_FRAME_HEIGHT - 1}" fill="{_color(node.name)}" rx="2"/>'
+        )
+        chars = int(width / _CHAR_WIDTH) - 1
+        if chars >= 3:
+            text = node.name
+            if len(text) > chars:
+                text = text[: chars - 2] + ".."
+            text_y = y + _FRAME_HEIGHT - 4
+            box += f'<text x="{x + 3:.1f}" y="{text_y}">{escape(text)}</text>'
+        boxes.append(box + "</g>")
+        child_x = x
+        for name in sorted(node.children):
+            child = node.children[name]
+            pending.append((child, child_x, level + 1))
+            child_x += child.count * scale
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{_WIDTH}" height="{height}" '
+        f'viewBox="0 0 {_WIDTH} {height}" font-family="monospace" font-size="12">'
+        f'<rect width="100%" height="100%" fill="#f8f8f8"/>'
+        f'<text x="{_WIDTH // 2}" y="{_TITLE_HEIGHT - 6}" text-anchor="middle" '
+        f'font-size="16">{escape(title)} ({root.count} samples)</text>'
+        + "".join(boxes)
+        + "</svg>\n"
+    )
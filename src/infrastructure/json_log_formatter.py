@@ -0,0 +1,200 @@
+"""Fast structured JSON formatter for ``ContextualLogger`` records.
+
+Produces the same output as ``pythonjsonlogger``'s ``JsonFormatter`` for the
+same format string: the named fields, then ``exc_info``/``stack_info``, then
+every extra attribute of the record. It is faster because:
+
+- the format string is parsed once into a list of pre-encoded key prefixes;
+- str, int, float, bool, None, UUID and datetime values are encoded
+  directly, and only other types go through ``json.dumps``;
+- the timestamp is only rendered once per second, plus the milliseconds.
+"""
+
+import json
+import logging
+import re
+import time
+from datetime import date, datetime
+from datetime import time as dt_time
+from enum import Enum
+from json.encoder import encode_basestring_ascii
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+# Attributes LogRecord.__init__ sets, in order; extras are added after them
+_INIT_ATTRS = tuple(logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__)
+
+# Attributes that are never extra fields, including those set by formatters
+_RECORD_ATTRS = frozenset(_INIT_ATTRS) | {"message", "asctime", "taskName"}
+
+# Record fields that are always strings or ints, so need no type dispatch
+_STR_FIELDS = frozenset(
+    {"name", "levelname", "message", "pathname", "filename", "module", "funcName"}
+)
+_INT_FIELDS = frozenset({"levelno", "lineno", "process", "thread"})
+
+# Source file the logging module skips when looking for the caller
+_SRCFILE = logging._srcfile
+
+_FIELD_PATTERN = re.compile(r"%\((.+?)\)")
+
+# Record fields describing the call site, dropped when caller info is omitted
+CALLER_FIELDS = frozenset({"pathname", "filename", "module", "funcName", "lineno"})
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the non-JSON types ``pythonjsonlogger`` knows about the same way."""
+    if isinstance(value, (date, datetime, dt_time)):
+        return value.isoformat()
+    if isinstance(value, BaseException):
+        return f"{type(value).__name__}: {value}"
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, type):
+        return value.__name__
+    return str(value)
+
+
+def encode_value(value: Any) -> str:
+    """Encode a single value as JSON, fast-pathing the common types."""
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if value_type is int:
+        return int.__repr__(value)
+    if value is None:
+        return "null"
+    if value_type is bool:
+        return "true" if value else "false"
+    if value_type is UUID:
+        return f'"{value}"'
+    if value_type is datetime:
+        return f'"{value.isoformat()}"'
+    if value_type is float and value == value and value not in (
+        float("inf"),
+        float("-inf"),
+    ):
+        return float.__repr__(value)
+    return json.dumps(value, default=_json_default)
+
+
+def _encode_str(value: Any) -> str:
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+    return encode_value(value)
+
+
+def _encode_int(value: Any) -> str:
+    if type(value) is int:
+        return int.__repr__(value)
+    return encode_value(value)
+
+
+def _key_prefix(key: str) -> str:
+    return ", " + encode_basestring_ascii(key) + ": "
+
+
+def _field_encoder(field: str) -> Callable[[Any], str]:
+    """Pick the encoder for a format field from the type it normally holds."""
+    if field in _STR_FIELDS or field == "asctime":
+        return _encode_str
+    if field in _INT_FIELDS:
+        return _encode_int
+    return encode_value
+
+
+class FastJsonFormatter(logging.Formatter):
+    """JSON formatter with a precompiled field layout."""
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        style: str = "%",
+        validate: bool = True,
+        include_caller: bool = True,
+    ):
+        """Initialize from a ``%(field)s`` format string naming the fields to emit.
+
+        With ``include_caller=False`` the call-site fields (pathname, lineno,
+        ...) are left out even if the format string names them.
+        """
+        super().__init__(fmt, datefmt, style, validate)
+        fields = _FIELD_PATTERN.findall(fmt or "%(message)s")
+        if not include_caller:
+            fields = [f for f in fields if f not in CALLER_FIELDS]
+        self.fields = fields
+        self.include_caller = include_caller
+        # Key prefix and value encoder per field; the object is opened in format()
+        self._layout: List[Tuple[str, str, Callable[[Any], str]]] = [
+            (_key_prefix(f), f, _field_encoder(f)) for f in fields
+        ]
+        self._uses_asctime = "asctime" in fields
+        self._skip = _RECORD_ATTRS | set(fields)
+        self._extra_prefixes: Dict[str, str] = {}
+        self._time_cache: Tuple[int, str] = (-1, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        """Format the record time, rendering the seconds part once per second."""
+        second = int(record.created)
+        cached_second, cached = self._time_cache
+        if second != cached_second:
+            struct_time = self.converter(record.created)
+            cached = time.strftime(datefmt or self.default_time_format, struct_time)
+            self._time_cache = (second, cached)
+        if datefmt:
+            return cached
+        return self.default_msec_format % (cached, record.msecs)
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize a record to a single JSON object."""
+        record.message = record.getMessage()
+        if self._uses_asctime:
+            record.asctime = self.formatTime(record, self.datefmt)
+        values = record.__dict__
+        parts = [
+            prefix + encode(values.get(field)) for prefix, field, encode in self._layout
+        ]
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            parts.append(', "exc_info": ' + encode_basestring_ascii(record.exc_text))
+        if record.stack_info:
+            stack = self.formatStack(record.stack_info)
+            parts.append(', "stack_info": ' + encode_basestring_ascii(stack))
+
+        # Extras follow the attributes set by LogRecord.__init__
+        skip = self._skip
+        prefixes = self._extra_prefixes
+        for key, value in islice(values.items(), len(_INIT_ATTRS), None):
+            if key in skip:
+                continue
+            prefix = prefixes.get(key)
+            if prefix is None:
+                if key[0] == "_":
+                    continue
+                prefix = prefixes[key] = _key_prefix(key)
+            value_type = type(value)
+            if value_type is str:
+                parts.append(prefix + encode_basestring_ascii(value))
+            elif value_type is int:
+                parts.append(prefix + int.__repr__(value))
+            else:
+                parts.append(prefix + encode_value(value))
+
+        # Every part starts with ", "; the first one's is replaced by the brace
+        body = "".join(parts)
+        return "{" + body[2:] + "}" if body else "{}"
+
+
+def set_caller_lookup(enabled: bool) -> None:
+    """Turn the logging module's stack walk for caller info on or off.
+
+    Disabling it saves the ``findCaller`` cost on every record; pathname,
+    lineno and funcName then hold placeholder values.
+    """
+    logging._srcfile = _SRCFILE if enabled else None
@@ -0,0 +1,243 @@
+"""High-resolution latency histograms with accurate percentiles.
+
+Prometheus histograms only know their configured buckets, so percentiles
+computed from them are only as good as the bucket layout. These
+histograms use an HDR-style log-linear layout instead. Every power of two
+is split into ``2 ** (SUB_BUCKET_BITS - 1)`` linear sub-buckets, so any
+recorded value is known to within 1/64 (about 1.6%) from 1ns up to
+``MAX_VALUE_NS``. Counts live in one preallocated array per series
+(``BUCKET_COUNT`` 64-bit slots, 16KiB), and histograms with the same layout
+merge by adding their arrays, which is how worker processes are combined.
+"""
+
+import json
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SUB_BUCKET_BITS = 7
+_SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+_SUB_BUCKET_HALF = _SUB_BUCKET_COUNT >> 1
+
+# Values are clamped to about 137 seconds
+MAX_VALUE_NS = (1 << 37) - 1
+
+
+def bucket_index(value_ns: int) -> int:
+    """Index of the bucket holding a value."""
+    bits = value_ns.bit_length()
+    if bits <= SUB_BUCKET_BITS:
+        return value_ns
+    shift = bits - SUB_BUCKET_BITS
+    return shift * _SUB_BUCKET_HALF + (value_ns >> shift)
+
+
+BUCKET_COUNT = bucket_index(MAX_VALUE_NS) + 1
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """Lowest and highest value (in ns) held by a bucket."""
+    if index < _SUB_BUCKET_COUNT:
+        return index, index
+    shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+    sub_bucket = index - shift * _SUB_BUCKET_HALF
+    return sub_bucket << shift, ((sub_bucket + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations in nanoseconds."""
+
+    __slots__ = ("counts", "count", "sum_ns", "min_ns", "max_ns", "_lock")
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * BUCKET_COUNT))
+        self.count = 0
+        self.sum_ns = 0
+        self.min_ns = MAX_VALUE_NS
+        self.max_ns = 0
+        self._lock = threading.Lock()
+
+    def record(self, value_ns: int) -> None:
+        """Record one duration."""
+        if value_ns > MAX_VALUE_NS:
+            value_ns = MAX_VALUE_NS
+        elif value_ns < 0:
+            value_ns = 0
+        index = bucket_index(value_ns)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum_ns += value_ns
+            if value_ns < self.min_ns:
+                self.min_ns = value_ns
+            if value_ns > self.max_ns:
+                self.max_ns = value_ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the counts of another histogram to this one."""
+        with self._lock:
+            counts = self.counts
+            for index, count in enumerate(other.counts):
+                if count:
+                    counts[index] += count
+            self.count += other.count
+            self.sum_ns += other.sum_ns
+            self.min_ns = min(self.min_ns, other.min_ns)
+            self.max_ns = max(self.max_ns, other.max_ns)
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """Smallest value that ``percentile`` percent of recorded values do not exceed.
+
+        Exact to the bucket resolution; the top of the bucket is reported,
+        capped at the largest recorded value.
+        """
+        if self.count == 0:
+            return 0
+        target = max(1, -(-self.count * percentile // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(bucket_bounds(index)[1], self.max_ns)
+        return self.max_ns
+
+    def summary(self, percentiles: Iterable[float]) -> Dict[str, Any]:
+        """Count, extremes, mean and percentiles, in milliseconds."""
+        if self.count == 0:
+            return {"count": 0}
+        data: Dict[str, Any] = {
+            "count": self.count,
+            "min_ms": self.min_ns / 1e6,
+            "mean_ms": self.sum_ns / self.count / 1e6,
+            "max_ms": self.max_ns / 1e6,
+        }
+        for percentile in percentiles:
+            key = "p" + f"{percentile:g}".replace(".", "")
+            data[key] = self.value_at_percentile(percentile) / 1e6
+        return data
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Sparse representation, for exchange between processes."""
+        return {
+            "counts": {
+                str(index): count for index, count in enumerate(self.counts) if count
+            },
+            "count": self.count,
+            "sum_ns": self.sum_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram from ``to_dict`` output."""
+        histogram = cls()
+        for index, count in data["counts"].items():
+            histogram.counts[int(index)] = count
+        histogram.count = data["count"]
+        histogram.sum_ns = data["sum_ns"]
+        histogram.min_ns = data["min_ns"]
+        histogram.max_ns = data["max_ns"]
+        return histogram
+
+
+class LatencyHistogramFamily:
+    """Latency histograms of one measurement, one per combination of labels."""
+
+    def __init__(self, name: str, labelnames: Tuple[str, ...]):
+        """Initialize an empty family; children are created on first use."""
+        self.name = name
+        self.labelnames = labelnames
+        self._children: Dict[Tuple[str, ...], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *labelvalues: str) -> LatencyHistogram:
+        """The histogram for a combination of label values."""
+        child = self._children.get(labelvalues)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(labelvalues, LatencyHistogram())
+        return child
+
+    def children(self) -> List[Tuple[Tuple[str, ...], LatencyHistogram]]:
+        """Snapshot of the label values and histogram of every child."""
+        with self._lock:
+            return list(self._children.items())
+
+
+def _family_key(labelvalues: Tuple[str, ...]) -> str:
+    return json.dumps(list(labelvalues))
+
+
+def snapshot(families: Iterable[LatencyHistogramFamily]) -> Dict[str, Any]:
+    """Serializable copy of all children of the given families."""
+    return {
+        family.name: {
+            _family_key(labelvalues): histogram.to_dict()
+            for labelvalues, histogram in family.children()
+        }
+        for family in families
+    }
+
+
+def merge_snapshots(
+    snapshots: Iterable[Dict[str, Any]],
+) -> Dict[str, Dict[Tuple[str, ...], LatencyHistogram]]:
+    """Merge snapshots, e.g. of several workers, into histograms per series."""
+    merged: Dict[str, Dict[Tuple[str, ...], LatencyHistogram]] = {}
+    for data in snapshots:
+        for name, series in data.items():
+            family = merged.setdefault(name, {})
+            for key, histogram_data in series.items():
+                labelvalues = tuple(json.loads(key))
+                histogram = LatencyHistogram.from_dict(histogram_data)
+                if labelvalues in family:
+                    family[labelvalues].merge(histogram)
+                else:
+                    family[labelvalues] = histogram
+    return merged
+
+
+def write_snapshot(path: Path, families: Iterable[LatencyHistogramFamily]) -> None:
+    """Write a snapshot atomically, replacing any previous one."""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(snapshot(families)))
+    tmp_path.replace(path)
+
+
+def read_snapshots(paths: Iterable[Path]) -> List[Dict[str, Any]]:
+    """Read the snapshot files that exist."""
+    snapshots = []
+    for path in paths:
+        try:
+            snapshots.append(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            # Removed or being replaced by its worker
+            continue
+    return snapshots
+
+
+def latency_report(
+    merged: Dict[str, Dict[Tuple[str, ...], LatencyHistogram]],
+    labelnames: Dict[str, Tuple[str, ...]],
+    percentiles: Iterable[float],
+    name: Optional[str] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Percentile summaries per series, busiest series first."""
+    percentiles = list(percentiles)
+    report: Dict[str, List[Dict[str, Any]]] = {}
+    for family_name, series in merged.items():
+        if name is not None and family_name != name:
+            continue
+        names = labelnames.get(family_name, ())
+        rows = [
+            {
+                "labels": dict(zip(names, labelvalues)),
+                **histogram.summary(percentiles),
+            }
+            for labelvalues, histogram in series.items()
+        ]
+        rows.sort(key=lambda row: row["count"], reverse=True)
+        report[family_name] = rows
+    return report
@@ -0,0 +1,39 @@
+"""Deferred imports for heavy optional dependencies."""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any
+
+
+class _DeferredModule(ModuleType):
+    """Stands in for a module until one of its attributes is used."""
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self.__name__)
+        # Later lookups find the module's attributes without this hook
+        self.__dict__.update(vars(module))
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module whose code only runs on first attribute access.
+
+    Used for dependencies that only a few requests need (e.g. ``psutil`` for
+    detailed health checks), so they do not add to process startup time.
+    The real module is imported, and added to ``sys.modules``, on first use.
+    Missing modules still fail immediately rather than at first use.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return _DeferredModule(name)
+
+
+def is_loaded(name: str) -> bool:
+    """Check whether a module has been imported and actually executed."""
+    return name in sys.modules
@@ -0,0 +1,249 @@
+"""Non-blocking logging pipeline.
+
+Loggers hand records to a ``QueueHandler`` that only enqueues them; a single
+listener thread drains the queue, formats the records and writes them to the
+real handlers in batches, flushing once per batch. Formatting, file I/O and
+log rotation therefore never run on the event loop thread.
+
+The queue is bounded. When it is full the ``drop`` policy discards the record
+immediately, while ``block`` waits up to a timeout for space before dropping.
+Dropped records are counted in ``log_records_dropped_total`` and reported
+by the listener as a warning once the queue has room again.
+"""
+
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Iterable, List, Optional
+
+from .metrics import LOG_QUEUE_DEPTH, LOG_RECORDS_DROPPED
+
+DROP = "drop"
+BLOCK = "block"
+OVERFLOW_POLICIES = (DROP, BLOCK)
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_BLOCK_TIMEOUT_SECONDS = 0.1
+
+
+class BatchWriteMixin:
+    """Lets a ``StreamHandler`` write a batch of records with a single flush."""
+
+    _batching = False
+
+    def emit_batch(self, records: Iterable[logging.LogRecord]) -> None:
+        """Emit records under one lock acquisition, flushing at the end."""
+        self.acquire()
+        try:
+            self._batching = True
+            try:
+                for record in records:
+                    self.handle(record)
+            finally:
+                self._batching = False
+                self.flush()
+        finally:
+            self.release()
+
+    def flush(self) -> None:
+        # StreamHandler.emit flushes after every record; defer that to the batch
+        if not self._batching:
+            super().flush()
+
+
+class BatchStreamHandler(BatchWriteMixin, logging.StreamHandler):
+    """Stream handler that flushes once per batch."""
+
+
+class BatchRotatingFileHandler(BatchWriteMixin, RotatingFileHandler):
+    """Rotating file handler that flushes once per batch."""
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Enqueues records for a listener thread without formatting them.
+
+    Records are passed through as-is, so message arguments are rendered by
+    the listener; callers must not mutate objects after logging them.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        route: str,
+        policy: str = DROP,
+        block_timeout: float = DEFAULT_BLOCK_TIMEOUT_SECONDS,
+    ):
+        """Initialize for a queue, the listener route of this handler's logger and an overflow policy."""
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown log queue policy {policy!r}, expected one of {OVERFLOW_POLICIES}"
+            )
+        super().__init__(log_queue)
+        self.route = route
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Tag the record with its route; formatting is left to the listener."""
+        record._log_route = self.route
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, applying the overflow policy when full."""
+        try:
+            if self.policy == BLOCK:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.labels(level=record.levelname).inc()
+
+
+class BatchingQueueListener(QueueListener):
+    """Queue listener that drains records in batches and routes them to handlers."""
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        routes: Dict[str, List[logging.Handler]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Initialize with the handlers to write to for each route."""
+        super().__init__(log_queue, respect_handler_level=True)
+        self.routes = routes
+        self.batch_size = batch_size
+        self.queue_handlers: List[BoundedQueueHandler] = []
+        self._reported_drops = 0
+
+    def enqueue_sentinel(self) -> None:
+        # The stdlib uses put_nowait, which fails on a full queue
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        """Drain the queue in batches until the sentinel is seen."""
+        log_queue = self.queue
+        stopping = False
+        while not stopping:
+            batch: List[logging.LogRecord] = []
+            record = log_queue.get()
+            while True:
+                if record is self._sentinel:
+                    stopping = True
+                    break
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = log_queue.get_nowait()
+                except queue.Empty:
+                    break
+            self.handle_batch(batch)
+            for _ in range(len(batch) + stopping):
+                log_queue.task_done()
+            # Updated here rather than read at scrape time, which would not
+            # work across worker processes
+            LOG_QUEUE_DEPTH.set(log_queue.qsize())
+
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """Write a batch of records to the handlers of their routes."""
+        drop_report = self._drop_report()
+        by_route: Dict[str, List[logging.LogRecord]] = {}
+        for record in records:
+            by_route.setdefault(getattr(record, "_log_route", ""), []).append(record)
+        if drop_report is not None:
+            for route in self.routes:
+                by_route.setdefault(route, []).append(drop_report)
+
+        for route, route_records in by_route.items():
+            for handler in self.routes.get(route, ()):
+                selected = [r for r in route_records if r.levelno >= handler.level]
+                if not selected:
+                    continue
+                if isinstance(handler, BatchWriteMixin):
+                    handler.emit_batch(selected)
+                else:
+                    for record in selected:
+                        handler.handle(record)
+
+    def _drop_report(self) -> Optional[logging.LogRecord]:
+        """Build a warning record if records were dropped since the last batch."""
+        dropped = sum(handler.dropped for handler in self.queue_handlers)
+        if dropped == self._reported_drops:
+            return None
+        record = logging.LogRecord(
+            __name__,
+            logging.WARNING,
+            __file__,
+            0,
+            "Log queue full, dropped %d records",
+            (dropped - self._reported_drops,),
+            None,
+        )
+        self._reported_drops = dropped
+        return record
+
+
+class LogPipeline:
+    """Moves the handlers of a set of loggers behind a shared bounded queue."""
+
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        policy: str = DROP,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        block_timeout: float = DEFAULT_BLOCK_TIMEOUT_SECONDS,
+    ):
+        """Initialize an empty pipeline; call ``install`` then ``start``."""
+        self.queue: "queue.Queue[logging.LogRecord]" = queue.Queue(queue_size)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.listener = BatchingQueueListener(self.queue, {}, batch_size)
+        self._loggers: List[logging.Logger] = []
+        self._lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        """Total number of records dropped because the queue was full."""
+        return sum(handler.dropped for handler in self.listener.queue_handlers)
+
+    def install(self, logger: logging.Logger) -> BoundedQueueHandler:
+        """Replace a logger's handlers with a queue handler feeding them."""
+        route = logger.name
+        queue_handler = BoundedQueueHandler(
+            self.queue, route, self.policy, self.block_timeout
+        )
+        self.listener.routes[route] = list(logger.handlers)
+        self.listener.queue_handlers.append(queue_handler)
+        # Don't enqueue records that none of the handlers would write
+        queue_handler.setLevel(
+            min((handler.level for handler in logger.handlers), default=logging.NOTSET)
+        )
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+        self._loggers.append(logger)
+        return queue_handler
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Flush every queued record and restore the loggers' handlers.
+
+        Safe to call more than once.
+        """
+        with self._lock:
+            if self.listener._thread is not None:
+                self.listener.stop()
+            for logger in self._loggers:
+                for handler in list(logger.handlers):
+                    if isinstance(handler, BoundedQueueHandler):
+                        logger.removeHandler(handler)
+                for handler in self.listener.routes.get(logger.name, ()):
+                    logger.addHandler(handler)
+            self._loggers = []
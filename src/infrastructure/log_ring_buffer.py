@@ -0,0 +1,128 @@
+"""In-memory ring buffer of recent log records.
+
+The buffer keeps the last N records at any level, so DEBUG detail is
+available for investigating an incident without writing it to disk. It is
+attached to the root logger next to the queue handler: storing a record is
+an index increment and a slot assignment, with no formatting and no lock.
+Records are only rendered when queried.
+
+Records are kept as-is, so their message arguments are rendered at query
+time. Records carrying exception info are copied with the traceback
+rendered, so the buffer does not keep stack frames alive.
+"""
+
+import copy
+import itertools
+import logging
+from operator import itemgetter
+from typing import List, Optional, Tuple
+
+from .json_log_formatter import FastJsonFormatter
+
+DEFAULT_CAPACITY = 10000
+
+DEFAULT_FORMAT = (
+    "%(asctime)s %(name)s %(levelname)s %(message)s %(pathname)s %(lineno)s"
+)
+
+_exception_formatter = logging.Formatter()
+
+
+class LogRingBuffer(logging.Handler):
+    """Handler keeping the most recent records in a preallocated ring."""
+
+    def __init__(
+        self, capacity: int = DEFAULT_CAPACITY, level: int = logging.NOTSET
+    ):
+        """Initialize with the number of records to keep."""
+        super().__init__(level)
+        self.capacity = capacity
+        self._slots: List[Optional[Tuple[int, logging.LogRecord]]] = [None] * capacity
+        self._counter = itertools.count()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Store the record without taking the handler lock.
+
+        The slot index comes from an atomic counter, so concurrent callers
+        never write the same slot in the same round.
+        """
+        if not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.exc_info:
+            # Keep the rendered traceback, not the frames it references
+            record = copy.copy(record)
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(
+                    record.exc_info
+                )
+            record.exc_info = None
+        index = next(self._counter)
+        self._slots[index % self.capacity] = (index, record)
+
+    def records(self) -> List[logging.LogRecord]:
+        """Return the buffered records, oldest first."""
+        entries = [entry for entry in list(self._slots) if entry is not None]
+        entries.sort(key=itemgetter(0))
+        return [record for _, record in entries]
+
+    def query(
+        self,
+        request_id: Optional[str] = None,
+        operation: Optional[str] = None,
+        level: int = logging.NOTSET,
+        limit: int = 100,
+    ) -> List[logging.LogRecord]:
+        """Return the most recent matching records, oldest first.
+
+        ``operation`` matches either the operation name of lifecycle
+        records or the operation ID every record inside an operation has.
+        """
+        matched = []
+        for record in reversed(self.records()):
+            if record.levelno < level:
+                continue
+            values = record.__dict__
+            if request_id is not None and values.get("request_id") != request_id:
+                continue
+            if operation is not None and operation not in (
+                values.get("operation"),
+                values.get("operation_id"),
+            ):
+                continue
+            matched.append(record)
+            if len(matched) >= limit:
+                break
+        matched.reverse()
+        return matched
+
+    def render(self, records: List[logging.LogRecord]) -> str:
+        """Render records as a JSON array in the ``app.log`` line format."""
+        formatter = self.formatter or _default_formatter
+        return "[" + ",".join(formatter.format(record) for record in records) + "]"
+
+    def clear(self) -> None:
+        """Discard all buffered records."""
+        self._slots = [None] * self.capacity
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._slots if entry is not None)
+
+
+_default_formatter = FastJsonFormatter(DEFAULT_FORMAT)
+
+_ring_buffer: Optional[LogRingBuffer] = None
+
+
+def set_log_ring_buffer(ring_buffer: Optional[LogRingBuffer]) -> None:
+    """Set the buffer served by ``/debug/logs``; None disables it."""
+    global _ring_buffer
+    _ring_buffer = ring_buffer
+
+
+def get_log_ring_buffer() -> Optional[LogRingBuffer]:
+    """The buffer of recent records, if one is installed."""
+    return _ring_buffer
@@ -1,107 +1,290 @@
 import logging
+import random
+import sys
+import threading
 import time
 from contextlib import contextmanager
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from contextvars import ContextVar
 
+from .tracing import Span, current_span
+
 # Context variables for request tracking
 request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 operation_id: ContextVar[Optional[str]] = ContextVar("operation_id", default=None)
 
 
+# Extras given to the logger are renamed when they clash with LogRecord attributes
+_RESERVED_NAMES = {
+    "message": "log_message",
+    "name": "entity_name",
+    "asctime": "event_time",
+}
+
+# Logger._log counts the frame calling it from Python 3.11 on; before, the
+# caller lookup started one frame further out (bpo-45171)
+_STACKLEVEL_OFFSET = 1 if sys.version_info >= (3, 11) else 0
+
+# Extras may be passed as a callable, only evaluated when the level is enabled
+Extra = Union[Dict[str, Any], Callable[[], Dict[str, Any]]]
+
+# Request/operation/span context of the last record, reused until one changes
+_context_cache: ContextVar[
+    Tuple[Optional[str], Optional[str], Optional[Span], Dict[str, Any]]
+] = ContextVar("log_context_cache", default=(None, None, None, {}))
+
+
+def _base_context() -> Dict[str, Any]:
+    """Context fields of the current request, operation and trace.
+
+    The returned dict is shared between records and must not be mutated.
+    """
+    req_id = request_id.get()
+    op_id = operation_id.get()
+    span = current_span.get()
+    cached_req_id, cached_op_id, cached_span, ctx = _context_cache.get()
+    if req_id is cached_req_id and op_id is cached_op_id and span is cached_span:
+        return ctx
+
+    ctx = {}
+    if req_id:
+        ctx["request_id"] = req_id
+    if op_id:
+        ctx["operation_id"] = op_id
+    if span is not None:
+        ctx["trace_id"] = span.trace_id_hex
+    _context_cache.set((req_id, op_id, span, ctx))
+    return ctx
+
+
 class ContextualLogger:
-    """Logger that includes context information in all log messages."""
+    """Logger that includes context information in all log messages.
+
+    Calls for disabled levels return before doing any work. Prefer
+    ``%``-style arguments over f-strings, and pass ``extra`` as a callable
+    when building it is expensive, so that both are only evaluated for
+    records that are actually emitted.
+    """
 
     def __init__(self, logger: logging.Logger):
         self._logger = logger
 
-    def _add_context(self, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Add context information to log extras."""
-        ctx = {}
-
-        # Add request context if available
-        req_id = request_id.get()
-        if req_id:
-            ctx["request_id"] = req_id
-
-        # Add operation context if available
-        op_id = operation_id.get()
-        if op_id:
-            ctx["operation_id"] = op_id
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether records of this level would be emitted."""
+        return self._logger.isEnabledFor(level)
 
-        # Add any extra context, avoiding reserved names
-        if extra:
+    def _add_context(self, extra: Optional[Extra] = None) -> Dict[str, Any]:
+        """Add context information to log extras."""
+        ctx = _base_context()
+        if extra is None:
+            return ctx
+        if callable(extra):
+            extra = extra()
+        if not extra:
+            return ctx
+        if not _RESERVED_NAMES.keys().isdisjoint(extra):
             # Map reserved names to alternatives
-            name_mapping = {
-                "message": "log_message",
-                "name": "entity_name",
-                "asctime": "event_time",
+            extra = {
+                _RESERVED_NAMES.get(key, key): value for key, value in extra.items()
             }
-            for key, value in extra.items():
-                safe_key = name_mapping.get(key, key)
-                ctx[safe_key] = value
+        return {**ctx, **extra}
 
-        return ctx
+    # Each method calls Logger._log directly, so caller lookup has to skip
+    # this method's frame on Python 3.11+. Wrappers of this logger pass a
+    # higher stacklevel, as with logging.Logger, so records are attributed
+    # to their own callers.
 
-    def debug(self, msg: str, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
-        self._logger.debug(msg, *args, extra=self._add_context(extra), **kwargs)
+    def debug(
+        self,
+        msg: str,
+        *args,
+        extra: Optional[Extra] = None,
+        stacklevel: int = 1,
+        **kwargs,
+    ):
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger._log(
+                logging.DEBUG,
+                msg,
+                args,
+                extra=self._add_context(extra),
+                stacklevel=stacklevel + _STACKLEVEL_OFFSET,
+                **kwargs,
+            )
 
-    def info(self, msg: str, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
-        self._logger.info(msg, *args, extra=self._add_context(extra), **kwargs)
+    def info(
+        self,
+        msg: str,
+        *args,
+        extra: Optional[Extra] = None,
+        stacklevel: int = 1,
+        **kwargs,
+    ):
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger._log(
+                logging.INFO,
+                msg,
+                args,
+                extra=self._add_context(extra),
+                stacklevel=stacklevel + _STACKLEVEL_OFFSET,
+                **kwargs,
+            )
 
     def warning(
-        self, msg: str, *args, extra: Optional[Dict[str, Any]] = None, **kwargs
+        self,
+        msg: str,
+        *args,
+        extra: Optional[Extra] = None,
+        stacklevel: int = 1,
+        **kwargs,
     ):
-        self._logger.warning(msg, *args, extra=self._add_context(extra), **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger._log(
+                logging.WARNING,
+                msg,
+                args,
+                extra=self._add_context(extra),
+                stacklevel=stacklevel + _STACKLEVEL_OFFSET,
+                **kwargs,
+            )
 
-    def error(self, msg: str, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
-        self._logger.error(msg, *args, extra=self._add_context(extra), **kwargs)
+    def error(
+        self,
+        msg: str,
+        *args,
+        extra: Optional[Extra] = None,
+        stacklevel: int = 1,
+        **kwargs,
+    ):
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger._log(
+                logging.ERROR,
+                msg,
+                args,
+                extra=self._add_context(extra),
+                stacklevel=stacklevel + _STACKLEVEL_OFFSET,
+                **kwargs,
+            )
+
+
+@dataclass
+class OperationSamplingConfig:
+    """How often ``operation_context`` logs the lifecycle of successful operations.
+
+    Failures are always logged, and so are operations slower than
+    ``slow_threshold_ms``, whether or not they were sampled.
+    """
+
+    sample_rate: float = 1.0  # Fraction of successful operations to log
+    sample_rates: Dict[str, float] = field(default_factory=dict)  # Per operation name
+    slow_threshold_ms: Optional[float] = None
+    rate_limit_per_second: float = 0.0  # Per operation name, 0 for no limit
+
+
+class OperationLogSampler:
+    """Decides which operations get their lifecycle logged."""
+
+    def __init__(self, config: Optional[OperationSamplingConfig] = None):
+        self.config = config or OperationSamplingConfig()
+        self._buckets: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def should_log(self, name: str) -> bool:
+        """Sample an operation, then charge it to its name's rate limit."""
+        rate = self.config.sample_rates.get(name, self.config.sample_rate)
+        if rate < 1.0 and random.random() >= rate:
+            return False
+        if self.config.rate_limit_per_second > 0:
+            return self._take_token(name)
+        return True
+
+    def is_slow(self, duration_ms: float) -> bool:
+        """Whether an operation took long enough to be logged regardless of sampling."""
+        threshold = self.config.slow_threshold_ms
+        return threshold is not None and duration_ms >= threshold
+
+    def _take_token(self, name: str) -> bool:
+        """Token bucket per operation name, holding up to one second of budget."""
+        limit = self.config.rate_limit_per_second
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(name)
+            if bucket is None:
+                bucket = self._buckets[name] = [limit, now]
+            tokens = min(limit, bucket[0] + (now - bucket[1]) * limit)
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                return False
+            bucket[0] = tokens - 1.0
+            return True
+
+
+_sampler = OperationLogSampler()
+
+
+def configure_operation_sampling(config: OperationSamplingConfig) -> None:
+    """Set how operation lifecycle logs are sampled process-wide."""
+    global _sampler
+    _sampler = OperationLogSampler(config)
 
 
 @contextmanager
 def operation_context(name: str, logger: Optional[ContextualLogger] = None, **context):
-    """Context manager for tracking operations with timing and structured logging."""
-    start_time = time.time()
-    op_id = f"{name}_{int(start_time * 1000)}"
-    operation_id.set(op_id)
-
-    try:
-        if logger:
-            logger.info(
-                f"Starting operation: {name}",
-                extra={"operation": name, "operation_id": op_id, **context},
-            )
+    """Context manager for tracking operations with timing and structured logging.
 
-        yield
-
-    except Exception as e:
-        if logger:
-            logger.error(
-                f"Operation failed: {name}",
-                extra={
-                    "operation": name,
-                    "operation_id": op_id,
-                    "error_details": str(e),
-                    "duration_ms": int((time.time() - start_time) * 1000),
-                    **context,
-                },
-            )
-        raise
-
-    else:
-        if logger:
-            logger.info(
-                f"Operation completed: {name}",
-                extra={
-                    "operation": name,
-                    "operation_id": op_id,
-                    "duration_ms": int((time.time() - start_time) * 1000),
-                    **context,
-                },
-            )
+    The operation runs in a tracing span, a child of the enclosing
+    operation's span, and ``operation_id`` is that span's ID until the
+    operation ends. Start and completion records are subject to operation
+    sampling; failures and slow completions are always logged.
+    """
+    with Span(name, context) as span:
+        op_id = span.span_id_hex
+        token = operation_id.set(op_id)
+        sampler = _sampler
+        sampled = logger is not None and sampler.should_log(name)
+
+        try:
+            if sampled:
+                logger.info(
+                    f"Starting operation: {name}",
+                    extra={"operation": name, "operation_id": op_id, **context},
+                )
+
+            yield
+
+        except Exception as e:
+            span.set_error(e)
+            if logger:
+                logger.error(
+                    f"Operation failed: {name}",
+                    extra={
+                        "operation": name,
+                        "operation_id": op_id,
+                        "error_details": str(e),
+                        "duration_ms": span.elapsed_ns // 1_000_000,
+                        **context,
+                    },
+                )
+            raise
+
+        else:
+            if logger:
+                duration_ms = span.elapsed_ns / 1_000_000
+                if sampled or sampler.is_slow(duration_ms):
+                    logger.info(
+                        f"Operation completed: {name}",
+                        extra={
+                            "operation": name,
+                            "operation_id": op_id,
+                            "duration_ms": int(duration_ms),
+                            **context,
+                        },
+                    )
 
-    finally:
-        operation_id.set(None)
+        finally:
+            operation_id.reset(token)
 
 
 def get_contextual_logger(name: str) -> ContextualLogger:
@@ -0,0 +1,212 @@
+"""Low-overhead recording of service operation metrics.
+
+``OperationMetrics`` binds the labelled children of the operation
+metrics once, so recording skips the ``labels()`` lookup and its lock.
+The counters are bound when an operation is declared, the latency
+histogram on first use, after its buckets have been configured.
+Durations are measured with ``perf_counter_ns``.
+
+With thread accumulation enabled, each thread adds its observations to
+plain per-thread counters instead of the shared metrics, which take a
+lock for every update. ``flush_metrics`` adds what has accumulated since
+the last flush to the shared metrics. It runs before every scrape and
+periodically from a background thread. Only the owning thread writes an
+accumulator and only the flusher writes what it has flushed, so neither
+side needs a lock. Accumulators of threads that have exited, such as
+expired threadpool workers, are dropped after their final flush.
+
+``Histogram`` has no public way to add many observations at once, so the
+flush adds to the histogram's internal ``_sum`` and ``_buckets`` values.
+These are prometheus_client internals, unchanged from 0.17 (the minimum
+in requirements/base.txt) through 0.26;
+``test_accumulated_metrics_appear_on_flush`` fails if a release changes
+them.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+from src.config.settings import Settings
+from .metrics import (
+    OPERATION_LATENCY_HDR,
+    SERVICE_OPERATION_LATENCY,
+    SERVICE_OPERATIONS,
+)
+from .warmup_context import warmup_request
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Layout of an accumulator entry: success count, error count, summed
+# nanoseconds, then one count per histogram bucket
+_SUCCESS = 0
+_ERROR = 1
+_SUM_NS = 2
+_BUCKETS = 3
+
+
+class OperationMetrics:
+    """The metric children of one operation, bound once."""
+
+    __slots__ = (
+        "operation_name",
+        "success",
+        "error",
+        "latency",
+        "latency_hdr",
+        "_bounds_ns",
+    )
+
+    def __init__(self, operation_name: str):
+        """Bind the counter and histogram children for ``operation_name``."""
+        self.operation_name = operation_name
+        self.success = SERVICE_OPERATIONS.labels(
+            operation=operation_name, status="success"
+        )
+        self.error = SERVICE_OPERATIONS.labels(operation=operation_name, status="error")
+        self.latency: Optional[Any] = None
+        self.latency_hdr = OPERATION_LATENCY_HDR.labels(operation_name)
+        # Bucket bounds in nanoseconds, so accumulation never converts units
+        self._bounds_ns: Optional[List[float]] = None
+
+    def _bind_latency(self) -> Any:
+        """Bind the histogram child, fixing the histogram's buckets."""
+        if self.latency is None:
+            self.latency = SERVICE_OPERATION_LATENCY.labels(
+                operation=self.operation_name
+            )
+            self._bounds_ns = [
+                bound * 1e9 for bound in SERVICE_OPERATION_LATENCY.upper_bounds
+            ]
+        return self.latency
+
+    def record(self, duration_ns: int, success: bool) -> None:
+        """Record one completed operation, unless it is part of warmup."""
+        if warmup_request.get():
+            return
+        self.latency_hdr.record(duration_ns)
+        if _accumulate:
+            entry = _entries().get(self)
+            if entry is None:
+                entry = _new_entry(self)
+            entry[_SUCCESS if success else _ERROR] += 1
+            entry[_SUM_NS] += duration_ns
+            entry[_BUCKETS + bisect_left(self._bounds_ns, duration_ns)] += 1
+            return
+        (self.success if success else self.error).inc()
+        (self.latency or self._bind_latency()).observe(duration_ns / 1e9)
+
+    def _flush(self, entry: List[int], flushed: List[int]) -> None:
+        """Add the part of ``entry`` not yet in ``flushed`` to the metrics."""
+        current = list(entry)
+        delta = [now - before for now, before in zip(current, flushed)]
+        if not any(delta):
+            return
+        flushed[:] = current
+        if delta[_SUCCESS]:
+            self.success.inc(delta[_SUCCESS])
+        if delta[_ERROR]:
+            self.error.inc(delta[_ERROR])
+        # No bulk observe; internal values, see the module docstring
+        latency = self.latency
+        latency._sum.inc(delta[_SUM_NS] / 1e9)
+        for index, count in enumerate(delta[_BUCKETS:]):
+            if count:
+                latency._buckets[index].inc(count)
+
+
+_accumulate = False
+_local = threading.local()
+# (owning thread, operation metrics, accumulator entry, flushed snapshot)
+_registered: List[tuple] = []
+_registered_lock = threading.Lock()
+
+
+def _entries() -> Dict[OperationMetrics, List[int]]:
+    try:
+        return _local.entries
+    except AttributeError:
+        _local.entries = {}
+        return _local.entries
+
+
+def _new_entry(metrics: OperationMetrics) -> List[int]:
+    """Create this thread's accumulator for an operation and register it."""
+    metrics._bind_latency()
+    entry = [0] * (_BUCKETS + len(metrics._bounds_ns))
+    _entries()[metrics] = entry
+    with _registered_lock:
+        _registered.append(
+            (threading.current_thread(), metrics, entry, [0] * len(entry))
+        )
+    return entry
+
+
+def flush_metrics() -> None:
+    """Add everything accumulated by all threads to the shared metrics.
+
+    Accumulators of threads that have exited are flushed one last time and
+    dropped.
+    """
+    with _registered_lock:
+        live = []
+        for registration in _registered:
+            thread, metrics, entry, flushed = registration
+            # Checked before flushing: an exited thread adds nothing more
+            exited = not thread.is_alive()
+            metrics._flush(entry, flushed)
+            if not exited:
+                live.append(registration)
+        _registered[:] = live
+
+
+def set_thread_accumulation(enabled: bool) -> None:
+    """Switch between recording directly and per-thread accumulation."""
+    global _accumulate
+    if not enabled:
+        flush_metrics()
+    _accumulate = enabled
+
+
+class MetricsFlusher:
+    """Background thread flushing accumulated metrics at a fixed interval."""
+
+    def __init__(self, interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS):
+        """Start flushing every ``interval`` seconds."""
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            flush_metrics()
+
+    def stop(self) -> None:
+        """Stop the thread after a final flush."""
+        self._stop.set()
+        self._thread.join()
+        flush_metrics()
+
+
+_flusher: Optional[MetricsFlusher] = None
+
+
+def configure_metric_recording(settings: Settings) -> None:
+    """Enable per-thread accumulation if configured."""
+    global _flusher
+    if not settings.metrics_thread_accumulation:
+        return
+    set_thread_accumulation(True)
+    _flusher = MetricsFlusher(settings.metrics_flush_interval_seconds)
+
+
+def shutdown_metric_recording() -> None:
+    """Flush accumulated metrics and go back to recording directly."""
+    global _flusher
+    flusher, _flusher = _flusher, None
+    if flusher is not None:
+        flusher.stop()
+    set_thread_accumulation(False)
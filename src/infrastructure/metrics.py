@@ -1,51 +1,286 @@
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from prometheus_client import Counter, Histogram, Gauge
+from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.metrics_core import Metric
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 import time
 
+from ..application.metrics_catalog import METRIC_CATALOG
+from ..domain.ports.metrics_port import MetricDefinition
+from .latency_histogram import LatencyHistogramFamily
+from .route_templates import route_template
+from .warmup_context import warmup_request
+
+# Default buckets start at 5ms; requests here are much faster
+REQUEST_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+
+
+class ConfigurableHistogram:
+    """A histogram whose buckets can be set by ``configure_histogram_buckets``.
+
+    prometheus_client fixes a histogram's buckets when it is created, but
+    metrics are declared at import time, before settings are loaded. The
+    histogram is therefore created on first use, with the buckets
+    configured by then; it can no longer be reconfigured afterwards.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS,
+    ):
+        """Declare the histogram without creating it."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self._histogram: Optional[Histogram] = None
+        self._lock = threading.Lock()
+
+    @property
+    def upper_bounds(self) -> Tuple[float, ...]:
+        """The bucket bounds, ending with +Inf as exported."""
+        if self.buckets and self.buckets[-1] == float("inf"):
+            return self.buckets
+        return self.buckets + (float("inf"),)
+
+    def configure(self, buckets: Sequence[float]) -> None:
+        """Set the buckets; only possible before the histogram is used."""
+        buckets = tuple(float(bound) for bound in buckets)
+        if buckets == self.buckets:
+            return
+        if self._histogram is not None:
+            raise RuntimeError(
+                f"Histogram {self.name!r} is already in use, "
+                "configure its buckets before recording"
+            )
+        self.buckets = buckets
+
+    def histogram(self) -> Histogram:
+        """The Prometheus histogram, created on first call."""
+        histogram = self._histogram
+        if histogram is None:
+            with self._lock:
+                if self._histogram is None:
+                    self._histogram = Histogram(
+                        self.name,
+                        self.documentation,
+                        self.labelnames,
+                        buckets=self.buckets,
+                    )
+                histogram = self._histogram
+        return histogram
+
+    def labels(self, *labelvalues: Any, **labelkwargs: Any) -> Histogram:
+        """The child for these label values."""
+        return self.histogram().labels(*labelvalues, **labelkwargs)
+
+    def observe(self, amount: float) -> None:
+        """Observe a value of an unlabelled histogram."""
+        self.histogram().observe(amount)
+
+    def describe(self) -> List[Metric]:
+        """Describe the metric without creating it."""
+        return [Metric(self.name, self.documentation, "histogram")]
+
+
 # General HTTP metrics
 REQUEST_COUNT = Counter(
     "http_requests_total", "Total HTTP requests count", ["method", "endpoint", "status"]
 )
 
-REQUEST_LATENCY = Histogram(
+REQUEST_LATENCY = ConfigurableHistogram(
     "http_request_duration_seconds",
     "HTTP request duration in seconds",
     ["method", "endpoint"],
+    buckets=REQUEST_LATENCY_BUCKETS,
 )
 
+# With several workers (see multiprocess_metrics.py) each gauge's
+# multiprocess_mode says how the workers' values are combined
+
 REQUESTS_IN_PROGRESS = Gauge(
-    "http_requests_in_progress", "Number of HTTP requests in progress", ["method"]
+    "http_requests_in_progress",
+    "Number of HTTP requests in progress",
+    ["method"],
+    multiprocess_mode="livesum",
 )
 
-# Service-specific metrics
-SERVICE_OPERATIONS = Counter(
-    "service_operations_total",
-    "Total number of service operations",
-    ["operation", "status"],
+# Live gauge modes for the catalog's aggregations, so that workers that
+# have exited stop counting
+_GAUGE_MODES = {"sum": "livesum", "max": "livemax", "min": "livemin"}
+
+
+def create_metric(
+    definition: MetricDefinition,
+) -> Union[MetricWrapperBase, ConfigurableHistogram]:
+    """Create the Prometheus metric for a catalog definition."""
+    name = definition.export_name or definition.name
+    if definition.kind == "counter":
+        return Counter(name, definition.description, definition.labels)
+    if definition.kind == "gauge":
+        return Gauge(
+            name,
+            definition.description,
+            definition.labels,
+            multiprocess_mode=_GAUGE_MODES[definition.aggregation],
+        )
+    return ConfigurableHistogram(
+        name,
+        definition.description,
+        definition.labels,
+        buckets=definition.buckets or Histogram.DEFAULT_BUCKETS,
+    )
+
+
+# Per-request resources, see request_accounting.py
+REQUEST_CPU_TIME = ConfigurableHistogram(
+    "http_request_cpu_seconds",
+    "Thread CPU time spent on HTTP requests",
+    ["method", "endpoint"],
+    buckets=REQUEST_LATENCY_BUCKETS,
 )
 
-SERVICE_OPERATION_LATENCY = Histogram(
-    "service_operation_duration_seconds",
-    "Duration of service operations in seconds",
-    ["operation"],
+REQUEST_ALLOCATED_BYTES = ConfigurableHistogram(
+    "http_request_allocated_bytes",
+    "Memory allocated by sampled HTTP requests",
+    ["method", "endpoint"],
+    buckets=tuple(float(4**power * 1024) for power in range(10)),
 )
 
-SERVICES_COUNT = Gauge("services_total", "Total number of services in the system")
+# Service-specific metrics, declared in the application's metric catalog
+CATALOG_METRICS: Dict[str, Union[MetricWrapperBase, ConfigurableHistogram]] = {
+    name: create_metric(definition) for name, definition in METRIC_CATALOG.items()
+}
+SERVICE_OPERATIONS = CATALOG_METRICS["operation_count"]
+SERVICE_OPERATION_LATENCY = CATALOG_METRICS["operation_duration_seconds"]
+SERVICES_COUNT = CATALOG_METRICS["services_count"]
+
+# High-resolution latency for percentiles at /debug/latency
+REQUEST_LATENCY_HDR = LatencyHistogramFamily(
+    "http_request_duration", ("method", "endpoint")
+)
+OPERATION_LATENCY_HDR = LatencyHistogramFamily(
+    "service_operation_duration", ("operation",)
+)
+LATENCY_FAMILIES = (REQUEST_LATENCY_HDR, OPERATION_LATENCY_HDR)
+
+# Logging pipeline metrics
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "Log records dropped because the log queue was full",
+    ["level"],
+)
+
+LOG_QUEUE_DEPTH = Gauge(
+    "log_queue_depth",
+    "Log records waiting to be written",
+    multiprocess_mode="livemax",
+)
+
+# Tracing metrics
+TRACES_DROPPED = Counter(
+    "traces_dropped_total", "Completed traces dropped instead of being exported"
+)
+
+TRACES_SAMPLED = Counter(
+    "traces_sampled_total",
+    "Completed traces by tail sampling decision",
+    ["decision"],
+)
+
+
+# Runtime metrics, see runtime_monitor.py
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop ran a timer callback",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+EVENT_LOOP_SLOW_CALLBACKS = Counter(
+    "event_loop_slow_callbacks_total",
+    "Callbacks that blocked the event loop beyond the slow callback threshold",
+)
+
+GC_PAUSE = Histogram(
+    "gc_pause_seconds",
+    "Garbage collection pause duration",
+    ["generation"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+# Host resource usage, see system_metrics.py. Workers on one host all
+# report the same values
+SYSTEM_CPU_USAGE = Gauge(
+    "system_cpu_usage_percent",
+    "Host CPU usage since the previous sample",
+    multiprocess_mode="livemax",
+)
+
+SYSTEM_MEMORY_USAGE = Gauge(
+    "system_memory_usage_percent",
+    "Host memory in use",
+    multiprocess_mode="livemax",
+)
+
+SYSTEM_DISK_USAGE = Gauge(
+    "system_disk_usage_percent",
+    "Disk space in use on the sampled path",
+    multiprocess_mode="livemax",
+)
+
+
+# Histograms whose buckets can be set with configure_histogram_buckets
+_HISTOGRAMS: Dict[str, ConfigurableHistogram] = {
+    "http_request_duration_seconds": REQUEST_LATENCY,
+    "http_request_cpu_seconds": REQUEST_CPU_TIME,
+    "http_request_allocated_bytes": REQUEST_ALLOCATED_BYTES,
+    **{
+        definition.export_name or name: CATALOG_METRICS[name]
+        for name, definition in METRIC_CATALOG.items()
+        if definition.kind == "histogram"
+    },
+}
+
+
+def configure_histogram_buckets(buckets: Dict[str, List[float]]) -> None:
+    """Set the buckets of histograms by metric name.
+
+    Call at startup, before anything is recorded in those histograms.
+    """
+    for name, bounds in buckets.items():
+        histogram = _HISTOGRAMS.get(name)
+        if histogram is None:
+            raise ValueError(
+                f"Unknown histogram {name!r}, expected one of {sorted(_HISTOGRAMS)}"
+            )
+        histogram.configure(bounds)
 
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Middleware for collecting Prometheus metrics."""
+    """Middleware for collecting Prometheus metrics.
+
+    Requests are labelled with the matched route template, not the URL
+    path, so the number of series stays bounded. Warmup requests are not
+    recorded.
+    """
 
     async def dispatch(self, request: Request, call_next):
+        if warmup_request.get():
+            return await call_next(request)
         method = request.method
-        path = request.url.path
 
         # Track in-progress requests
         REQUESTS_IN_PROGRESS.labels(method=method).inc()
 
         # Time the request
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             response = await call_next(request)
@@ -56,11 +291,17 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
             raise e
         finally:
             # Record response time
-            duration = time.time() - start_time
-            REQUEST_LATENCY.labels(method=method, endpoint=path).observe(duration)
+            duration_ns = time.perf_counter_ns() - start_ns
+            endpoint = route_template(request.scope)
+            REQUEST_LATENCY.labels(method=method, endpoint=endpoint).observe(
+                duration_ns / 1e9
+            )
+            REQUEST_LATENCY_HDR.labels(method, endpoint).record(duration_ns)
 
             # Count total requests
-            REQUEST_COUNT.labels(method=method, endpoint=path, status=status_code).inc()
+            REQUEST_COUNT.labels(
+                method=method, endpoint=endpoint, status=status_code
+            ).inc()
 
             # Track in-progress requests
             REQUESTS_IN_PROGRESS.labels(method=method).dec()
@@ -1,7 +1,7 @@
-import time
 import functools
+from time import perf_counter_ns
 from typing import Callable, Any
-from .metrics import SERVICE_OPERATIONS, SERVICE_OPERATION_LATENCY, SERVICES_COUNT
+from .metric_recorder import OperationMetrics
 from .logging_context import get_contextual_logger
 
 logger = get_contextual_logger(__name__)
@@ -11,38 +11,28 @@ def track_operation(operation_name: str):
     """
     Decorator to track service operations with Prometheus metrics.
 
+    The metric children are bound once, when the decorator is built.
+
     Args:
         operation_name: The name of the operation to track (e.g., "get_service", "create_service")
     """
+    metrics = OperationMetrics(operation_name)
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start_time = time.time()
+            start_ns = perf_counter_ns()
 
             try:
                 result = func(*args, **kwargs)
-
-                # Record success metric
-                SERVICE_OPERATIONS.labels(
-                    operation=operation_name, status="success"
-                ).inc()
-
-                return result
-            except Exception as e:
-                # Record failure metric
-                SERVICE_OPERATIONS.labels(
-                    operation=operation_name, status="error"
-                ).inc()
-
-                # Re-raise the exception
+            except Exception:
+                # Record failure metric, then re-raise the exception
+                metrics.record(perf_counter_ns() - start_ns, success=False)
                 raise
-            finally:
-                # Record operation duration
-                duration = time.time() - start_time
-                SERVICE_OPERATION_LATENCY.labels(operation=operation_name).observe(
-                    duration
-                )
+
+            # Record success metric
+            metrics.record(perf_counter_ns() - start_ns, success=True)
+            return result
 
         return wrapper
 
@@ -53,38 +43,28 @@ def track_async_operation(operation_name: str):
     """
     Decorator to track asynchronous service operations with Prometheus metrics.
 
+    The metric children are bound once, when the decorator is built.
+
     Args:
         operation_name: The name of the operation to track (e.g., "get_service", "create_service")
     """
+    metrics = OperationMetrics(operation_name)
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            start_time = time.time()
+            start_ns = perf_counter_ns()
 
             try:
                 result = await func(*args, **kwargs)
-
-                # Record success metric
-                SERVICE_OPERATIONS.labels(
-                    operation=operation_name, status="success"
-                ).inc()
-
-                return result
-            except Exception as e:
-                # Record failure metric
-                SERVICE_OPERATIONS.labels(
-                    operation=operation_name, status="error"
-                ).inc()
-
-                # Re-raise the exception
+            except Exception:
+                # Record failure metric, then re-raise the exception
+                metrics.record(perf_counter_ns() - start_ns, success=False)
                 raise
-            finally:
-                # Record operation duration
-                duration = time.time() - start_time
-                SERVICE_OPERATION_LATENCY.labels(operation=operation_name).observe(
-                    duration
-                )
+
+            # Record success metric
+            metrics.record(perf_counter_ns() - start_ns, success=True)
+            return result
 
         return wrapper
 
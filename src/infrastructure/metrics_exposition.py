@@ -0,0 +1,80 @@
+"""Cached, off-loop rendering of the ``/metrics`` exposition.
+
+Rendering walks every metric series and, with several workers, reads all
+of their value files, so it is done in the threadpool rather than on the
+event loop. The result is kept for ``metrics_cache_seconds`` and shared
+by all scrapes in that window; concurrent scrapes of a stale cache wait
+for one rendering instead of starting their own. Each rendering is stored
+raw and gzip-compressed, and served compressed to scrapers that accept it.
+
+Scrapers that ask for ``application/openmetrics-text`` get the OpenMetrics
+format, everyone else the classic text format.
+"""
+
+import asyncio
+import gzip
+import time
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+
+from .content_encoding import accepts_gzip
+from .metric_recorder import flush_metrics
+from .multiprocess_metrics import generate_metrics
+
+DEFAULT_CACHE_SECONDS = 1.0
+
+TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def _render(openmetrics: bool) -> Tuple[bytes, bytes]:
+    """Render the exposition and its compressed form; runs off the loop."""
+    flush_metrics()
+    raw = generate_metrics(openmetrics)
+    return raw, gzip.compress(raw, compresslevel=6, mtime=0)
+
+
+class MetricsExposition:
+    """Serves ``/metrics`` from a short-lived cache, one entry per format."""
+
+    def __init__(self, cache_seconds: float = DEFAULT_CACHE_SECONDS):
+        """Initialize with renderings reused for ``cache_seconds``, 0 to disable."""
+        self.cache_seconds = cache_seconds
+        # Per format: (rendered at, raw, gzipped)
+        self._cache: Dict[bool, Tuple[float, bytes, bytes]] = {}
+        self._locks = {False: asyncio.Lock(), True: asyncio.Lock()}
+
+    def _fresh(self, openmetrics: bool) -> Optional[Tuple[bytes, bytes]]:
+        entry = self._cache.get(openmetrics)
+        if entry is None or time.monotonic() - entry[0] >= self.cache_seconds:
+            return None
+        return entry[1], entry[2]
+
+    async def render(self, openmetrics: bool) -> Tuple[bytes, bytes]:
+        """The current exposition, raw and gzipped, rendering it if stale."""
+        rendered = self._fresh(openmetrics)
+        if rendered is not None:
+            return rendered
+        async with self._locks[openmetrics]:
+            # Another scrape may have rendered it while this one waited
+            rendered = self._fresh(openmetrics)
+            if rendered is None:
+                started = time.monotonic()
+                rendered = await run_in_threadpool(_render, openmetrics)
+                self._cache[openmetrics] = (started, *rendered)
+            return rendered
+
+    async def serve(self, request: Request) -> Response:
+        """Serve the exposition in the negotiated format and encoding."""
+        openmetrics = "application/openmetrics-text" in request.headers.get(
+            "accept", ""
+        )
+        raw, gzipped = await self.render(openmetrics)
+        media_type = OPENMETRICS_CONTENT_TYPE if openmetrics else TEXT_CONTENT_TYPE
+        headers = {"Vary": "Accept, Accept-Encoding"}
+        if accepts_gzip(request.headers.get("accept-encoding", "")):
+            headers["Content-Encoding"] = "gzip"
+            return Response(gzipped, media_type=media_type, headers=headers)
+        return Response(raw, media_type=media_type, headers=headers)
@@ -1,20 +1,51 @@
 import logging
 import time
 import uuid
-from typing import Callable
+from typing import Any, Callable, Dict, Optional
 from fastapi import FastAPI, Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.middleware.cors import CORSMiddleware
-from .metrics import PrometheusMiddleware
+from .metrics import REQUEST_ALLOCATED_BYTES, REQUEST_CPU_TIME, PrometheusMiddleware
 from .logging_context import get_contextual_logger, request_id
+from .request_accounting import RequestUsage, get_request_accounting
+from .route_templates import route_template
+from .tracing import SPAN_KIND_SERVER, STATUS_ERROR, Span
+from .warmup_context import warmup_request
 
 logger = get_contextual_logger(__name__)
 
 
 class RequestTrackingMiddleware(BaseHTTPMiddleware):
-    """Middleware for tracking requests with unique IDs and logging."""
+    """Middleware for tracking requests with unique IDs and logging.
+
+    Requests slower than ``slow_request_threshold_ms`` are logged at
+    WARNING. With request accounting configured, the CPU time and sampled
+    allocations of each request are recorded per route and logged.
+    Warmup requests are logged with ``warmup`` set and never accounted.
+    """
+
+    def __init__(self, app: Any, slow_request_threshold_ms: Optional[float] = None):
+        super().__init__(app)
+        self.slow_request_threshold_ms = slow_request_threshold_ms
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        # Root span of the request's trace; operations become its children
+        with Span(
+            f"{request.method} {request.url.path}",
+            {"http.method": request.method, "http.target": request.url.path},
+            kind=SPAN_KIND_SERVER,
+        ) as span:
+            response = await self._track(request, call_next)
+            # Name the span after the route so traces group by endpoint
+            route = route_template(request.scope)
+            span.name = f"{request.method} {route}"
+            span.set_attribute("http.route", route)
+            span.set_attribute("http.status_code", response.status_code)
+            if response.status_code >= 500:
+                span.status_code = STATUS_ERROR
+            return response
+
+    async def _track(self, request: Request, call_next: Callable) -> Response:
         # Generate request ID and set in context
         req_id = str(uuid.uuid4())
         request.state.request_id = req_id
@@ -22,16 +53,19 @@ class RequestTrackingMiddleware(BaseHTTPMiddleware):
 
         # Start timing the request
         start_time = time.time()
+        warmup = warmup_request.get()
+        accounting = None if warmup else get_request_accounting()
+        usage = accounting.begin() if accounting is not None else None
 
         # Log the incoming request with context
-        logger.info(
-            "Request started",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "client_host": request.client.host if request.client else None,
-            },
-        )
+        extra: Dict[str, Any] = {
+            "method": request.method,
+            "path": request.url.path,
+            "client_host": request.client.host if request.client else None,
+        }
+        if warmup:
+            extra["warmup"] = True
+        logger.info("Request started", extra=extra)
 
         try:
             # Process the request
@@ -43,16 +77,25 @@ class RequestTrackingMiddleware(BaseHTTPMiddleware):
             # Add request ID to response headers
             response.headers["X-Request-ID"] = req_id
 
+            extra = {
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "duration_ms": int(duration * 1000),
+            }
+            if warmup:
+                extra["warmup"] = True
+            if usage is not None:
+                extra.update(self._record_usage(request, usage))
+
             # Log the completed request with context
-            logger.info(
-                "Request completed",
-                extra={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_ms": int(duration * 1000),
-                },
+            slow = (
+                not warmup
+                and self.slow_request_threshold_ms is not None
+                and duration * 1000 >= self.slow_request_threshold_ms
             )
+            log = logger.warning if slow else logger.info
+            log("Request completed", extra=extra)
 
             return response
 
@@ -69,9 +112,26 @@ class RequestTrackingMiddleware(BaseHTTPMiddleware):
             )
             raise
         finally:
+            if usage is not None:
+                accounting.end(usage)
             # Clear request ID from context
             request_id.set(None)
 
+    @staticmethod
+    def _record_usage(request: Request, usage: RequestUsage) -> Dict[str, Any]:
+        """Record a request's resource usage per route; return log fields."""
+        endpoint = route_template(request.scope)
+        REQUEST_CPU_TIME.labels(method=request.method, endpoint=endpoint).observe(
+            usage.cpu_ns / 1e9
+        )
+        fields: Dict[str, Any] = {"cpu_ms": round(usage.cpu_ns / 1e6, 3)}
+        if usage.alloc_bytes is not None:
+            REQUEST_ALLOCATED_BYTES.labels(
+                method=request.method, endpoint=endpoint
+            ).observe(usage.alloc_bytes)
+            fields["alloc_bytes"] = usage.alloc_bytes
+        return fields
+
 
 def setup_middlewares(app: FastAPI, settings=None) -> None:
     """Set up all application middlewares."""
@@ -79,7 +139,12 @@ def setup_middlewares(app: FastAPI, settings=None) -> None:
     app.add_middleware(PrometheusMiddleware)
 
     # Add request tracking middleware
-    app.add_middleware(RequestTrackingMiddleware)
+    app.add_middleware(
+        RequestTrackingMiddleware,
+        slow_request_threshold_ms=(
+            settings.slow_request_threshold_ms if settings else None
+        ),
+    )
 
     # Add CORS middleware if settings are provided
     if settings:
@@ -0,0 +1,194 @@
+"""Prometheus metrics aggregated across worker processes.
+
+By default metrics live in the memory of the process that records them, so
+with several workers a scrape only sees the worker that answered it.
+Setting the ``PROMETHEUS_MULTIPROC_DIR`` environment variable switches
+``prometheus_client`` to multi-process mode: every worker writes its values
+to memory-mapped files in that directory, and ``/metrics`` aggregates the
+files of all workers.
+
+The variable has to be set before ``prometheus_client`` is first imported,
+so it is read from the environment rather than from ``Settings``; worker
+processes inherit it. The directory must be emptied before the workers
+start (``clear_multiprocess_dir``), never while they run.
+
+How each gauge is aggregated is declared with its ``multiprocess_mode`` in
+``metrics.py``. Counters and histograms are summed; their files outlive
+the worker so that totals never go backwards. Gauges with a ``live`` mode
+only count workers that are still running: a worker removes its files on
+shutdown, and files of workers that died without doing so are removed
+when ``/metrics`` is scraped.
+
+The high-resolution latency histograms behind ``/debug/latency`` are not
+``prometheus_client`` metrics. Each worker writes a snapshot of them to
+the same directory periodically, and they are merged when queried.
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from prometheus_client import REGISTRY, CollectorRegistry, generate_latest
+from prometheus_client.multiprocess import MultiProcessCollector, mark_process_dead
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
+
+from .latency_histogram import (
+    LatencyHistogram,
+    merge_snapshots,
+    read_snapshots,
+    write_snapshot,
+)
+from .metrics import LATENCY_FAMILIES
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Files of live-mode gauges end in the pid of the worker that wrote them
+_LIVE_GAUGE_FILE = re.compile(r"^gauge_live[a-z]+_(\d+)\.db$")
+
+LATENCY_SNAPSHOT_GLOB = "latency_*.json"
+
+DEFAULT_LATENCY_SNAPSHOT_INTERVAL_SECONDS = 10.0
+
+_registry: Optional[CollectorRegistry] = None
+
+
+def multiprocess_dir() -> Optional[str]:
+    """The directory shared by the workers, or None in single-process mode."""
+    return os.environ.get(MULTIPROC_DIR_ENV) or None
+
+
+def clear_multiprocess_dir() -> None:
+    """Remove the value files of a previous run.
+
+    Call once from the process that starts the workers, before they start.
+    """
+    directory = multiprocess_dir()
+    if directory is None:
+        return
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    for db_file in path.glob("*.db"):
+        db_file.unlink()
+    for snapshot_file in path.glob(LATENCY_SNAPSHOT_GLOB):
+        snapshot_file.unlink()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but belongs to another user
+        return True
+    return True
+
+
+def mark_dead_workers() -> List[int]:
+    """Remove the live-gauge files of workers that are no longer running."""
+    directory = multiprocess_dir()
+    if directory is None:
+        return []
+    dead = set()
+    for name in os.listdir(directory):
+        match = _LIVE_GAUGE_FILE.match(name)
+        if match is not None:
+            pid = int(match.group(1))
+            if pid not in dead and not _pid_alive(pid):
+                dead.add(pid)
+    for pid in dead:
+        mark_process_dead(pid, directory)
+    return sorted(dead)
+
+
+def mark_worker_dead() -> None:
+    """Remove this worker's live-gauge files; call on worker shutdown."""
+    directory = multiprocess_dir()
+    if directory is not None:
+        mark_process_dead(os.getpid(), directory)
+
+
+def metrics_registry() -> CollectorRegistry:
+    """The registry ``/metrics`` exposes: this process's or all workers'."""
+    global _registry
+    if multiprocess_dir() is None:
+        return REGISTRY
+    if _registry is None:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        _registry = registry
+    return _registry
+
+
+def generate_metrics(openmetrics: bool = False) -> bytes:
+    """Render the exposition for ``/metrics``, classic text or OpenMetrics."""
+    if multiprocess_dir() is not None:
+        mark_dead_workers()
+    if openmetrics:
+        return openmetrics_exposition.generate_latest(metrics_registry())
+    return generate_latest(metrics_registry())
+
+
+def write_latency_snapshot() -> None:
+    """Write this worker's latency histograms for other workers to merge."""
+    directory = multiprocess_dir()
+    if directory is not None:
+        path = Path(directory) / f"latency_{os.getpid()}.json"
+        write_snapshot(path, LATENCY_FAMILIES)
+
+
+def collect_latency() -> Dict[str, Dict[Tuple[str, ...], LatencyHistogram]]:
+    """Latency histograms per series, merged over all workers if configured.
+
+    Other workers' histograms are as recent as their last snapshot.
+    """
+    directory = multiprocess_dir()
+    if directory is None:
+        return {family.name: dict(family.children()) for family in LATENCY_FAMILIES}
+    write_latency_snapshot()
+    return merge_snapshots(
+        read_snapshots(sorted(Path(directory).glob(LATENCY_SNAPSHOT_GLOB)))
+    )
+
+
+class LatencySnapshotWriter:
+    """Background thread writing this worker's latency snapshot periodically."""
+
+    def __init__(self, interval: float = DEFAULT_LATENCY_SNAPSHOT_INTERVAL_SECONDS):
+        """Start writing every ``interval`` seconds."""
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="latency-snapshots", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            write_latency_snapshot()
+
+    def stop(self) -> None:
+        """Stop the thread after writing a final snapshot."""
+        self._stop.set()
+        self._thread.join()
+        write_latency_snapshot()
+
+
+_snapshot_writer: Optional[LatencySnapshotWriter] = None
+
+
+def start_latency_snapshots(interval: float) -> None:
+    """Share latency histograms with other workers, in multi-process mode."""
+    global _snapshot_writer
+    if multiprocess_dir() is not None and _snapshot_writer is None:
+        _snapshot_writer = LatencySnapshotWriter(interval)
+
+
+def stop_latency_snapshots() -> None:
+    """Write a final latency snapshot and stop sharing."""
+    global _snapshot_writer
+    writer, _snapshot_writer = _snapshot_writer, None
+    if writer is not None:
+        writer.stop()
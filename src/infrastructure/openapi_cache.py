@@ -0,0 +1,239 @@
+"""Precomputed, precompressed OpenAPI schema and optional interactive docs.
+
+FastAPI builds the OpenAPI schema lazily on the first ``/openapi.json`` or
+``/docs`` hit, which stalls that request on every pod. The schema can instead
+be built once at image build time::
+
+    python -m src.infrastructure.openapi_cache [--output PATH]
+
+At startup the file is loaded if its routes fingerprint matches the running
+application; otherwise the schema is generated on first use as before. Either
+way it is kept in memory both raw and gzip-compressed.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from fastapi import FastAPI, Request, Response
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+
+from src.config.settings import Settings
+from .content_encoding import accepts_gzip
+from .logging_context import get_contextual_logger
+from .route_templates import iter_routes
+
+logger = get_contextual_logger(__name__)
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / "config" / "openapi.json.gz"
+
+OPENAPI_URL = "/openapi.json"
+DOCS_URL = "/docs"
+DOCS_OAUTH2_REDIRECT_URL = "/docs/oauth2-redirect"
+REDOC_URL = "/redoc"
+
+# Root-level OpenAPI extension carrying the fingerprint the schema was built for
+FINGERPRINT_KEY = "x-routes-fingerprint"
+
+
+def _iter_route_signatures(routes: Sequence[Any], prefix: str = "") -> Iterator[str]:
+    """Describe every route, descending into included routers."""
+    for path, route in iter_routes(routes, prefix):
+        endpoint = getattr(route, "endpoint", None)
+        response_model = getattr(route, "response_model", None)
+        dependant = getattr(route, "dependant", None)
+        params = (
+            sorted(
+                f"{param.name}:{param.field_info.annotation!r}"
+                for param in (
+                    dependant.path_params
+                    + dependant.query_params
+                    + dependant.header_params
+                    + dependant.body_params
+                )
+            )
+            if dependant is not None
+            else []
+        )
+        yield repr(
+            (
+                path,
+                sorted(getattr(route, "methods", None) or ()),
+                getattr(endpoint, "__qualname__", None),
+                getattr(route, "status_code", None),
+                getattr(route, "include_in_schema", None),
+                params,
+                getattr(response_model, "__qualname__", None),
+                repr(getattr(response_model, "model_fields", None)),
+                repr(getattr(route, "responses", None)),
+                repr(getattr(route, "openapi_extra", None)),
+            )
+        )
+
+
+def routes_fingerprint(app: FastAPI) -> str:
+    """Hash everything the generated schema depends on, without generating it.
+
+    Covers app metadata and, per route, its path, methods, endpoint,
+    parameters and response model fields.
+    """
+    digest = hashlib.sha256(
+        repr((app.title, app.version, app.description, app.openapi_version)).encode()
+    )
+    for signature in _iter_route_signatures(app.routes):
+        digest.update(signature.encode())
+    return digest.hexdigest()
+
+
+class OpenAPICache:
+    """Serves the OpenAPI schema from memory, raw or gzip-compressed."""
+
+    def __init__(self, app: FastAPI, cache_path: Path = DEFAULT_CACHE_PATH):
+        """Initialize for an application whose routes are fully registered."""
+        self.app = app
+        self.cache_path = cache_path
+        self.fingerprint = routes_fingerprint(app)
+        self._raw: Optional[bytes] = None
+        self._gzipped: Optional[bytes] = None
+
+    @property
+    def etag(self) -> str:
+        """ETag identifying the current schema."""
+        return f'"{self.fingerprint}"'
+
+    def load(self) -> bool:
+        """Load the precomputed schema if it matches the running routes.
+
+        A missing, unreadable or stale file is logged and the schema is
+        generated on first use instead.
+        """
+        try:
+            gzipped = self.cache_path.read_bytes()
+            raw = gzip.decompress(gzipped)
+            schema = json.loads(raw)
+        except FileNotFoundError:
+            logger.info(
+                "No precomputed OpenAPI schema, will generate on first use",
+                extra={"path": str(self.cache_path)},
+            )
+            return False
+        except (OSError, EOFError, ValueError) as e:
+            # BadGzipFile is an OSError, JSONDecodeError a ValueError
+            logger.warning(
+                "Precomputed OpenAPI schema is unreadable, will generate on first use",
+                extra={"path": str(self.cache_path), "error": str(e)},
+            )
+            return False
+
+        if (
+            not isinstance(schema, dict)
+            or schema.get(FINGERPRINT_KEY) != self.fingerprint
+        ):
+            logger.warning(
+                "Precomputed OpenAPI schema is stale, will generate on first use",
+                extra={"path": str(self.cache_path)},
+            )
+            return False
+
+        self.app.openapi_schema = schema
+        self._raw, self._gzipped = raw, gzipped
+        logger.info("Loaded precomputed OpenAPI schema", extra={"bytes": len(raw)})
+        return True
+
+    def build(self) -> Tuple[bytes, bytes]:
+        """Generate the schema and its compressed form, caching both."""
+        if self._raw is None:
+            schema = self.app.openapi()
+            schema[FINGERPRINT_KEY] = self.fingerprint
+            self._raw = json.dumps(schema, separators=(",", ":")).encode()
+            self._gzipped = gzip.compress(self._raw, compresslevel=9, mtime=0)
+        return self._raw, self._gzipped
+
+    def write(self) -> Path:
+        """Write the compressed schema to the cache path."""
+        _, gzipped = self.build()
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_bytes(gzipped)
+        return self.cache_path
+
+    async def serve(self, request: Request) -> Response:
+        """Serve the schema, gzip-compressed when the client accepts it."""
+        raw, gzipped = self.build()
+        headers = {"ETag": self.etag, "Vary": "Accept-Encoding"}
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=headers)
+        if accepts_gzip(request.headers.get("accept-encoding", "")):
+            headers["Content-Encoding"] = "gzip"
+            return Response(gzipped, media_type="application/json", headers=headers)
+        return Response(raw, media_type="application/json", headers=headers)
+
+
+def setup_openapi(app: FastAPI, settings: Settings) -> OpenAPICache:
+    """Register the cached schema route and, if enabled, the docs pages.
+
+    Must run after all application routes are registered. The app has to be
+    created with ``openapi_url``, ``docs_url`` and ``redoc_url`` set to None.
+    """
+    cache_path = (
+        Path(settings.openapi_cache_path)
+        if settings.openapi_cache_path
+        else DEFAULT_CACHE_PATH
+    )
+    cache = OpenAPICache(app, cache_path)
+    cache.load()
+    app.state.openapi_cache = cache
+
+    app.add_api_route(OPENAPI_URL, cache.serve, include_in_schema=False)
+
+    if settings.docs_enabled:
+
+        async def swagger_ui() -> Response:
+            return get_swagger_ui_html(
+                openapi_url=OPENAPI_URL,
+                title=f"{app.title} - Swagger UI",
+                oauth2_redirect_url=DOCS_OAUTH2_REDIRECT_URL,
+            )
+
+        async def swagger_ui_redirect() -> Response:
+            return get_swagger_ui_oauth2_redirect_html()
+
+        async def redoc() -> Response:
+            return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
+
+        app.add_api_route(DOCS_URL, swagger_ui, include_in_schema=False)
+        app.add_api_route(
+            DOCS_OAUTH2_REDIRECT_URL, swagger_ui_redirect, include_in_schema=False
+        )
+        app.add_api_route(REDOC_URL, redoc, include_in_schema=False)
+
+    return cache
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Build step: precompute the OpenAPI schema for the configured app."""
+    # Imported here to avoid a circular import with rest_server
+    from .app_bootstrap import load_settings
+    from .rest_server import create_app
+
+    parser = argparse.ArgumentParser(description="Precompute the OpenAPI schema")
+    parser.add_argument("--output", type=Path, help="Where to write the schema")
+    args = parser.parse_args(argv)
+
+    settings = load_settings()
+    app = create_app(settings)
+    cache = app.state.openapi_cache
+    if args.output:
+        cache.cache_path = args.output
+    path = cache.write()
+    print(f"Wrote OpenAPI schema ({cache.fingerprint[:12]}) to {path}")
+
+
+if __name__ == "__main__":
+    main()
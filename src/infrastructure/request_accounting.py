@@ -0,0 +1,206 @@
+"""Per-request CPU time and memory allocation accounting.
+
+Requests on one event loop interleave, so the loop thread's CPU time
+between a request's start and end includes every other request served
+meanwhile. Work is instead charged per task step: a task factory wraps
+the coroutine of every task created inside an accounted request (which
+includes the tasks ``BaseHTTPMiddleware`` runs the rest of the chain in)
+and adds the thread CPU time of each of its steps to that request. The
+wrapper reports the wrapped coroutine's ``cr_*`` state, which anyio reads
+to deliver cancellation.
+Tasks created outside accounted requests are left unwrapped. Work the
+endpoint hands to a threadpool is not counted.
+
+Allocations are measured with ``tracemalloc``, which slows down every
+allocation in the process while it runs. It is therefore only started
+for a sampled fraction of requests and stopped again once no sampled
+request is in flight. Each step counts how far the traced memory rose
+above its level at the start of the step, so memory allocated and freed
+within a step is included.
+"""
+
+import asyncio
+import random
+import time
+import tracemalloc
+from collections.abc import Coroutine
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from src.config.settings import Settings
+
+
+class RequestUsage:
+    """Resources used by one request so far."""
+
+    __slots__ = ("cpu_ns", "alloc_bytes")
+
+    def __init__(self, trace_memory: bool):
+        """Start at zero; ``alloc_bytes`` stays None unless memory is traced."""
+        self.cpu_ns = 0
+        self.alloc_bytes: Optional[int] = 0 if trace_memory else None
+
+
+_current_usage: ContextVar[Optional[RequestUsage]] = ContextVar(
+    "request_usage", default=None
+)
+
+
+class _AccountedCoroutine(Coroutine):
+    """Drives a task's coroutine, charging each step to a request."""
+
+    __slots__ = ("_coro", "_usage")
+
+    def __init__(self, coro: Any, usage: RequestUsage):
+        self._coro = coro
+        self._usage = usage
+
+    def _step(self, method: Any, *args: Any) -> Any:
+        usage = self._usage
+        trace_memory = usage.alloc_bytes is not None and tracemalloc.is_tracing()
+        if trace_memory:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.thread_time_ns()
+        try:
+            return method(*args)
+        finally:
+            usage.cpu_ns += time.thread_time_ns() - start
+            if trace_memory:
+                usage.alloc_bytes += max(0, tracemalloc.get_traced_memory()[1] - before)
+
+    def send(self, value: Any) -> Any:
+        return self._step(self._coro.send, value)
+
+    def throw(self, *args: Any) -> Any:
+        return self._step(self._coro.throw, *args)
+
+    def close(self) -> None:
+        self._coro.close()
+
+    def __await__(self) -> Any:
+        return self._coro.__await__()
+
+    # Task introspection, e.g. anyio delivering cancellation, reads the
+    # coroutine's state; report the wrapped coroutine's
+    @property
+    def cr_running(self) -> bool:
+        return self._coro.cr_running
+
+    @property
+    def cr_suspended(self) -> bool:
+        return self._coro.cr_suspended
+
+    @property
+    def cr_frame(self) -> Any:
+        return self._coro.cr_frame
+
+    @property
+    def cr_await(self) -> Any:
+        return self._coro.cr_await
+
+    @property
+    def cr_code(self) -> Any:
+        return self._coro.cr_code
+
+    @property
+    def cr_origin(self) -> Any:
+        return self._coro.cr_origin
+
+    def __repr__(self) -> str:
+        return repr(self._coro)
+
+
+class RequestAccounting:
+    """Which requests are accounted, and the task factory doing it."""
+
+    def __init__(self, cpu: bool, alloc_sample_rate: float):
+        """Account CPU time of all requests, allocations of a fraction."""
+        self.cpu = cpu
+        self.alloc_sample_rate = alloc_sample_rate
+        self._traced_requests = 0
+        self._started_tracemalloc = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._previous_factory: Any = None
+
+    def install(self) -> None:
+        """Install the task factory on the running loop."""
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._previous_factory = loop.get_task_factory()
+        loop.set_task_factory(self._create_task)
+
+    def uninstall(self) -> None:
+        """Restore the loop's previous task factory and stop tracing."""
+        if self._loop is not None:
+            self._loop.set_task_factory(self._previous_factory)
+            self._loop = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _create_task(self, loop: Any, coro: Any, **kwargs: Any) -> asyncio.Task:
+        context = kwargs.get("context")
+        usage = (context.get(_current_usage) if context else None) or (
+            _current_usage.get()
+        )
+        # Only native coroutines can be proxied faithfully
+        if usage is not None and hasattr(coro, "cr_frame"):
+            coro = _AccountedCoroutine(coro, usage)
+        if self._previous_factory is not None:
+            return self._previous_factory(loop, coro, **kwargs)
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    def begin(self) -> Optional[RequestUsage]:
+        """Start accounting the current request, if it is selected."""
+        trace_memory = (
+            self.alloc_sample_rate > 0 and random.random() < self.alloc_sample_rate
+        )
+        if not (self.cpu or trace_memory):
+            return None
+        if trace_memory:
+            self._traced_requests += 1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+        usage = RequestUsage(trace_memory)
+        _current_usage.set(usage)
+        return usage
+
+    def end(self, usage: RequestUsage) -> None:
+        """Stop accounting a request started with ``begin``."""
+        _current_usage.set(None)
+        if usage.alloc_bytes is not None:
+            self._traced_requests -= 1
+            if self._traced_requests == 0 and self._started_tracemalloc:
+                # Tracing costs every allocation; only run it while needed
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+
+_accounting: Optional[RequestAccounting] = None
+
+
+def get_request_accounting() -> Optional[RequestAccounting]:
+    """The active accounting, or None when it is off."""
+    return _accounting
+
+
+def configure_request_accounting(settings: Settings) -> None:
+    """Start accounting requests on the running loop, if configured."""
+    global _accounting
+    if not (settings.request_cpu_accounting or settings.request_alloc_sample_rate > 0):
+        return
+    accounting = RequestAccounting(
+        settings.request_cpu_accounting, settings.request_alloc_sample_rate
+    )
+    accounting.install()
+    _accounting = accounting
+
+
+def shutdown_request_accounting() -> None:
+    """Stop accounting requests."""
+    global _accounting
+    accounting, _accounting = _accounting, None
+    if accounting is not None:
+        accounting.uninstall()
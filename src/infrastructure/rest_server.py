@@ -1,10 +1,37 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, PlainTextResponse
-from prometheus_client import generate_latest
+from fastapi.responses import JSONResponse
 from src.config.settings import Settings
 from src.infrastructure.container import Container
+from src.infrastructure.debug_routes import setup_debug_routes
+from src.infrastructure.metric_recorder import (
+    configure_metric_recording,
+    shutdown_metric_recording,
+)
 from src.infrastructure.middleware import setup_middlewares
+from src.infrastructure.metrics import configure_histogram_buckets
+from src.infrastructure.metrics_exposition import MetricsExposition
+from src.infrastructure.multiprocess_metrics import (
+    mark_worker_dead,
+    start_latency_snapshots,
+    stop_latency_snapshots,
+)
+from src.infrastructure.openapi_cache import setup_openapi
+from src.infrastructure.request_accounting import (
+    configure_request_accounting,
+    shutdown_request_accounting,
+)
+from src.infrastructure.runtime_monitor import (
+    start_runtime_monitor,
+    stop_runtime_monitor,
+)
+from src.infrastructure.system_metrics import (
+    start_system_metrics,
+    stop_system_metrics,
+)
+from src.infrastructure.tracing import configure_tracing, shutdown_tracing
+from src.infrastructure.warmup import warm_up
 from src.infrastructure.logging_context import get_contextual_logger
 from src.interface_adapters.controller_factory import ControllerFactory
 from src.domain.exceptions import (
@@ -29,13 +56,44 @@ async def lifespan(app: FastAPI):
 
     # Initialize container resources
     await app.state.container.init_resources()
+    configure_tracing(app.state.settings)
+    configure_histogram_buckets(app.state.settings.metric_buckets)
+    configure_metric_recording(app.state.settings)
+    start_latency_snapshots(app.state.settings.latency_snapshot_interval_seconds)
+    start_runtime_monitor(app.state.settings)
+    configure_request_accounting(app.state.settings)
+    start_system_metrics(app.state.settings)
     logger.info("Application started successfully")
 
+    # Warm up in the background; /health/ready reports ready once it is done
+    settings: Settings = app.state.settings
+    warmup_task = None
+    if settings.warmup_enabled:
+        app.state.ready = False
+        warmup_task = asyncio.create_task(
+            warm_up(app, settings.warmup_iterations, settings.warmup_timeout_seconds)
+        )
+    else:
+        app.state.ready = True
+
     yield  # Application runs here
 
     logger.info("Shutting down application")
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+        try:
+            await warmup_task
+        except asyncio.CancelledError:
+            pass
     if hasattr(app.state, "container"):
         await app.state.container.cleanup()
+    shutdown_tracing()
+    shutdown_metric_recording()
+    stop_latency_snapshots()
+    await stop_runtime_monitor()
+    shutdown_request_accounting()
+    stop_system_metrics()
+    mark_worker_dead()
     logger.info("Application shutdown complete")
 
 
@@ -47,7 +105,13 @@ def create_app(settings: Settings) -> FastAPI:
         version=settings.app_version,
         debug=settings.debug,
         lifespan=lifespan,
+        # Schema and docs routes are registered by setup_openapi below
+        openapi_url=None,
+        docs_url=None,
+        redoc_url=None,
     )
+    app.state.settings = settings
+    app.state.ready = False
 
     # Set up middleware using the dedicated function
     setup_middlewares(app, settings)
@@ -70,16 +134,22 @@ def create_app(settings: Settings) -> FastAPI:
         return JSONResponse(status_code=409, content={"detail": str(exc)})
 
     # Add metrics endpoint
+    exposition = MetricsExposition(settings.metrics_cache_seconds)
+
     @app.get("/metrics")
-    async def metrics():
-        """Expose Prometheus metrics."""
-        return PlainTextResponse(generate_latest())
+    async def metrics(request: Request):
+        """Expose Prometheus metrics, aggregated over workers if configured."""
+        return await exposition.serve(request)
 
     # Initialize a temporary container for initial setup
     # The actual container will be injected by the AppServer later
     container = app.state.container if hasattr(app.state, "container") else Container()
 
     # Use the controller factory to register controllers
-    ControllerFactory.create_and_register_controllers(app, container)
+    ControllerFactory.create_and_register_controllers(app, container, settings)
+    setup_debug_routes(app, settings)
+
+    # Serve the precomputed OpenAPI schema; must follow route registration
+    setup_openapi(app, settings)
 
     return app
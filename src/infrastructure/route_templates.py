@@ -0,0 +1,60 @@
+"""Resolve requests to the path template of the route that handled them.
+
+Labelling metrics and spans with the raw URL path creates a new series
+for every ``/v1/services/{id}``; the route template keeps that bounded.
+The router already records the matched route in the ASGI scope, but
+included routers are kept unflattened, so that route's own path lacks the
+include prefix. The full template of every route is therefore computed
+once per application and looked up per request, keyed by route identity
+(routes define ``__eq__`` and are not hashable).
+"""
+
+from typing import Any, Dict, Iterator, MutableMapping, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+# Label for requests that matched no route, so unknown paths share one series
+UNMATCHED_ROUTE = "<unmatched>"
+
+_templates: "MutableMapping[Any, Dict[int, str]]" = WeakKeyDictionary()
+
+
+def iter_routes(routes: Sequence[Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yield every route with its full path, descending into included routers."""
+    for route in routes:
+        original_router = getattr(route, "original_router", None)
+        if original_router is not None:
+            # Newer FastAPI versions keep included routers unflattened
+            include_prefix = getattr(route.include_context, "prefix", "")
+            yield from iter_routes(original_router.routes, prefix + include_prefix)
+            continue
+        yield prefix + getattr(route, "path", ""), route
+
+
+def _build_templates(app: Any) -> Dict[int, str]:
+    templates: Dict[int, str] = {}
+    for path, route in iter_routes(app.routes):
+        # A router included twice keeps the first prefix
+        templates.setdefault(id(route), path)
+    return templates
+
+
+def route_template(scope: MutableMapping[str, Any]) -> str:
+    """Return the path template of the route that handled the request.
+
+    Must be called after routing; requests that matched no route resolve
+    to ``UNMATCHED_ROUTE``.
+    """
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    app = scope["app"]
+    templates = _templates.get(app)
+    template = templates.get(id(route)) if templates is not None else None
+    if template is None:
+        # First request, or routes were added since the map was built
+        templates = _templates[app] = _build_templates(app)
+        template = templates.get(id(route))
+        if template is None:
+            template = getattr(route, "path", UNMATCHED_ROUTE)
+            templates[id(route)] = template
+    return template
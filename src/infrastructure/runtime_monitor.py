@@ -0,0 +1,260 @@
+"""Event loop lag, slow callbacks and garbage collection pauses.
+
+When tail latency spikes, the loop was either blocked by a synchronous
+call or paused by the garbage collector. This monitor records both:
+
+- Loop lag: a task sleeps ``interval`` seconds at a time and records how
+  much later than that it wakes up.
+- Slow callbacks: a second task beats every quarter of
+  ``slow_callback_threshold_ms``, independently of the lag interval. A
+  watchdog thread notices when no beat has run for the threshold and
+  snapshots the loop thread's stack while the blocking callback is still
+  running; one snapshot is taken per blocked episode. A callback that
+  blocks for the threshold always stalls the beat that long, wherever it
+  starts. The stall also counts the idle time since the last beat, so
+  blocks down to three quarters of the threshold can be reported too. A
+  block the watchdog did not poll in time is recorded without a stack
+  when the beat resumes.
+- GC pauses: ``gc.callbacks`` times every collection per generation.
+
+The GC callback runs inside whichever thread triggered the collection,
+possibly while it holds a metric's lock, so it only updates plain
+counters and queues the pause; the lag task moves queued pauses into
+the Prometheus histogram.
+"""
+
+import asyncio
+import gc
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.config.settings import Settings
+from .logging_context import get_contextual_logger
+from .metrics import EVENT_LOOP_LAG, EVENT_LOOP_SLOW_CALLBACKS, GC_PAUSE
+
+logger = get_contextual_logger(__name__)
+
+# Innermost frames kept per slow callback stack
+STACK_LIMIT = 30
+
+# Lag samples kept for the recent maximum
+_LAG_WINDOW = 120
+
+
+@dataclass
+class SlowCallback:
+    """The loop thread's stack while one callback blocked the loop."""
+
+    timestamp: datetime
+    blocked_ms: float  # Updated to the full stall once the loop resumes
+    stack: List[str] = field(default_factory=list)
+
+
+class RuntimeMonitor:
+    """Measures loop lag and GC pauses of the running event loop's process."""
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        slow_callback_threshold_ms: float = 100.0,
+        history: int = 20,
+    ):
+        """Initialize a stopped monitor."""
+        self.interval = interval
+        self.slow_callback_threshold = slow_callback_threshold_ms / 1000
+        self.slow_callbacks: Deque[SlowCallback] = deque(maxlen=history)
+        self.slow_callback_count = 0
+        self._lags: Deque[float] = deque(maxlen=_LAG_WINDOW)
+        self._beat_interval = self.slow_callback_threshold / 4
+        self._heartbeat = 0.0
+        self._reported_heartbeat = -1.0
+        self._open_event: Optional[SlowCallback] = None
+        self._heartbeat_lock = threading.Lock()
+        # Per generation: collections, objects collected, pause ns, max pause ns
+        self._gc_stats = [[0, 0, 0, 0] for _ in range(3)]
+        self._gc_started_ns = 0
+        self._gc_pending: Deque[Tuple[int, int]] = deque()
+        self._gc_pause = [GC_PAUSE.labels(generation=str(gen)) for gen in range(3)]
+        self._loop_thread_id = 0
+        self._tasks: List[asyncio.Task] = []
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Start monitoring; call from the event loop's thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        gc.callbacks.append(self._on_gc)
+        loop = asyncio.get_running_loop()
+        self._tasks = [
+            loop.create_task(self._measure_lag()),
+            loop.create_task(self._beat()),
+        ]
+        self._stop.clear()
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+        for task in self._tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        self._drain_gc_pauses()
+
+    async def _measure_lag(self) -> None:
+        interval = self.interval
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            lag = max(0.0, now - started - interval)
+            self._lags.append(lag)
+            EVENT_LOOP_LAG.observe(lag)
+            self._drain_gc_pauses()
+
+    async def _beat(self) -> None:
+        threshold = self.slow_callback_threshold
+        while True:
+            await asyncio.sleep(self._beat_interval)
+            now = time.monotonic()
+            with self._heartbeat_lock:
+                previous, self._heartbeat = self._heartbeat, now
+                event, self._open_event = self._open_event, None
+                stalled = now - previous
+                missed = event is None and stalled >= threshold
+                if missed:
+                    self._reported_heartbeat = previous
+            if event is not None:
+                event.blocked_ms = max(event.blocked_ms, stalled * 1000)
+            elif missed:
+                event = SlowCallback(datetime.utcnow(), stalled * 1000)
+                self._record_slow_callback(event)
+
+    def _watch(self) -> None:
+        check_interval = max(0.005, self._beat_interval)
+        while not self._stop.wait(check_interval):
+            with self._heartbeat_lock:
+                heartbeat = self._heartbeat
+                stalled = time.monotonic() - heartbeat
+                if (
+                    stalled < self.slow_callback_threshold
+                    or heartbeat == self._reported_heartbeat
+                ):
+                    continue
+                self._reported_heartbeat = heartbeat
+                frame = sys._current_frames().get(self._loop_thread_id)
+                event = SlowCallback(datetime.utcnow(), stalled * 1000)
+                self._open_event = event
+            if frame is not None:
+                event.stack = [
+                    f"{entry.filename}:{entry.lineno} in {entry.name}"
+                    for entry in traceback.extract_stack(frame, limit=STACK_LIMIT)
+                ]
+            self._record_slow_callback(event)
+
+    def _record_slow_callback(self, event: SlowCallback) -> None:
+        stack = event.stack
+        self.slow_callbacks.append(event)
+        self.slow_callback_count += 1
+        EVENT_LOOP_SLOW_CALLBACKS.inc()
+        logger.warning(
+            "Event loop blocked by a slow callback",
+            extra={
+                "blocked_ms": round(event.blocked_ms, 1),
+                "location": stack[-1] if stack else None,
+            },
+        )
+
+    def _on_gc(self, phase: str, info: Dict[str, Any]) -> None:
+        if phase == "start":
+            self._gc_started_ns = time.perf_counter_ns()
+            return
+        pause_ns = time.perf_counter_ns() - self._gc_started_ns
+        generation = info["generation"]
+        stats = self._gc_stats[generation]
+        stats[0] += 1
+        stats[1] += info["collected"]
+        stats[2] += pause_ns
+        if pause_ns > stats[3]:
+            stats[3] = pause_ns
+        self._gc_pending.append((generation, pause_ns))
+
+    def _drain_gc_pauses(self) -> None:
+        pending = self._gc_pending
+        while pending:
+            generation, pause_ns = pending.popleft()
+            self._gc_pause[generation].observe(pause_ns / 1e9)
+
+    def summary(self) -> Dict[str, Any]:
+        """Current loop lag, recent slow callbacks and GC totals."""
+        lags = list(self._lags)
+        return {
+            "loop_lag_ms": lags[-1] * 1000 if lags else 0.0,
+            "loop_lag_max_ms": max(lags) * 1000 if lags else 0.0,
+            "slow_callbacks": self.slow_callback_count,
+            "recent_slow_callbacks": [
+                {
+                    "timestamp": event.timestamp,
+                    "blocked_ms": event.blocked_ms,
+                    "stack": event.stack,
+                }
+                for event in self.slow_callbacks
+            ],
+            "gc": {
+                str(generation): {
+                    "collections": collections,
+                    "collected": collected,
+                    "pause_total_ms": pause_ns / 1e6,
+                    "pause_max_ms": max_ns / 1e6,
+                }
+                for generation, (collections, collected, pause_ns, max_ns) in enumerate(
+                    self._gc_stats
+                )
+            },
+        }
+
+
+_monitor: Optional[RuntimeMonitor] = None
+
+
+def get_runtime_monitor() -> Optional[RuntimeMonitor]:
+    """The running monitor, or None if monitoring is off."""
+    return _monitor
+
+
+def start_runtime_monitor(settings: Settings) -> None:
+    """Start monitoring the running event loop if enabled."""
+    global _monitor
+    if not settings.runtime_monitor_enabled or _monitor is not None:
+        return
+    _monitor = RuntimeMonitor(
+        settings.loop_lag_interval_seconds,
+        settings.slow_callback_threshold_ms,
+        settings.slow_callback_history,
+    )
+    _monitor.start()
+
+
+async def stop_runtime_monitor() -> None:
+    """Stop the monitor started by ``start_runtime_monitor``."""
+    global _monitor
+    monitor, _monitor = _monitor, None
+    if monitor is not None:
+        await monitor.stop()
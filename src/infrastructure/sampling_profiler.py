@@ -0,0 +1,134 @@
+"""On-demand statistical profiler for a running worker.
+
+A thread samples the stacks of all other threads (``sys._current_frames``)
+at a fixed interval and counts each distinct stack in folded form,
+``thread;outermost;...;innermost``, the input format of flame graph
+tools. A thread is used rather than a ``SIGPROF`` timer because signal
+handlers only run in the main thread, between bytecodes, so they would
+miss the threadpool and add latency to the event loop.
+
+Nothing runs while no profile is being taken. While one is, each sample
+holds the GIL for the time it takes to walk the stacks; the label of
+every code object is computed once. At most ``max_stacks`` distinct
+stacks are kept, further ones are counted under ``OVERFLOW_STACK``.
+"""
+
+import os
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+from typing import Dict, Optional
+
+DEFAULT_INTERVAL_SECONDS = 0.01
+DEFAULT_MAX_STACKS = 10000
+DEFAULT_MAX_DEPTH = 128
+
+# Samples of stacks beyond the limit of distinct stacks
+OVERFLOW_STACK = "[other stacks]"
+# Replaces the outermost frames of stacks deeper than the depth limit
+TRUNCATED_FRAME = "[truncated]"
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+    pass
+
+
+class SamplingProfiler:
+    """Counts the folded stacks of all threads, sampled at an interval."""
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        max_stacks: int = DEFAULT_MAX_STACKS,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ):
+        """Initialize an empty profile."""
+        self.interval = interval
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self.counts: Dict[str, int] = {}
+        self.samples = 0
+        self._labels: Dict[CodeType, str] = {}
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = os.path.basename(code.co_filename)
+            # co_qualname (with the class name) is new in Python 3.11
+            name = getattr(code, "co_qualname", code.co_name)
+            label = self._labels[code] = (
+                f"{name} ({filename}:{code.co_firstlineno})"
+            )
+        return label
+
+    def _fold(self, thread_name: str, frame: Optional[FrameType]) -> str:
+        labels = []
+        while frame is not None and len(labels) < self.max_depth:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        if frame is not None:
+            labels.append(TRUNCATED_FRAME)
+        labels.append(thread_name.replace(";", ":"))
+        labels.reverse()
+        return ";".join(labels)
+
+    def sample(self, skip_thread: Optional[int] = None) -> None:
+        """Count the current stack of every thread but ``skip_thread``."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        counts = self.counts
+        for ident, frame in sys._current_frames().items():
+            if ident == skip_thread:
+                continue
+            stack = self._fold(names.get(ident, f"thread-{ident}"), frame)
+            if stack not in counts and len(counts) >= self.max_stacks:
+                stack = OVERFLOW_STACK
+            counts[stack] = counts.get(stack, 0) + 1
+        self.samples += 1
+
+    def run(self, seconds: float) -> None:
+        """Sample from the calling thread for ``seconds``."""
+        own_thread = threading.get_ident()
+        now = time.monotonic()
+        deadline = now + seconds
+        next_sample = now
+        while True:
+            self.sample(own_thread)
+            next_sample += self.interval
+            if next_sample >= deadline:
+                break
+            delay = next_sample - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind; skip the missed samples instead of bursting
+                next_sample = time.monotonic()
+
+    def collapsed(self) -> str:
+        """The profile as collapsed stacks, one ``stack count`` line each."""
+        stacks = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+
+_profile_lock = threading.Lock()
+
+
+def run_profile(
+    seconds: float,
+    interval: float = DEFAULT_INTERVAL_SECONDS,
+    max_stacks: int = DEFAULT_MAX_STACKS,
+) -> SamplingProfiler:
+    """Profile the process for ``seconds``; blocks the calling thread.
+
+    Only one profile runs at a time; raises ``ProfilerBusyError`` otherwise.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+    try:
+        profiler = SamplingProfiler(interval, max_stacks)
+        profiler.run(seconds)
+        return profiler
+    finally:
+        _profile_lock.release()
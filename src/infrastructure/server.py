@@ -39,5 +39,5 @@ class AppServer:
 
     def handle_exit(self, sig, frame):
         """Handle exit signal."""
-        logger.info(f"Received exit signal {sig}, shutting down...")
+        logger.info("Received exit signal %s, shutting down...", sig)
         self.should_exit.set()
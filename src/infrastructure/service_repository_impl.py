@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, List, Dict
+from typing import Iterable, Optional, List, Dict
 from uuid import UUID
 
 from ..application.repositories.service_repository import ServiceRepository
@@ -38,13 +38,33 @@ class InMemoryServiceRepository(ServiceRepository):
             self._services[service.id] = service
             return service
 
+    @track_operation("repository_save_many")
+    def save_many(self, services: List[Service]) -> List[Service]:
+        """Save several services to the in-memory store in one operation."""
+        with operation_context("repository_save_many", logger, count=len(services)):
+            existing = [s for s in services if s.id in self._services]
+            if existing:
+                logger.error(
+                    "Services already exist",
+                    extra={"service_ids": [str(s.id) for s in existing]},
+                )
+                raise ServiceAlreadyExistsError(
+                    f"Service with ID {existing[0].id} already exists"
+                )
+
+            logger.info("Saving services", extra={"count": len(services)})
+            self._services.update((s.id, s) for s in services)
+            return services
+
     @track_operation("repository_get_by_id")
     def get_by_id(self, service_id: UUID) -> Optional[Service]:
         """Retrieve a service by its ID from the in-memory store."""
         with operation_context(
             "repository_get_by_id", logger, service_id=str(service_id)
         ):
-            logger.debug("Fetching service", extra={"service_id": str(service_id)})
+            logger.debug(
+                "Fetching service", extra=lambda: {"service_id": str(service_id)}
+            )
             service = self._services.get(service_id)
             if not service:
                 logger.warning(
@@ -53,6 +73,19 @@ class InMemoryServiceRepository(ServiceRepository):
                 raise ServiceNotFoundError(f"Service with ID {service_id} not found")
             return service
 
+    @track_operation("repository_get_many")
+    def get_many(self, service_ids: Iterable[UUID]) -> Dict[UUID, Service]:
+        """Retrieve the services matching the given IDs from the in-memory store."""
+        with operation_context("repository_get_many", logger):
+            services = self._services
+            found = {
+                service_id: services[service_id]
+                for service_id in service_ids
+                if service_id in services
+            }
+            logger.debug("Fetched services by ID", extra={"count": len(found)})
+            return found
+
     @track_operation("repository_get_all")
     def get_all(self) -> List[Service]:
         """Retrieve all services from the in-memory store."""
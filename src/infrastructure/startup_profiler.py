@@ -0,0 +1,156 @@
+"""Startup profiler reporting import and initialization time per module and phase.
+
+Run with ``python -m src.main --profile-startup [--startup-budget SECONDS]``.
+The process exits non-zero when total startup time exceeds the budget.
+"""
+
+import argparse
+import asyncio
+import importlib
+import re
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# Startup time we allow before a pod is considered slow to take traffic
+DEFAULT_STARTUP_BUDGET_SECONDS = 1.0
+
+# Module whose import pulls in the whole application
+APP_MODULE = "src.infrastructure.app_bootstrap"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+
+@dataclass
+class ImportTiming:
+    """Import time of a single module as reported by ``-X importtime``."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Timings collected for one application startup."""
+
+    phases: List[Tuple[str, float]] = field(default_factory=list)
+    imports: List[ImportTiming] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        """Total wall-clock time across all startup phases."""
+        return sum(seconds for _, seconds in self.phases)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+
+def collect_import_timings(module: str = APP_MODULE) -> List[ImportTiming]:
+    """Import a module in a fresh interpreter with ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            timings.append(
+                ImportTiming(name, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return timings
+
+
+def profile_startup(with_imports: bool = True) -> StartupProfile:
+    """Run every startup step short of serving traffic and time each one."""
+    profile = StartupProfile()
+
+    with profile.phase(f"import {APP_MODULE}"):
+        bootstrap = importlib.import_module(APP_MODULE)
+
+    with profile.phase("load settings"):
+        settings = bootstrap.load_settings()
+
+    with profile.phase("configure logging"):
+        bootstrap.configure_logging(debug=settings.debug)
+
+    with profile.phase("create container"):
+        container = bootstrap.Container()
+        container.set_settings(settings)
+
+    with profile.phase("create app"):
+        server = bootstrap.AppServer(settings, container)
+
+    async def run_lifespan() -> None:
+        async with server.app.router.lifespan_context(server.app):
+            pass
+
+    with profile.phase("lifespan startup/shutdown"):
+        asyncio.run(run_lifespan())
+
+    if with_imports:
+        profile.imports = collect_import_timings()
+    return profile
+
+
+def format_report(
+    profile: StartupProfile, budget_seconds: float, top: int = 25
+) -> str:
+    """Render a startup profile as a plain-text report."""
+    lines = ["Startup phases"]
+    for name, seconds in profile.phases:
+        lines.append(f"  {name:<45} {seconds * 1000:9.1f} ms")
+    total = profile.total_seconds
+    verdict = "OK" if total <= budget_seconds else "OVER BUDGET"
+    lines.append(
+        f"  {'total':<45} {total * 1000:9.1f} ms "
+        f"(budget {budget_seconds * 1000:.0f} ms: {verdict})"
+    )
+
+    if profile.imports:
+        lines.append("")
+        lines.append(f"Slowest imports (top {top} by cumulative time, fresh interpreter)")
+        lines.append(f"  {'self ms':>9} {'cumul. ms':>10}  module")
+        slowest = sorted(profile.imports, key=lambda t: t.cumulative_us, reverse=True)
+        for timing in slowest[:top]:
+            lines.append(
+                f"  {timing.self_us / 1000:9.1f} {timing.cumulative_us / 1000:10.1f}"
+                f"  {timing.module}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Profile startup, print the report and check it against the budget."""
+    parser = argparse.ArgumentParser(description="Profile application startup")
+    parser.add_argument("--profile-startup", action="store_true")
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=DEFAULT_STARTUP_BUDGET_SECONDS,
+        help="Fail when total startup time exceeds this many seconds",
+    )
+    parser.add_argument(
+        "--no-imports",
+        action="store_true",
+        help="Skip the per-module import breakdown",
+    )
+    args = parser.parse_args(argv)
+
+    profile = profile_startup(with_imports=not args.no_imports)
+    print(format_report(profile, args.startup_budget))
+    return 0 if profile.total_seconds <= args.startup_budget else 1
@@ -0,0 +1,158 @@
+"""Host CPU, memory and disk usage, sampled in the background.
+
+``psutil`` calls are blocking system calls (``disk_usage`` on a network
+mount can take a while), and ``cpu_percent()`` without an interval
+reports usage since its previous call, which is meaningless when only
+health checks call it. A thread therefore samples at a fixed interval,
+keeps the recent samples in a ring buffer and publishes the latest as
+Prometheus gauges; ``/health/detailed`` serves the latest sample with its
+age and never calls ``psutil`` itself.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from src.config.settings import Settings
+from .lazy_imports import lazy_import
+from .logging_context import get_contextual_logger
+from .metrics import SYSTEM_CPU_USAGE, SYSTEM_DISK_USAGE, SYSTEM_MEMORY_USAGE
+
+logger = get_contextual_logger(__name__)
+
+# Only needed once sampling starts, so it does not add to import time
+psutil = lazy_import("psutil")
+
+DEFAULT_INTERVAL_SECONDS = 5.0
+DEFAULT_HISTORY = 120
+
+# CPU usage of the first sample is measured over this long
+_FIRST_CPU_INTERVAL_SECONDS = 0.1
+
+
+@dataclass(frozen=True)
+class SystemSample:
+    """Host resource usage at one point in time, in percent."""
+
+    timestamp: float  # Wall clock
+    monotonic: float  # For the sample's age
+    cpu_usage: float
+    memory_usage: float
+    disk_usage: float
+
+    def age(self) -> float:
+        """Seconds since the sample was taken."""
+        return time.monotonic() - self.monotonic
+
+
+class SystemMetricsSampler:
+    """Background thread sampling host resource usage at an interval."""
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        history: int = DEFAULT_HISTORY,
+        disk_path: str = "/",
+    ):
+        """Initialize a stopped sampler."""
+        self.interval = interval
+        self.disk_path = disk_path
+        self._samples: Deque[SystemSample] = deque(maxlen=history)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling; the first sample is taken right away."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="system-metrics", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        cpu_interval: Optional[float] = _FIRST_CPU_INTERVAL_SECONDS
+        while True:
+            try:
+                self._record(self.sample(cpu_interval))
+                # Later samples report CPU usage since the previous one
+                cpu_interval = None
+            except Exception as e:
+                logger.warning(
+                    "Failed to sample system metrics", extra={"error": str(e)}
+                )
+            if self._stop.wait(self.interval):
+                return
+
+    def sample(self, cpu_interval: Optional[float] = None) -> SystemSample:
+        """Take one sample; blocks for ``cpu_interval`` if given."""
+        cpu_usage = psutil.cpu_percent(interval=cpu_interval)
+        return SystemSample(
+            timestamp=time.time(),
+            monotonic=time.monotonic(),
+            cpu_usage=cpu_usage,
+            memory_usage=psutil.virtual_memory().percent,
+            disk_usage=psutil.disk_usage(self.disk_path).percent,
+        )
+
+    def _record(self, sample: SystemSample) -> None:
+        self._samples.append(sample)
+        SYSTEM_CPU_USAGE.set(sample.cpu_usage)
+        SYSTEM_MEMORY_USAGE.set(sample.memory_usage)
+        SYSTEM_DISK_USAGE.set(sample.disk_usage)
+
+    def latest(self) -> Optional[SystemSample]:
+        """The most recent sample, or None before the first one."""
+        try:
+            return self._samples[-1]
+        except IndexError:
+            return None
+
+    def samples(self) -> List[SystemSample]:
+        """The recent samples, oldest first."""
+        return list(self._samples)
+
+
+def sample_to_dict(sample: SystemSample) -> Dict[str, Any]:
+    """JSON-ready form of a sample, with its age instead of the monotonic time."""
+    data = asdict(sample)
+    del data["monotonic"]
+    data["age_seconds"] = sample.age()
+    return data
+
+
+_sampler: Optional[SystemMetricsSampler] = None
+
+
+def get_system_metrics_sampler() -> Optional[SystemMetricsSampler]:
+    """The running sampler, or None if sampling is off."""
+    return _sampler
+
+
+def start_system_metrics(settings: Settings) -> None:
+    """Start sampling host resource usage if enabled."""
+    global _sampler
+    if settings.system_metrics_interval_seconds <= 0 or _sampler is not None:
+        return
+    _sampler = SystemMetricsSampler(
+        settings.system_metrics_interval_seconds,
+        settings.system_metrics_history,
+        settings.system_metrics_disk_path,
+    )
+    _sampler.start()
+
+
+def stop_system_metrics() -> None:
+    """Stop the sampler started by ``start_system_metrics``."""
+    global _sampler
+    sampler, _sampler = _sampler, None
+    if sampler is not None:
+        sampler.stop()
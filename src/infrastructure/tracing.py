@@ -0,0 +1,601 @@
+"""Lightweight in-process tracing.
+
+Spans form a tree through a context variable: a span started while another
+is active becomes its child, and the parent is restored when the child
+ends. Durations come from ``perf_counter_ns``; wall-clock start and end
+times are derived from a single ``time_ns`` reading at span start. IDs are
+random 128-bit (trace) and 64-bit (span) integers, formatted as hex only
+when exported.
+
+Spans are collected per trace, up to a fixed number per trace, and only
+while a processor is configured. When the local root span ends, the whole
+trace is handed to the processor. ``TailSamplingProcessor`` decides then
+whether to keep it (errors, slow requests and a random baseline), holds
+kept traces in a bounded in-memory store and passes them on to a
+``BatchTraceProcessor``, which exports them in batches from a background
+thread. Spans that end after their root has ended are not exported; they
+are counted as dropped, and the trace is not otherwise changed once it has
+been handed to the processor.
+"""
+
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar, Token
+from pathlib import Path
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from src.config.settings import Settings
+from .metrics import TRACES_DROPPED, TRACES_SAMPLED
+from .warmup_context import warmup_request
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_EXPORT_INTERVAL_SECONDS = 5.0
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_MAX_SPANS_PER_TRACE = 256
+DEFAULT_STORE_SIZE = 100
+
+# Tail sampling decisions, in order of precedence
+DECISION_ERROR = "error"
+DECISION_SLOW = "slow"
+DECISION_BASELINE = "baseline"
+
+# Plain logger: logging_context builds on this module
+logger = logging.getLogger(__name__)
+
+current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+_getrandbits = random.getrandbits
+_perf_counter_ns = time.perf_counter_ns
+_time_ns = time.time_ns
+_random = random.random
+
+
+class Trace:
+    """The spans of one trace recorded in this process."""
+
+    __slots__ = ("trace_id", "spans", "dropped_spans", "decision", "ended")
+
+    def __init__(self, trace_id: int):
+        self.trace_id = trace_id
+        self.spans: List["Span"] = []
+        self.dropped_spans = 0
+        self.decision: Optional[str] = None
+        self.ended = False
+
+    @property
+    def root(self) -> Optional["Span"]:
+        """The local root span, once it has ended."""
+        # The root ends last, so look from the end
+        for span in reversed(self.spans):
+            if span.parent is None:
+                return span
+        return None
+
+    @property
+    def has_error(self) -> bool:
+        """Whether any recorded span failed."""
+        return any(span.status_code == STATUS_ERROR for span in self.spans)
+
+
+class Span:
+    """A timed operation within a trace; use as a context manager."""
+
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent",
+        "name",
+        "kind",
+        "attributes",
+        "start_time_unix_nano",
+        "duration_ns",
+        "status_code",
+        "status_message",
+        "_start_ns",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ):
+        """Create a span as a child of the current span, if any."""
+        parent = current_span.get()
+        self.trace = parent.trace if parent is not None else Trace(_getrandbits(128))
+        self.span_id = _getrandbits(64)
+        self.parent = parent
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes if attributes is not None else {}
+        self.start_time_unix_nano = 0
+        self.duration_ns: Optional[int] = None
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+        self._start_ns = 0
+        self._token: Optional[Token] = None
+
+    @property
+    def trace_id(self) -> int:
+        """ID of the trace this span belongs to."""
+        return self.trace.trace_id
+
+    @property
+    def span_id_hex(self) -> str:
+        """Span ID in its 16-digit hex wire form."""
+        return f"{self.span_id:016x}"
+
+    @property
+    def trace_id_hex(self) -> str:
+        """Trace ID in its 32-digit hex wire form."""
+        return f"{self.trace.trace_id:032x}"
+
+    @property
+    def elapsed_ns(self) -> int:
+        """Time since the span started, or its duration once ended."""
+        if self.duration_ns is not None:
+            return self.duration_ns
+        return _perf_counter_ns() - self._start_ns
+
+    @property
+    def end_time_unix_nano(self) -> Optional[int]:
+        """Wall-clock end time, once the span has ended."""
+        if self.duration_ns is None:
+            return None
+        return self.start_time_unix_nano + self.duration_ns
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a key/value pair to the span."""
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException) -> None:
+        """Mark the span as failed."""
+        self.status_code = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def __enter__(self) -> "Span":
+        self.start_time_unix_nano = _time_ns()
+        self._start_ns = _perf_counter_ns()
+        self._token = current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.duration_ns = _perf_counter_ns() - self._start_ns
+        if exc_val is not None and self.status_code != STATUS_ERROR:
+            self.set_error(exc_val)
+        current_span.reset(self._token)
+        self._token = None
+
+        processor = _processor
+        if processor is None:
+            return
+        trace = self.trace
+        if self.parent is None:
+            trace.spans.append(self)
+            trace.ended = True
+            processor.on_trace_end(trace)
+        elif not trace.ended and len(trace.spans) < _max_spans - 1:
+            # One slot is always left for the root span
+            trace.spans.append(self)
+        else:
+            trace.dropped_spans += 1
+
+
+def start_span(
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    kind: int = SPAN_KIND_INTERNAL,
+) -> Span:
+    """Create a span; it starts when its ``with`` block is entered."""
+    return Span(name, attributes, kind)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Wrap an attribute value in its OTLP ``AnyValue`` form."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def span_to_otlp(span: Span) -> Dict[str, Any]:
+    """Convert a span to its OTLP/JSON representation."""
+    data: Dict[str, Any] = {
+        "traceId": span.trace_id_hex,
+        "spanId": span.span_id_hex,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_time_unix_nano),
+        "endTimeUnixNano": str(span.end_time_unix_nano),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)}
+            for key, value in span.attributes.items()
+        ],
+        "status": {"code": span.status_code},
+    }
+    if span.parent is not None:
+        data["parentSpanId"] = span.parent.span_id_hex
+    if span.status_message:
+        data["status"]["message"] = span.status_message
+    return data
+
+
+def traces_to_otlp(traces: List[Trace], service_name: str) -> Dict[str, Any]:
+    """Build an OTLP ``ExportTraceServiceRequest`` for a batch of traces."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [
+                            span_to_otlp(span)
+                            for trace in traces
+                            for span in trace.spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter(ABC):
+    """Receives batches of completed traces."""
+
+    @abstractmethod
+    def export(self, traces: List[Trace]) -> None:
+        """Export a batch of traces; called from the processor's worker thread."""
+        pass
+
+    def shutdown(self) -> None:
+        """Release any resources held by the exporter."""
+
+
+class OTLPJsonFileExporter(SpanExporter):
+    """Appends each batch to a file as one line of OTLP/JSON."""
+
+    def __init__(self, path: Path, service_name: str):
+        """Initialize with the output file and the ``service.name`` resource."""
+        self.path = path
+        self.service_name = service_name
+        self._file = None
+
+    def export(self, traces: List[Trace]) -> None:
+        """Append the batch as one OTLP ``ExportTraceServiceRequest``."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        payload = traces_to_otlp(traces, self.service_name)
+        self._file.write(json.dumps(payload, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def shutdown(self) -> None:
+        """Close the output file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class TraceProcessor(ABC):
+    """Receives each trace when its local root span ends."""
+
+    @abstractmethod
+    def on_trace_end(self, trace: Trace) -> None:
+        """Handle a completed trace; called on the request path, so keep it cheap."""
+        pass
+
+    def shutdown(self) -> None:
+        """Flush pending traces and release resources."""
+
+
+class BatchTraceProcessor(TraceProcessor):
+    """Queues completed traces and exports them in batches off the request path.
+
+    The queue is bounded; traces arriving while it is full are dropped and
+    counted in ``traces_dropped_total``.
+    """
+
+    _SHUTDOWN = object()
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        export_interval: float = DEFAULT_EXPORT_INTERVAL_SECONDS,
+        max_queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        """Start the worker that exports batches through ``exporter``."""
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self.export_interval = export_interval
+        self.queue: "queue.Queue[Any]" = queue.Queue(max_queue_size)
+        self._thread = threading.Thread(
+            target=self._run, name="trace-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def on_trace_end(self, trace: Trace) -> None:
+        """Queue a completed trace without blocking the caller."""
+        try:
+            self.queue.put_nowait(trace)
+        except queue.Full:
+            TRACES_DROPPED.inc()
+
+    def _run(self) -> None:
+        """Export when a batch fills up or the export interval elapses."""
+        batch: List[Trace] = []
+        deadline = time.monotonic() + self.export_interval
+        while True:
+            try:
+                item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is self._SHUTDOWN:
+                self._export(batch)
+                return
+            if item is not None:
+                batch.append(item)
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._export(batch)
+                batch = []
+                deadline = time.monotonic() + self.export_interval
+
+    def _export(self, batch: List[Trace]) -> None:
+        if not batch:
+            return
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            # Exporting must never take down the worker; the batch is lost
+            TRACES_DROPPED.inc(len(batch))
+            logger.error("Trace export failed", extra={"error": str(e)})
+
+    def shutdown(self) -> None:
+        """Export everything queued so far and stop the worker."""
+        if self._thread.is_alive():
+            self.queue.put(self._SHUTDOWN)
+            self._thread.join()
+        self.exporter.shutdown()
+
+
+class TailSampler:
+    """Decides whether to keep a trace once it has completed."""
+
+    def __init__(self, latency_threshold_ms: Optional[float], sample_rate: float):
+        """Keep failed traces, traces at least ``latency_threshold_ms`` long
+        (None to disable), and a ``sample_rate`` fraction of the rest."""
+        self.latency_threshold_ns = (
+            int(latency_threshold_ms * 1_000_000)
+            if latency_threshold_ms is not None
+            else None
+        )
+        self.sample_rate = sample_rate
+
+    def decide(self, trace: Trace) -> Optional[str]:
+        """Return why the trace is kept, or None to drop it."""
+        if trace.has_error:
+            return DECISION_ERROR
+        root = trace.root
+        threshold = self.latency_threshold_ns
+        if threshold is not None and root is not None and root.duration_ns >= threshold:
+            return DECISION_SLOW
+        if self.sample_rate >= 1.0 or _random() < self.sample_rate:
+            return DECISION_BASELINE
+        return None
+
+
+class TraceStore:
+    """The most recent kept traces, in a fixed-size ring per decision.
+
+    Separate rings keep a burst of baseline traces from evicting the error
+    and slow traces that are the reason for looking.
+    """
+
+    def __init__(self, max_traces_per_decision: int = DEFAULT_STORE_SIZE):
+        """Initialize with the number of traces kept for each decision."""
+        self.max_traces_per_decision = max_traces_per_decision
+        self._rings: Dict[str, Deque[Trace]] = {
+            decision: deque(maxlen=max_traces_per_decision)
+            for decision in (DECISION_ERROR, DECISION_SLOW, DECISION_BASELINE)
+        }
+        self._lock = threading.Lock()
+
+    def add(self, trace: Trace) -> None:
+        """Keep a trace, evicting the oldest one with the same decision."""
+        with self._lock:
+            self._rings[trace.decision or DECISION_BASELINE].append(trace)
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        """Find a kept trace by its hex trace ID."""
+        try:
+            wanted = int(trace_id, 16)
+        except ValueError:
+            return None
+        with self._lock:
+            for ring in self._rings.values():
+                for trace in ring:
+                    if trace.trace_id == wanted:
+                        return trace
+        return None
+
+    def query(
+        self,
+        decision: Optional[str] = None,
+        min_duration_ms: Optional[float] = None,
+        limit: int = 20,
+    ) -> List[Trace]:
+        """Return the most recently ended matching traces, newest first."""
+        with self._lock:
+            if decision is not None:
+                traces = list(self._rings.get(decision, ()))
+            else:
+                traces = [trace for ring in self._rings.values() for trace in ring]
+        if min_duration_ms is not None:
+            min_ns = min_duration_ms * 1_000_000
+            traces = [t for t in traces if t.root.duration_ns >= min_ns]
+        traces.sort(key=lambda t: t.root.end_time_unix_nano, reverse=True)
+        return traces[:limit]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(ring) for ring in self._rings.values())
+
+
+class TailSamplingProcessor(TraceProcessor):
+    """Keeps sampled traces in a store and forwards them for export."""
+
+    def __init__(
+        self,
+        sampler: TailSampler,
+        store: Optional[TraceStore] = None,
+        exporter: Optional[TraceProcessor] = None,
+    ):
+        """Initialize with the sampler and where kept traces go."""
+        self.sampler = sampler
+        self.store = store
+        self.exporter = exporter
+
+    def on_trace_end(self, trace: Trace) -> None:
+        """Keep or drop the trace now that all of its spans are known."""
+        if warmup_request.get():
+            return
+        decision = self.sampler.decide(trace)
+        TRACES_SAMPLED.labels(decision=decision or "dropped").inc()
+        if decision is None:
+            return
+        trace.decision = decision
+        if self.store is not None:
+            self.store.add(trace)
+        if self.exporter is not None:
+            self.exporter.on_trace_end(trace)
+
+    def shutdown(self) -> None:
+        """Flush the downstream exporter."""
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+def _plain_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def trace_to_dict(trace: Trace, include_spans: bool = True) -> Dict[str, Any]:
+    """Summarize a trace, optionally with its spans, for the debug endpoint."""
+    root = trace.root
+    data: Dict[str, Any] = {
+        "trace_id": f"{trace.trace_id:032x}",
+        "name": root.name,
+        "start_time_unix_nano": root.start_time_unix_nano,
+        "duration_ms": root.duration_ns / 1_000_000,
+        "error": trace.has_error,
+        "decision": trace.decision,
+        "span_count": len(trace.spans),
+        "dropped_spans": trace.dropped_spans,
+    }
+    if include_spans:
+        data["spans"] = [
+            {
+                "span_id": span.span_id_hex,
+                "parent_span_id": (
+                    span.parent.span_id_hex if span.parent is not None else None
+                ),
+                "name": span.name,
+                "offset_ms": (span.start_time_unix_nano - root.start_time_unix_nano)
+                / 1_000_000,
+                "duration_ms": span.duration_ns / 1_000_000,
+                "status_code": span.status_code,
+                "status_message": span.status_message,
+                "attributes": {
+                    key: _plain_value(value) for key, value in span.attributes.items()
+                },
+            }
+            for span in sorted(trace.spans, key=lambda s: s.start_time_unix_nano)
+        ]
+    return data
+
+
+_processor: Optional[TraceProcessor] = None
+_max_spans = DEFAULT_MAX_SPANS_PER_TRACE
+_store: Optional[TraceStore] = None
+
+
+def set_processor(processor: Optional[TraceProcessor]) -> None:
+    """Set where completed traces go; None stops collecting spans."""
+    global _processor
+    _processor = processor
+
+
+def set_max_spans_per_trace(max_spans: int) -> None:
+    """Bound the spans buffered per trace; further spans are only counted."""
+    global _max_spans
+    _max_spans = max(1, max_spans)
+
+
+def get_trace_store() -> Optional[TraceStore]:
+    """The store of kept traces, if tracing is configured to keep them."""
+    return _store
+
+
+def configure_tracing(settings: Settings) -> Optional[TraceProcessor]:
+    """Start tail-sampled tracing as configured.
+
+    Kept traces go to the in-memory store unless ``trace_store_size`` is 0,
+    and are exported if ``trace_export_path`` is set. With neither, spans
+    are not collected at all.
+    """
+    global _store
+    store = TraceStore(settings.trace_store_size) if settings.trace_store_size else None
+    exporter = None
+    if settings.trace_export_path:
+        exporter = BatchTraceProcessor(
+            OTLPJsonFileExporter(Path(settings.trace_export_path), settings.app_name),
+            batch_size=settings.trace_export_batch_size,
+            export_interval=settings.trace_export_interval_seconds,
+        )
+    if store is None and exporter is None:
+        return None
+
+    sampler = TailSampler(
+        settings.trace_latency_threshold_ms, settings.trace_sample_rate
+    )
+    processor = TailSamplingProcessor(sampler, store, exporter)
+    set_max_spans_per_trace(settings.trace_max_spans)
+    _store = store
+    set_processor(processor)
+    return processor
+
+
+def shutdown_tracing() -> None:
+    """Flush and stop the configured processor."""
+    global _processor, _store
+    processor, _processor = _processor, None
+    _store = None
+    if processor is not None:
+        processor.shutdown()
@@ -0,0 +1,184 @@
+"""Startup warmup that primes hot paths before the application reports ready.
+
+The first requests after a deploy pay for cold pydantic validators, route
+matching, serializers and lazily built caches. Warmup sends synthetic
+in-process requests through the full ASGI stack (middleware included) so
+that cost is paid before the readiness endpoint lets traffic in. They
+are marked with ``warmup_request`` and left out of metrics, traces and
+request accounting.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from fastapi import FastAPI
+
+from .logging_context import get_contextual_logger
+from .warmup_context import warmup_request
+
+logger = get_contextual_logger(__name__)
+
+
+@dataclass
+class WarmupReport:
+    """Outcome of a warmup run."""
+
+    requests: int = 0
+    failures: int = 0
+    duration_seconds: float = 0.0
+    statuses: Dict[str, int] = field(default_factory=dict)
+
+
+async def asgi_request(
+    app: FastAPI,
+    method: str,
+    path: str,
+    query_string: str = "",
+    headers: Optional[Dict[str, str]] = None,
+    body: bytes = b"",
+) -> Tuple[int, bytes]:
+    """Send one request through the application's ASGI stack in-process."""
+    raw_headers = [
+        (name.lower().encode(), value.encode()) for name, value in (headers or {}).items()
+    ]
+    if body:
+        raw_headers.append((b"content-length", str(len(body)).encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("warmup", 80),
+    }
+
+    request_sent = False
+    response_done = asyncio.Event()
+    status = 0
+    chunks: List[bytes] = []
+
+    async def receive() -> dict:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    token = warmup_request.set(True)
+    try:
+        await app(scope, receive, send)
+    finally:
+        warmup_request.reset(token)
+    return status, b"".join(chunks)
+
+
+async def run_warmup(app: FastAPI, iterations: int) -> WarmupReport:
+    """Exercise the main routes ``iterations`` times.
+
+    Services created by warmup are deleted from the repository afterwards so
+    no synthetic data is left behind.
+    """
+    report = WarmupReport()
+    start = time.perf_counter()
+    created: List[UUID] = []
+    missing_id = str(uuid4())
+    create_body = json.dumps(
+        {"name": "warmup", "description": "Synthetic warmup service"}
+    ).encode()
+
+    async def call(name: str, method: str, path: str, **kwargs) -> Tuple[int, bytes]:
+        status, payload = await asgi_request(app, method, path, **kwargs)
+        report.requests += 1
+        report.statuses[name] = status
+        if status >= 500:
+            report.failures += 1
+        return status, payload
+
+    try:
+        for _ in range(iterations):
+            status, payload = await call(
+                "create",
+                "POST",
+                "/v1/services",
+                headers={"content-type": "application/json"},
+                body=create_body,
+            )
+            service_id = json.loads(payload)["id"] if status == 201 else missing_id
+            if status == 201:
+                created.append(UUID(service_id))
+
+            await call("get", "GET", f"/v1/services/{service_id}")
+            await call(
+                "get_fields",
+                "GET",
+                f"/v1/services/{service_id}",
+                query_string="fields=id,name",
+            )
+            await call("get_missing", "GET", f"/v1/services/{missing_id}")
+            await call("list", "GET", "/v1/services")
+            await call(
+                "multi_get",
+                "GET",
+                "/v1/services",
+                query_string=f"ids={service_id},{missing_id}",
+            )
+            await call(
+                "get_msgpack",
+                "GET",
+                f"/v1/services/{service_id}",
+                headers={"accept": "application/msgpack"},
+            )
+            await call("health", "GET", "/health")
+            await call("openapi", "GET", "/openapi.json")
+    finally:
+        # Also runs when warm_up's timeout cancels this coroutine
+        repository = app.state.container.get_repository()
+        for service_id in created:
+            repository.delete(service_id)
+
+    report.duration_seconds = time.perf_counter() - start
+    return report
+
+
+async def warm_up(app: FastAPI, iterations: int, timeout_seconds: float) -> None:
+    """Run warmup, then mark the application ready whatever the outcome.
+
+    A failed or slow warmup must not keep the pod out of rotation forever,
+    so errors and timeouts are logged and readiness is still flipped.
+    """
+    try:
+        report = await asyncio.wait_for(run_warmup(app, iterations), timeout_seconds)
+        logger.info(
+            "Warmup completed",
+            extra={
+                "requests": report.requests,
+                "failures": report.failures,
+                "duration_ms": int(report.duration_seconds * 1000),
+            },
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Warmup timed out", extra={"timeout_seconds": timeout_seconds})
+    except Exception as e:
+        logger.error("Warmup failed", extra={"error": str(e)})
+    finally:
+        app.state.ready = True
@@ -0,0 +1,17 @@
+"""Marks the synthetic requests sent by startup warmup.
+
+Warmup requests run cold, so they would show up as the slowest requests
+of every histogram and be kept as slow traces, and the services they
+create would be counted. Warmup sets ``warmup_request`` around each
+request it sends; the context variable follows the request into its
+tasks and threadpool calls, and metrics, tracing and request accounting
+skip whatever runs while it is set. Unlike a header, it cannot be set by
+a client.
+
+This module imports nothing from the application so that the metric and
+tracing modules can use it.
+"""
+
+from contextvars import ContextVar
+
+warmup_request: ContextVar[bool] = ContextVar("warmup_request", default=False)
@@ -1,8 +1,13 @@
 """Factory for creating controllers with proper dependencies."""
 
+from typing import Optional
 from fastapi import FastAPI
+from src.config.settings import Settings
 from src.infrastructure.container import Container
 from src.interface_adapters.controllers.service_rest_controller import ServiceController
+from src.interface_adapters.controllers.service_ingest_controller import (
+    ServiceIngestController,
+)
 from src.interface_adapters.controllers.health_controller import HealthController
 
 
@@ -10,12 +15,18 @@ class ControllerFactory:
     """Factory for creating and registering controllers."""
 
     @staticmethod
-    def create_and_register_controllers(app: FastAPI, container: Container) -> None:
+    def create_and_register_controllers(
+        app: FastAPI, container: Container, settings: Optional[Settings] = None
+    ) -> None:
         """Create controllers with proper dependencies and register them with the app."""
-        # Create controllers with dependencies from the container
-        service_controller = ServiceController(
-            create_service_interactor=container.get_create_service_interactor(),
-            get_service_interactor=container.get_get_service_interactor(),
+        settings = settings or container.get_settings() or Settings()
+
+        # Service controllers resolve their use cases per request from the container
+        service_controller = ServiceController(request_scope=container.request_scope)
+        ingest_controller = ServiceIngestController(
+            request_scope=container.request_scope,
+            max_in_flight=settings.ingest_max_in_flight,
+            max_batch_size=settings.ingest_max_batch_size,
         )
 
         health_controller = HealthController()
@@ -24,6 +35,9 @@ class ControllerFactory:
         app.include_router(
             health_controller.router
         )  # Health check endpoints without version prefix
+        app.include_router(
+            ingest_controller.router, prefix="/v1/services"
+        )  # Version 1 bulk ingest channel
         app.include_router(
             service_controller.router, prefix="/v1/services"
         )  # Version 1 API endpoints
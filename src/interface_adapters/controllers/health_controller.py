@@ -1,11 +1,20 @@
 """Health controller implementing REST endpoints for health checks."""
 
 from datetime import datetime
-import psutil
-from fastapi import APIRouter, Request
+from typing import Optional
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
 
 from ...infrastructure.logging_context import get_contextual_logger, operation_context
-from ..dtos.health_dto import HealthResponse, HealthDetailedResponse, SystemMetrics
+from ...infrastructure.runtime_monitor import get_runtime_monitor
+from ...infrastructure.system_metrics import get_system_metrics_sampler
+from ..dtos.health_dto import (
+    HealthResponse,
+    HealthDetailedResponse,
+    ReadinessResponse,
+    RuntimeMetrics,
+    SystemMetrics,
+)
 
 logger = get_contextual_logger(__name__)
 
@@ -29,6 +38,13 @@ class HealthController:
             methods=["GET"],
             response_model=HealthResponse,
         )
+        self.router.add_api_route(
+            "/health/ready",
+            self.readiness_check,
+            methods=["GET"],
+            response_model=ReadinessResponse,
+            responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+        )
         self.router.add_api_route(
             "/health/detailed",
             self.detailed_health_check,
@@ -46,19 +62,30 @@ class HealthController:
             logger.debug("Health check completed", extra={"status": response.status})
             return response
 
+    async def readiness_check(self, request: Request) -> ReadinessResponse:
+        """Readiness check endpoint; not ready until startup warmup completes."""
+        ready = getattr(request.app.state, "ready", True)
+        response = ReadinessResponse(
+            status="ready" if ready else "warming_up",
+            ready=ready,
+            timestamp=datetime.utcnow(),
+        )
+        if not ready:
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content=response.model_dump(mode="json"),
+            )
+        return response
+
     async def detailed_health_check(self, request: Request) -> HealthDetailedResponse:
         """Detailed health check endpoint with system metrics."""
         with operation_context("detailed_health_check", logger):
             logger.info("Processing detailed health check request")
             try:
                 metrics = self._get_system_metrics()
-                logger.debug(
-                    "System metrics collected",
-                    extra={
-                        "cpu_usage": metrics.cpu_usage,
-                        "memory_usage": metrics.memory_usage,
-                        "disk_usage": metrics.disk_usage,
-                    },
+                monitor = get_runtime_monitor()
+                runtime_metrics = (
+                    RuntimeMetrics(**monitor.summary()) if monitor is not None else None
                 )
                 now = datetime.utcnow()
                 uptime = (now - _start_time).total_seconds()
@@ -69,6 +96,7 @@ class HealthController:
                     uptime=uptime,
                     services={"database": "ok", "cache": "ok"},
                     system_metrics=metrics,
+                    runtime_metrics=runtime_metrics,
                 )
                 logger.info(
                     "Detailed health check completed",
@@ -89,10 +117,16 @@ class HealthController:
                 )
 
     @staticmethod
-    def _get_system_metrics() -> SystemMetrics:
-        """Get current system metrics."""
+    def _get_system_metrics() -> Optional[SystemMetrics]:
+        """Get the latest background sample of system metrics, with its age."""
+        sampler = get_system_metrics_sampler()
+        sample = sampler.latest() if sampler is not None else None
+        if sample is None:
+            return None
         return SystemMetrics(
-            cpu_usage=psutil.cpu_percent(),
-            memory_usage=psutil.virtual_memory().percent,
-            disk_usage=psutil.disk_usage("/").percent,
+            cpu_usage=sample.cpu_usage,
+            memory_usage=sample.memory_usage,
+            disk_usage=sample.disk_usage,
+            sampled_at=datetime.utcfromtimestamp(sample.timestamp),
+            age_seconds=sample.age(),
         )
@@ -0,0 +1,204 @@
+"""Ingest controller implementing the bulk service creation WebSocket channel."""
+
+import asyncio
+import json
+from typing import Any, Callable, ContextManager, List, Optional
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from ...interface_adapters.dtos.ingest_dto import IngestCommand, IngestFrame
+from ...interface_adapters.serializers import msgpack_serializer
+from ...infrastructure.container import RequestScope
+from ...infrastructure.logging_context import get_contextual_logger, operation_context
+
+logger = get_contextual_logger(__name__)
+
+# Sentinel queued by the reader when the client goes away, and by the
+# writer once its last acknowledgement is queued
+_CLOSED = object()
+
+
+class IngestSession:
+    """State for one ingest connection.
+
+    A reader task decodes frames and queues commands, acquiring one slot of
+    the in-flight window per command. When the window is exhausted the reader
+    stops reading, so TCP backpressure reaches the client. A writer task
+    drains whatever is queued into micro-batches and saves each batch with one
+    repository write. Every outbound message goes through the outbox to a
+    single sender task, so frames are never interleaved on the socket; the
+    sender releases a batch's window slots once its ack has been sent.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        request_scope: Callable[[], ContextManager[RequestScope]],
+        max_in_flight: int,
+        max_batch_size: int,
+    ):
+        """Initialize the session for an accepted WebSocket."""
+        self.websocket = websocket
+        self.request_scope = request_scope
+        self.max_batch_size = max_batch_size
+        self.window = asyncio.Semaphore(max_in_flight)
+        self.queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self.outbox: "asyncio.Queue[Any]" = asyncio.Queue()
+        self.binary: Optional[bool] = None
+        self.acked = 0
+
+    def send(self, message: dict, released: int = 0) -> None:
+        """Queue a message, and the window slots to release once it is sent."""
+        self.outbox.put_nowait((message, released))
+
+    async def transmit(self) -> None:
+        """Send queued messages in the encoding the client uses for its frames."""
+        connected = True
+        while True:
+            item = await self.outbox.get()
+            if item is _CLOSED:
+                break
+            message, released = item
+            try:
+                if not connected:
+                    continue
+                if self.binary:
+                    await self.websocket.send_bytes(msgpack_serializer.encode(message))
+                else:
+                    await self.websocket.send_text(json.dumps(message))
+            except (WebSocketDisconnect, RuntimeError):
+                # Client is gone; keep draining so the reader is never blocked
+                connected = False
+            finally:
+                self.acked += released
+                for _ in range(released):
+                    self.window.release()
+
+    def decode_frame(self, message: dict) -> List[IngestCommand]:
+        """Decode a text (JSON) or binary (MessagePack) frame into commands."""
+        if message.get("bytes") is not None:
+            self.binary = True
+            data = msgpack_serializer.decode(message["bytes"])
+        else:
+            if self.binary is None:
+                self.binary = False
+            data = json.loads(message["text"])
+        return IngestFrame.validate_python(data if isinstance(data, list) else [data])
+
+    async def read(self) -> None:
+        """Read frames and queue their commands within the in-flight window."""
+        try:
+            while True:
+                message = await self.websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                try:
+                    commands = self.decode_frame(message)
+                except (ValueError, ValidationError) as e:
+                    logger.warning("Rejected ingest frame", extra={"error": str(e)})
+                    self.send({"type": "error", "detail": str(e)})
+                    continue
+                for command in commands:
+                    await self.window.acquire()
+                    self.queue.put_nowait(command)
+        finally:
+            self.queue.put_nowait(_CLOSED)
+
+    def write_batch(self, batch: List[IngestCommand]) -> dict:
+        """Create a batch of services and build its acknowledgement."""
+        with self.request_scope() as scope:
+            scope.create_service_interactor.create_services(
+                [(command.name, command.description) for command in batch]
+            )
+            presenter = scope.presenter
+            results = []
+            for command, service_id, error in zip(
+                batch, presenter.created_ids, presenter.batch_errors
+            ):
+                if service_id is not None:
+                    results.append({"seq": command.seq, "id": str(service_id)})
+                else:
+                    results.append({"seq": command.seq, "error": error})
+        return {"type": "ack", "results": results}
+
+    async def write(self) -> None:
+        """Drain queued commands into micro-batches and queue their acks."""
+        closed = False
+        try:
+            while not closed:
+                item = await self.queue.get()
+                if item is _CLOSED:
+                    break
+                batch = [item]
+                while len(batch) < self.max_batch_size and not self.queue.empty():
+                    item = self.queue.get_nowait()
+                    if item is _CLOSED:
+                        closed = True
+                        break
+                    batch.append(item)
+
+                try:
+                    ack = self.write_batch(batch)
+                except Exception as e:
+                    logger.error("Unexpected error ingesting batch", extra={"error": str(e)})
+                    ack = {
+                        "type": "ack",
+                        "results": [
+                            {"seq": command.seq, "error": f"Internal error: {str(e)}"}
+                            for command in batch
+                        ],
+                    }
+                self.send(ack, released=len(batch))
+        finally:
+            self.outbox.put_nowait(_CLOSED)
+
+
+class ServiceIngestController:
+    """Controller for the bulk service ingest WebSocket channel."""
+
+    def __init__(
+        self,
+        request_scope: Callable[[], ContextManager[RequestScope]],
+        max_in_flight: int,
+        max_batch_size: int,
+    ):
+        """Initialize with a provider of request-scoped use cases and limits."""
+        self.request_scope = request_scope
+        self.max_in_flight = max_in_flight
+        self.max_batch_size = max_batch_size
+        self.router = APIRouter()
+        self._register_routes()
+
+    def _register_routes(self):
+        """Register all routes for this controller."""
+        self.router.add_api_websocket_route("/ingest", self.ingest)
+
+    async def ingest(self, websocket: WebSocket) -> None:
+        """Accept framed create commands and acknowledge them in micro-batches.
+
+        Frames are JSON text or MessagePack binary holding one command
+        ``{"seq", "name", "description"}`` or a list of them. Each batch is
+        acknowledged with ``{"type": "ack", "results": [{"seq", "id"}|{"seq",
+        "error"}]}``. Clients should keep at most ``window`` commands unacked.
+        """
+        await websocket.accept()
+        session = IngestSession(
+            websocket, self.request_scope, self.max_in_flight, self.max_batch_size
+        )
+        with operation_context("service_ingest_session", logger):
+            session.send(
+                {
+                    "type": "ready",
+                    "window": self.max_in_flight,
+                    "max_batch_size": self.max_batch_size,
+                }
+            )
+            sender = asyncio.create_task(session.transmit())
+            writer = asyncio.create_task(session.write())
+            try:
+                await session.read()
+            finally:
+                await writer
+                await sender
+            logger.info("Ingest session closed", extra={"acked": session.acked})
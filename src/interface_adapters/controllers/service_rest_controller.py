@@ -1,36 +1,69 @@
 """Service controller implementing REST endpoints for services."""
 
-from typing import List
+from typing import Any, Callable, ContextManager, FrozenSet, List, Optional, Union
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
 
-from ...application.get_service_interactor import GetServiceInteractor
-from ...application.create_service_interactor import CreateServiceInteractor
 from ...domain.exceptions import ServiceNotFoundError, ServiceValidationError
 from ...interface_adapters.dtos.service_response_dto import (
     ServiceListResponseDTO,
     ServiceResponseDTO,
+    parse_field_selection,
 )
 from ...interface_adapters.dtos.service_request_dto import CreateServiceRequest
+from ...interface_adapters.serializers import msgpack_serializer
+from ...interface_adapters.serializers.msgpack_serializer import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+)
+from ...infrastructure.container import RequestScope
 from ...infrastructure.logging_context import get_contextual_logger, operation_context
 
 # Create router without prefix - prefix will be added when included in the app
 router = APIRouter()
 logger = get_contextual_logger(__name__)
 
+# Upper bound on the number of IDs accepted by a single multi-get request
+MAX_IDS_PER_REQUEST = 500
+
+FIELDS_QUERY_DESCRIPTION = "Comma-separated response fields to include, e.g. id,name"
+
+# OpenAPI content declarations for the negotiated wire formats
+_CREATE_REQUEST_SCHEMA = CreateServiceRequest.model_json_schema()
+CREATE_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            JSON_MEDIA_TYPE: {"schema": _CREATE_REQUEST_SCHEMA},
+            MSGPACK_MEDIA_TYPE: {"schema": _CREATE_REQUEST_SCHEMA},
+        },
+    }
+}
+MSGPACK_RESPONSE = {"content": {MSGPACK_MEDIA_TYPE: {}}}
+
+# Responses of negotiated routes depend on the Accept header, whichever
+# format was chosen, so shared caches must key them on it
+VARY_ACCEPT = {"Vary": "Accept"}
+
+
+def vary_on_accept(response: Response) -> None:
+    """Mark the response of a negotiated route as varying with Accept.
+
+    Covers models returned for FastAPI to serialize; responses built by
+    the controller set the header themselves.
+    """
+    response.headers.update(VARY_ACCEPT)
+
 
 class ServiceController:
     """Controller for service-related endpoints following Clean Architecture."""
 
-    def __init__(
-        self,
-        create_service_interactor: CreateServiceInteractor,
-        get_service_interactor: GetServiceInteractor,
-    ):
-        """Initialize with required use cases."""
-        self.create_service_interactor = create_service_interactor
-        self.get_service_interactor = get_service_interactor
+    def __init__(self, request_scope: Callable[[], ContextManager[RequestScope]]):
+        """Initialize with a provider of request-scoped use cases."""
+        self.request_scope = request_scope
         self.router = APIRouter()
         self._register_routes()
 
@@ -42,40 +75,112 @@ class ServiceController:
             methods=["POST"],
             response_model=ServiceResponseDTO,
             status_code=status.HTTP_201_CREATED,
+            responses={status.HTTP_201_CREATED: MSGPACK_RESPONSE},
+            openapi_extra=CREATE_REQUEST_BODY,
+            dependencies=[Depends(vary_on_accept)],
         )
         self.router.add_api_route(
             "/{service_id}",
             self.get_service,
             methods=["GET"],
             response_model=ServiceResponseDTO,
+            responses={status.HTTP_200_OK: MSGPACK_RESPONSE},
+            dependencies=[Depends(vary_on_accept)],
         )
         self.router.add_api_route(
             "",
             self.get_all_services,
             methods=["GET"],
             response_model=ServiceListResponseDTO,
+            responses={status.HTTP_200_OK: MSGPACK_RESPONSE},
+            dependencies=[Depends(vary_on_accept)],
         )
 
-    async def create_service(
-        self, request: Request, create_request: CreateServiceRequest
-    ) -> ServiceResponseDTO:
-        """Create a new service."""
-        with operation_context("create_service_endpoint", logger):
-            try:
+    @staticmethod
+    async def _read_create_request(request: Request) -> CreateServiceRequest:
+        """Parse a create request from a JSON or MessagePack body.
 
-                result = self.create_service_interactor.create_service(
-                    name=create_request.name, description=create_request.description
+        Validation failures are raised as ``RequestValidationError`` so both
+        formats get FastAPI's standard 422 response.
+        """
+        body = await request.body()
+        try:
+            if msgpack_serializer.is_msgpack(request.headers.get("content-type", "")):
+                return CreateServiceRequest.model_validate(
+                    msgpack_serializer.decode(body)
                 )
+            return CreateServiceRequest.model_validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            )
+        except ValueError as e:
+            raise RequestValidationError(
+                [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]
+            )
+
+    @staticmethod
+    def _render(
+        request: Request,
+        model: BaseModel,
+        include: Optional[Any] = None,
+        status_code: int = status.HTTP_200_OK,
+    ) -> Union[BaseModel, Response]:
+        """Encode a response model in the negotiated format and field selection.
+
+        MessagePack is used when the Accept header prefers it. Otherwise,
+        without a field selection the model is returned for FastAPI to
+        serialize as usual; with one, pydantic skips unselected fields while
+        encoding, so they are never serialized at all.
+        """
+        if msgpack_serializer.prefers_msgpack(request.headers.get("accept", "")):
+            return Response(
+                content=msgpack_serializer.encode(model.model_dump(include=include)),
+                status_code=status_code,
+                media_type=MSGPACK_MEDIA_TYPE,
+                headers=VARY_ACCEPT,
+            )
+        if include is None:
+            return model
+        return Response(
+            content=model.model_dump_json(include=include),
+            status_code=status_code,
+            media_type=JSON_MEDIA_TYPE,
+            headers=VARY_ACCEPT,
+        )
+
+    async def create_service(self, request: Request) -> ServiceResponseDTO:
+        """Create a new service from a JSON or MessagePack body."""
+        create_request = await self._read_create_request(request)
+        with operation_context("create_service_endpoint", logger):
+            try:
+                with self.request_scope() as scope:
+                    scope.create_service_interactor.create_service(
+                        name=create_request.name,
+                        description=create_request.description,
+                    )
+                    presenter = scope.presenter
 
-                if not result or not result.id:
-                    raise ServiceValidationError("Failed to create service")
+                    if presenter.response is None:
+                        raise ServiceValidationError(
+                            presenter.error or "Failed to create service"
+                        )
 
-                return ServiceResponseDTO.from_dto(result)
+                    return self._render(
+                        request,
+                        presenter.response,
+                        status_code=status.HTTP_201_CREATED,
+                    )
 
             except ServiceValidationError as e:
                 logger.error("Failed to create service", extra={"error": str(e)})
                 return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(e)}
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content={"detail": str(e)},
+                    headers=VARY_ACCEPT,
                 )
             except Exception as e:
                 logger.error(
@@ -85,25 +190,49 @@ class ServiceController:
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
                 )
 
+    @staticmethod
+    def _parse_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+        """Parse the ``fields`` query into a field selection, if one was given."""
+        if fields is None:
+            return None
+        try:
+            return parse_field_selection(fields)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    @staticmethod
+    def _list_include(selection: Optional[FrozenSet[str]]) -> Optional[dict]:
+        """Build the list-response include spec for a field selection."""
+        if selection is None:
+            return None
+        return {"services": {"__all__": selection}, "not_found": True}
+
     async def get_service(
-        self, request: Request, service_id: UUID
+        self,
+        request: Request,
+        service_id: UUID,
+        fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
     ) -> ServiceResponseDTO:
         """Get a service by ID."""
+        selection = self._parse_fields(fields)
         with operation_context(
             "get_service_endpoint", logger, service_id=str(service_id)
         ):
             try:
-                result = self.get_service_interactor.get_service(service_id)
+                with self.request_scope() as scope:
+                    scope.get_service_interactor.get_service(service_id)
+                    presenter = scope.presenter
 
-                if not result:
-                    logger.error(
-                        "Failed to get service", extra={"service_id": str(service_id)}
-                    )
-                    raise ServiceNotFoundError(
-                        f"Service with ID {service_id} not found"
-                    )
+                    if presenter.response is None:
+                        logger.error(
+                            "Failed to get service",
+                            extra={"service_id": str(service_id)},
+                        )
+                        raise ServiceNotFoundError(
+                            f"Service with ID {service_id} not found"
+                        )
 
-                return ServiceResponseDTO.from_dto(result)
+                    return self._render(request, presenter.response, selection)
 
             except ServiceNotFoundError as e:
                 raise HTTPException(
@@ -117,14 +246,50 @@ class ServiceController:
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
                 )
 
-    async def get_all_services(self, request: Request) -> ServiceListResponseDTO:
-        """Get all services."""
+    @staticmethod
+    def _parse_ids(raw_ids: List[str]) -> List[UUID]:
+        """Parse repeated and/or comma-separated ``ids`` query values."""
+        try:
+            service_ids = [
+                UUID(part)
+                for value in raw_ids
+                for part in value.split(",")
+                if part.strip()
+            ]
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid service ID in ids: {e}",
+            )
+        if len(service_ids) > MAX_IDS_PER_REQUEST:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_IDS_PER_REQUEST} ids can be requested at once",
+            )
+        return service_ids
+
+    async def get_all_services(
+        self,
+        request: Request,
+        ids: Optional[List[str]] = Query(
+            None, description="Comma-separated service IDs to fetch in one call"
+        ),
+        fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
+    ) -> ServiceListResponseDTO:
+        """Get all services, or only the services with the given IDs."""
+        include = self._list_include(self._parse_fields(fields))
+        if ids is not None:
+            return self._get_services_by_ids(request, self._parse_ids(ids), include)
+
         with operation_context("get_all_services_endpoint", logger):
             try:
-                results = self.get_service_interactor.get_all_services()
-                return ServiceListResponseDTO(
-                    services=[ServiceResponseDTO.from_dto(dto) for dto in results]
-                )
+                with self.request_scope() as scope:
+                    scope.get_service_interactor.get_all_services()
+                    return self._render(
+                        request,
+                        ServiceListResponseDTO(services=scope.presenter.responses),
+                        include,
+                    )
             except Exception as e:
                 logger.error(
                     "Unexpected error getting all services", extra={"error": str(e)}
@@ -132,3 +297,35 @@ class ServiceController:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
                 )
+
+    def _get_services_by_ids(
+        self,
+        request: Request,
+        service_ids: List[UUID],
+        include: Optional[dict] = None,
+    ) -> ServiceListResponseDTO:
+        """Get the services with the given IDs in a single batched lookup."""
+        with operation_context(
+            "get_services_endpoint", logger, requested=len(service_ids)
+        ):
+            with self.request_scope() as scope:
+                scope.get_service_interactor.get_services(service_ids)
+                presenter = scope.presenter
+
+                if presenter.error:
+                    logger.error(
+                        "Unexpected error getting services by ID",
+                        extra={"error": presenter.error},
+                    )
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=presenter.error,
+                    )
+
+                return self._render(
+                    request,
+                    ServiceListResponseDTO(
+                        services=presenter.responses, not_found=presenter.not_found
+                    ),
+                    include,
+                )
@@ -1,6 +1,7 @@
 """DTOs for health check responses."""
 
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel
 
 
@@ -12,12 +13,49 @@ class HealthResponse(BaseModel):
     version: str
 
 
+class ReadinessResponse(BaseModel):
+    """Readiness check response model."""
+
+    status: str
+    ready: bool
+    timestamp: datetime
+
+
 class SystemMetrics(BaseModel):
     """System metrics for detailed health check."""
 
     cpu_usage: float
     memory_usage: float
     disk_usage: float
+    sampled_at: Optional[datetime] = None
+    age_seconds: Optional[float] = None  # Since the background sample was taken
+
+
+class GCGenerationStats(BaseModel):
+    """Garbage collections of one generation since startup."""
+
+    collections: int
+    collected: int
+    pause_total_ms: float
+    pause_max_ms: float
+
+
+class SlowCallbackEvent(BaseModel):
+    """A callback that blocked the event loop, with the stack it blocked in."""
+
+    timestamp: datetime
+    blocked_ms: float
+    stack: list[str]
+
+
+class RuntimeMetrics(BaseModel):
+    """Event loop lag, slow callbacks and GC pauses."""
+
+    loop_lag_ms: float
+    loop_lag_max_ms: float
+    slow_callbacks: int
+    recent_slow_callbacks: list[SlowCallbackEvent]
+    gc: dict[str, GCGenerationStats]
 
 
 class HealthDetailedResponse(HealthResponse):
@@ -25,4 +63,5 @@ class HealthDetailedResponse(HealthResponse):
 
     uptime: float
     services: dict[str, str]
-    system_metrics: SystemMetrics
+    system_metrics: Optional[SystemMetrics] = None  # None until first sampled
+    runtime_metrics: Optional[RuntimeMetrics] = None
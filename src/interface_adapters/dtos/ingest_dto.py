@@ -0,0 +1,20 @@
+"""DTOs for the bulk-ingest WebSocket channel."""
+
+from typing import List
+from pydantic import BaseModel, TypeAdapter
+
+
+class IngestCommand(BaseModel):
+    """A single create command received on the ingest channel.
+
+    Length limits are enforced by the use case so an invalid command is
+    rejected on its own instead of failing the whole frame.
+    """
+
+    seq: int
+    name: str
+    description: str = ""
+
+
+# A frame carries either one command or a list of them
+IngestFrame = TypeAdapter(List[IngestCommand])
@@ -1,7 +1,8 @@
 """DTOs for service responses that cross the interface boundary."""
 
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import FrozenSet, List
 from uuid import UUID
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -48,3 +49,22 @@ class ServiceListResponseDTO(BaseModel):
     """DTO for service list responses in the REST API."""
 
     services: List[ServiceResponseDTO] = []
+    not_found: List[UUID] = []
+
+
+@lru_cache(maxsize=256)
+def parse_field_selection(fields: str) -> FrozenSet[str]:
+    """Parse a comma-separated ``fields`` selection into a set of field names.
+
+    Results are cached because clients send the same handful of selections.
+
+    Raises:
+        ValueError: If the selection is empty or names an unknown field.
+    """
+    selected = frozenset(part.strip() for part in fields.split(",") if part.strip())
+    if not selected:
+        raise ValueError("fields must name at least one field")
+    unknown = selected - ServiceResponseDTO.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return selected
@@ -1,5 +1,6 @@
 import logging
 from typing import Optional, List
+from uuid import UUID
 from ...application.get_service_output_port import GetServiceOutputPort
 from ...application.create_service_output_port import CreateServiceOutputPort
 from ...domain.service_entity import Service
@@ -16,9 +17,21 @@ class ServicePresenter(GetServiceOutputPort, CreateServiceOutputPort):
     def __init__(self):
         self.response: Optional[ServiceResponseDTO] = None
         self.responses: List[ServiceResponseDTO] = []
+        self.not_found: List[UUID] = []
+        self.created_ids: List[Optional[UUID]] = []
+        self.batch_errors: List[Optional[str]] = []
         self.error: Optional[str] = None
         logger.debug("Initialized ServicePresenter")
 
+    def reset(self) -> None:
+        """Clear presented state so the presenter can serve another request."""
+        self.response = None
+        self.responses = []
+        self.not_found = []
+        self.created_ids = []
+        self.batch_errors = []
+        self.error = None
+
     def _to_response_dto(self, service: Service) -> ServiceResponseDTO:
         """Convert domain entity to response DTO."""
         with operation_context(
@@ -50,7 +63,8 @@ class ServicePresenter(GetServiceOutputPort, CreateServiceOutputPort):
             if service:
                 try:
                     logger.debug(
-                        "Presenting service", extra={"service_id": str(service.id)}
+                        "Presenting service",
+                        extra=lambda: {"service_id": str(service.id)},
                     )
                     self.response = self._to_response_dto(service)
                 except Exception as e:
@@ -66,11 +80,30 @@ class ServicePresenter(GetServiceOutputPort, CreateServiceOutputPort):
         with operation_context("present_services", logger, count=len(services)):
             try:
                 self.responses = [self._to_response_dto(s) for s in services]
-                logger.info(f"Presented {len(services)} services")
+                logger.info("Presented %d services", len(services))
+            except Exception as e:
+                logger.error("Error presenting services", extra={"error": str(e)})
+                self.error = str(e)
+                self.responses = []
+
+    def present_service_batch(
+        self, services: List[Service], not_found: List[UUID]
+    ) -> None:
+        """Present the result of a multi-get."""
+        with operation_context(
+            "present_service_batch",
+            logger,
+            count=len(services),
+            not_found=len(not_found),
+        ):
+            try:
+                self.responses = [self._to_response_dto(s) for s in services]
+                self.not_found = not_found
             except Exception as e:
                 logger.error("Error presenting services", extra={"error": str(e)})
                 self.error = str(e)
                 self.responses = []
+                self.not_found = []
 
     def present_error(self, message: str) -> None:
         """Present an error message."""
@@ -97,6 +130,18 @@ class ServicePresenter(GetServiceOutputPort, CreateServiceOutputPort):
                 )
                 self.error = str(e)
 
+    def present_created_services(
+        self, services: List[Optional[Service]], errors: List[Optional[str]]
+    ) -> None:
+        """Present a batch creation result as created IDs and per-item errors.
+
+        Only IDs are kept; building full response DTOs for every item of a
+        bulk ingest would cost more than the write itself.
+        """
+        with operation_context("present_created_services", logger, count=len(services)):
+            self.created_ids = [s.id if s is not None else None for s in services]
+            self.batch_errors = errors
+
     def present_creation_error(self, message: str) -> None:
         """Present an error that occurred during service creation."""
         with operation_context("present_creation_error", logger):
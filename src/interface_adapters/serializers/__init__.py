@@ -0,0 +1,3 @@
+"""Wire format serializers for the interface adapters layer."""
+
+# This package contains encoders and decoders for non-JSON response formats
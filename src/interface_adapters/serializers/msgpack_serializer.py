@@ -0,0 +1,90 @@
+"""MessagePack wire format and content negotiation for service endpoints."""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+
+from ...infrastructure.lazy_imports import lazy_import
+
+# Only MessagePack requests need the codec, so load it on first use
+msgpack = lazy_import("msgpack")
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Media types accepted as MessagePack, including the legacy x- prefixed form
+MSGPACK_MEDIA_TYPES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack"})
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+
+
+def _default(obj: Any) -> Any:
+    """Encode types msgpack does not support natively.
+
+    UUIDs become 16-byte bins and datetimes the standard timestamp ext type
+    (-1). Naive datetimes are treated as UTC, matching the domain entities.
+    The timestamp is built from the epoch delta directly, which is several
+    times cheaper than ``Timestamp.from_datetime``.
+    """
+    if isinstance(obj, UUID):
+        return obj.bytes
+    if isinstance(obj, datetime):
+        delta = obj - (_EPOCH if obj.tzinfo is None else _EPOCH_UTC)
+        return msgpack.Timestamp(
+            delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+        )
+    raise TypeError(f"Cannot serialize {type(obj).__name__} to MessagePack")
+
+
+def encode(data: Any) -> bytes:
+    """Encode python-mode model data to MessagePack."""
+    return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+def decode(payload: bytes) -> Any:
+    """Decode a MessagePack payload, returning timestamps as aware datetimes.
+
+    Raises:
+        ValueError: If the payload is not valid MessagePack.
+    """
+    try:
+        return msgpack.unpackb(payload, raw=False, timestamp=3)
+    except (ValueError, msgpack.UnpackException) as e:
+        raise ValueError(f"Invalid MessagePack body: {e}") from e
+
+
+def is_msgpack(content_type: str) -> bool:
+    """Check whether a Content-Type header denotes a MessagePack body."""
+    return content_type.split(";", 1)[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+@lru_cache(maxsize=128)
+def prefers_msgpack(accept: str) -> bool:
+    """Decide from an Accept header whether to respond with MessagePack.
+
+    MessagePack must be listed explicitly and rank strictly above an explicit
+    JSON entry; a wildcard of equal quality loses to the explicit MessagePack
+    entry. In every other case JSON stays the default.
+    """
+    msgpack_q = 0.0
+    json_q = 0.0
+    wildcard_q = 0.0
+    for media_range in accept.split(","):
+        media_type, *params = media_range.split(";")
+        media_type = media_type.strip().lower()
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type == JSON_MEDIA_TYPE:
+            json_q = max(json_q, q)
+        elif media_type in ("application/*", "*/*"):
+            wildcard_q = max(wildcard_q, q)
+    return msgpack_q > 0 and msgpack_q > json_q and msgpack_q >= wildcard_q
@@ -1,6 +1,14 @@
 """Main entry point of the application."""
 
-from src.infrastructure.app_bootstrap import bootstrap_application
+import sys
 
 if __name__ == "__main__":
+    if "--profile-startup" in sys.argv[1:]:
+        # Imported before the application so its own imports can be timed
+        from src.infrastructure.startup_profiler import main as profile_startup
+
+        sys.exit(profile_startup(sys.argv[1:]))
+
+    from src.infrastructure.app_bootstrap import bootstrap_application
+
     bootstrap_application()
@@ -25,6 +25,7 @@ def test_client():
         app_name="Test Clean Architecture Service",
         host="127.0.0.1",
         port=8000,
+        debug_endpoints_enabled=True,
     )
 
     # Create the FastAPI app
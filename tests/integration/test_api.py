@@ -1,10 +1,16 @@
+import logging
+import time
 import pytest
 from fastapi.testclient import TestClient
-from uuid import uuid4
+from prometheus_client import REGISTRY
+from datetime import datetime
+from uuid import UUID, uuid4
 
 from src.config.settings import Settings
 from src.infrastructure.rest_server import create_app
 from src.infrastructure.container import Container
+from src.infrastructure.log_ring_buffer import LogRingBuffer, set_log_ring_buffer
+from src.interface_adapters.serializers import msgpack_serializer
 
 
 @pytest.fixture
@@ -16,6 +22,7 @@ def test_client():
         app_name="Test Clean Architecture Service",
         host="127.0.0.1",
         port=8000,
+        debug_endpoints_enabled=True,
     )
 
     # Create the FastAPI app
@@ -64,6 +71,24 @@ def test_detailed_health_check(test_client):
     assert "uptime" in data
     assert "services" in data
     assert "system_metrics" in data
+    assert set(data["runtime_metrics"]["gc"]) == {"0", "1", "2"}
+    assert data["runtime_metrics"]["loop_lag_ms"] >= 0
+
+
+def test_detailed_health_check_serves_background_sample(test_client):
+    """Test that system metrics come from the sampler, with their age."""
+    for _ in range(200):
+        data = test_client.get("/health/detailed").json()
+        if data["system_metrics"] is not None:
+            break
+        time.sleep(0.01)
+
+    assert data["system_metrics"]["age_seconds"] >= 0
+    assert "sampled_at" in data["system_metrics"]
+
+    samples = test_client.get("/debug/system").json()["samples"]
+    assert samples
+    assert set(samples[-1]) >= {"cpu_usage", "memory_usage", "age_seconds"}
 
 
 def test_metrics_endpoint(test_client):
@@ -75,6 +100,29 @@ def test_metrics_endpoint(test_client):
     assert "http_requests_total" in response.text
 
 
+def test_metrics_endpoint_negotiates_format_and_encoding(test_client):
+    """Test that /metrics serves OpenMetrics and gzip when asked for."""
+    response = test_client.get(
+        "/metrics",
+        headers={
+            "Accept": "application/openmetrics-text; version=1.0.0",
+            "Accept-Encoding": "gzip",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/openmetrics-text")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.endswith("# EOF\n")
+
+    response = test_client.get("/metrics", headers={"Accept-Encoding": "identity"})
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "content-encoding" not in response.headers
+
+    response = test_client.get("/metrics", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in response.headers
+
+
 def test_create_service(test_client):
     """Test creating a new service."""
     service_data = {
@@ -149,3 +197,427 @@ def test_create_service_invalid_input(test_client):
     assert response.status_code == 422  # FastAPI's default validation error status
     data = response.json()
     assert "detail" in data
+
+
+def test_get_services_by_ids(test_client, created_service):
+    """Test fetching several services by ID in a single request."""
+    missing_id = str(uuid4())
+    response = test_client.get(
+        "/v1/services", params={"ids": f"{created_service['id']},{missing_id}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["id"] for s in data["services"]] == [created_service["id"]]
+    assert data["not_found"] == [missing_id]
+
+
+def test_get_services_by_ids_invalid_id(test_client):
+    """Test that a malformed ID in a multi-get is rejected."""
+    response = test_client.get("/v1/services", params={"ids": "not-a-uuid"})
+
+    assert response.status_code == 400
+    assert "detail" in response.json()
+
+
+def test_get_service_with_field_selection(test_client, created_service):
+    """Test that only the requested fields are returned for a single service."""
+    response = test_client.get(
+        f"/v1/services/{created_service['id']}", params={"fields": "id,name"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": created_service["id"],
+        "name": created_service["name"],
+    }
+
+
+def test_get_all_services_with_field_selection(test_client, created_service):
+    """Test that field selection applies to every service in a list."""
+    response = test_client.get("/v1/services", params={"fields": "id,is_active"})
+
+    assert response.status_code == 200
+    services = response.json()["services"]
+    assert services
+    assert all(set(s) == {"id", "is_active"} for s in services)
+
+
+def test_get_service_with_unknown_field(test_client, created_service):
+    """Test that selecting an unknown field is rejected."""
+    response = test_client.get(
+        f"/v1/services/{created_service['id']}", params={"fields": "id,owner"}
+    )
+
+    assert response.status_code == 400
+    assert "owner" in response.json()["detail"]
+
+
+def test_create_and_get_service_msgpack(test_client):
+    """Test creating and fetching a service with the MessagePack wire format."""
+    headers = {
+        "Content-Type": "application/msgpack",
+        "Accept": "application/msgpack",
+    }
+    body = msgpack_serializer.encode({"name": "Binary Service", "description": ""})
+
+    response = test_client.post("/v1/services", content=body, headers=headers)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/msgpack"
+    created = msgpack_serializer.decode(response.content)
+    assert created["name"] == "Binary Service"
+    assert len(created["id"]) == 16
+    assert isinstance(created["created_at"], datetime)
+
+    service_id = UUID(bytes=created["id"])
+    response = test_client.get(f"/v1/services/{service_id}")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == str(service_id)
+
+
+def test_negotiated_responses_vary_on_accept(test_client):
+    """Test that every format of a negotiated route is marked Vary: Accept."""
+    created = test_client.post(
+        "/v1/services", json={"name": "Cached", "description": "x"}
+    )
+    service_id = created.json()["id"]
+
+    responses = [
+        created,
+        test_client.get(f"/v1/services/{service_id}"),
+        test_client.get(f"/v1/services/{service_id}", params={"fields": "id"}),
+        test_client.get("/v1/services"),
+        test_client.get("/v1/services", params={"ids": service_id}),
+        test_client.get(
+            f"/v1/services/{service_id}", headers={"Accept": "application/msgpack"}
+        ),
+    ]
+
+    for response in responses:
+        assert response.status_code in (200, 201)
+        vary = [value.strip() for value in response.headers["vary"].split(",")]
+        assert "Accept" in vary
+
+
+def test_create_service_invalid_msgpack(test_client):
+    """Test that an undecodable MessagePack body is a validation error."""
+    response = test_client.post(
+        "/v1/services",
+        content=b"\xc1",
+        headers={"Content-Type": "application/msgpack"},
+    )
+
+    assert response.status_code == 422
+    assert "detail" in response.json()
+
+
+def test_ingest_websocket(test_client):
+    """Test bulk creation over the ingest WebSocket channel."""
+    with test_client.websocket_connect("/v1/services/ingest") as websocket:
+        ready = websocket.receive_json()
+        assert ready["type"] == "ready"
+        assert ready["window"] > 0
+
+        websocket.send_json(
+            [
+                {"seq": 1, "name": "Ingested One"},
+                {"seq": 2, "name": ""},
+                {"seq": 3, "name": "Ingested Three", "description": "bulk"},
+            ]
+        )
+
+        results = {}
+        while len(results) < 3:
+            ack = websocket.receive_json()
+            assert ack["type"] == "ack"
+            results.update({r["seq"]: r for r in ack["results"]})
+
+    assert "name cannot be empty" in results[2]["error"].lower()
+    response = test_client.get(
+        "/v1/services", params={"ids": f"{results[1]['id']},{results[3]['id']}"}
+    )
+    assert [s["name"] for s in response.json()["services"]] == [
+        "Ingested One",
+        "Ingested Three",
+    ]
+
+
+def test_ingest_websocket_rejects_malformed_frame(test_client):
+    """Test that a malformed frame is reported without closing the channel."""
+    with test_client.websocket_connect("/v1/services/ingest") as websocket:
+        websocket.receive_json()
+
+        websocket.send_text("not json")
+        assert websocket.receive_json()["type"] == "error"
+
+        websocket.send_json({"seq": 7, "name": "After Error"})
+        ack = websocket.receive_json()
+        assert ack["results"][0]["seq"] == 7
+        assert "id" in ack["results"][0]
+
+
+def test_ingest_websocket_interleaves_errors_and_acks(test_client):
+    """Test that errors and acks sent concurrently all arrive intact."""
+    with test_client.websocket_connect("/v1/services/ingest") as websocket:
+        websocket.receive_json()
+
+        for seq in range(20):
+            websocket.send_json({"seq": seq, "name": f"Interleaved {seq}"})
+            websocket.send_text("not json")
+
+        errors = 0
+        acked = set()
+        while errors < 20 or len(acked) < 20:
+            message = websocket.receive_json()
+            if message["type"] == "error":
+                errors += 1
+            else:
+                acked.update(result["seq"] for result in message["results"])
+
+    assert acked == set(range(20))
+
+
+def _wait_until_ready(client, attempts=200):
+    """Poll the readiness endpoint until it reports ready."""
+    for _ in range(attempts):
+        response = client.get("/health/ready")
+        if response.status_code == 200:
+            return response
+        time.sleep(0.01)
+    return response
+
+
+def test_readiness_after_warmup():
+    """Test that readiness flips after warmup and warmup leaves no data behind."""
+    app = create_app(Settings(warmup_enabled=True, warmup_iterations=2))
+
+    with TestClient(app) as client:
+        response = _wait_until_ready(client)
+
+        assert response.status_code == 200
+        assert response.json()["ready"] is True
+        assert client.get("/v1/services").json()["services"] == []
+
+
+def test_timed_out_warmup_leaves_no_data_behind():
+    """Test that services created before a warmup timeout are still deleted."""
+    app = create_app(
+        Settings(
+            warmup_enabled=True,
+            warmup_iterations=100_000,
+            warmup_timeout_seconds=0.2,
+        )
+    )
+
+    with TestClient(app) as client:
+        response = _wait_until_ready(client)
+
+        assert response.status_code == 200
+        assert client.get("/v1/services").json()["services"] == []
+
+
+def test_shutdown_waits_for_cancelled_warmup(monkeypatch):
+    """Test that shutdown lets a running warmup finish before cleaning up."""
+    ready_at_cleanup = []
+    cleanup = Container.cleanup
+
+    async def recording_cleanup(container):
+        ready_at_cleanup.append(app.state.ready)
+        await cleanup(container)
+
+    monkeypatch.setattr(Container, "cleanup", recording_cleanup)
+    app = create_app(
+        Settings(
+            warmup_enabled=True,
+            warmup_iterations=100_000,
+            warmup_timeout_seconds=60.0,
+        )
+    )
+
+    with TestClient(app) as client:
+        assert client.get("/health/ready").status_code == 503
+
+    assert ready_at_cleanup == [True]
+
+
+def test_warmup_requests_are_not_observed():
+    """Test that warmup requests stay out of metrics, traces and accounting."""
+
+    def samples():
+        labels = {"method": "POST", "endpoint": "/v1/services"}
+        return (
+            REGISTRY.get_sample_value("http_requests_total", {**labels, "status": "201"}),
+            REGISTRY.get_sample_value("http_request_cpu_seconds_count", labels),
+        )
+
+    app = create_app(
+        Settings(
+            warmup_enabled=True,
+            trace_sample_rate=1.0,
+            request_cpu_accounting=True,
+            debug_endpoints_enabled=True,
+        )
+    )
+    before = samples()
+
+    with TestClient(app) as client:
+        _wait_until_ready(client)
+        traces = client.get("/debug/traces", params={"limit": 100}).json()["traces"]
+
+    assert samples() == before
+    assert not [trace for trace in traces if "/v1/services" in trace["name"]]
+
+
+def test_readiness_without_warmup():
+    """Test that the app is ready immediately when warmup is disabled."""
+    app = create_app(Settings(warmup_enabled=False))
+
+    with TestClient(app) as client:
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+
+
+def test_request_resources_are_recorded_per_route():
+    """Test that CPU time and sampled allocations are exported per route."""
+    app = create_app(
+        Settings(
+            warmup_enabled=False,
+            request_cpu_accounting=True,
+            request_alloc_sample_rate=1.0,
+        )
+    )
+
+    with TestClient(app) as client:
+        # A body is read through BaseHTTPMiddleware's cancellable task group
+        response = client.post(
+            "/v1/services", json={"name": "Accounted", "description": "x"}
+        )
+        assert response.status_code == 201
+        client.get("/v1/services")
+        metrics = client.get("/metrics").text
+
+    for method in ("GET", "POST"):
+        labels = f'{{endpoint="/v1/services",method="{method}"}}'
+        assert f"http_request_cpu_seconds_count{labels} 1.0" in metrics
+        assert f"http_request_allocated_bytes_count{labels} 1.0" in metrics
+
+
+def test_debug_traces_lists_kept_requests():
+    """Test that sampled request traces can be listed and fetched."""
+    app = create_app(
+        Settings(
+            warmup_enabled=False,
+            trace_sample_rate=1.0,
+            debug_endpoints_enabled=True,
+        )
+    )
+
+    with TestClient(app) as client:
+        client.post("/v1/services", json={"name": "Traced", "description": "x"})
+
+        response = client.get("/debug/traces", params={"limit": 1})
+        assert response.status_code == 200
+        (summary,) = response.json()["traces"]
+        assert summary["name"] == "POST /v1/services"
+        assert summary["decision"] == "baseline"
+
+        trace = client.get(f"/debug/traces/{summary['trace_id']}").json()
+        names = [span["name"] for span in trace["spans"]]
+        assert names[0] == "POST /v1/services"
+        assert "create_service" in names
+        assert client.get("/debug/traces/0").status_code == 404
+
+
+def test_debug_endpoints_are_off_by_default():
+    """Test that /debug routes are not registered unless enabled."""
+    app = create_app(Settings(warmup_enabled=False))
+
+    with TestClient(app) as client:
+        assert client.get("/debug/traces").status_code == 404
+
+
+def test_debug_logs_filters_by_request_id(test_client):
+    """Test that buffered records of one request can be queried."""
+    ring_buffer = LogRingBuffer(capacity=1000)
+    root_logger = logging.getLogger()
+    root_level = root_logger.level
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(ring_buffer)
+    set_log_ring_buffer(ring_buffer)
+    try:
+        response = test_client.get("/v1/services")
+        req_id = response.headers["X-Request-ID"]
+
+        response = test_client.get("/debug/logs", params={"request_id": req_id})
+        assert response.status_code == 200
+        records = response.json()
+        assert {record["request_id"] for record in records} == {req_id}
+        assert records[0]["message"] == "Request started"
+        assert records[-1]["message"] == "Request completed"
+
+        response = test_client.get("/debug/logs", params={"level": "bogus"})
+        assert response.status_code == 422
+    finally:
+        root_logger.removeHandler(ring_buffer)
+        root_logger.setLevel(root_level)
+        set_log_ring_buffer(None)
+
+
+def test_metrics_use_route_templates(test_client):
+    """Test that request metrics are labelled by route template, not path."""
+    service_id = uuid4()
+    test_client.get(f"/v1/services/{service_id}")
+    test_client.get(f"/v1/services/{uuid4()}")
+    test_client.get(f"/unknown/{uuid4()}")
+
+    metrics = test_client.get("/metrics").text
+
+    assert 'endpoint="/v1/services/{service_id}"' in metrics
+    assert 'endpoint="<unmatched>"' in metrics
+    assert str(service_id) not in metrics
+
+
+def test_debug_latency_reports_percentiles(test_client):
+    """Test that /debug/latency reports percentiles per route template."""
+    for _ in range(3):
+        test_client.get("/health")
+
+    response = test_client.get(
+        "/debug/latency", params={"metric": "http_request_duration"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["percentiles"] == [50.0, 90.0, 99.0, 99.9]
+    rows = {
+        row["labels"]["endpoint"]: row
+        for row in data["metrics"]["http_request_duration"]
+    }
+    assert rows["/health"]["count"] >= 3
+    assert rows["/health"]["p50"] <= rows["/health"]["p999"]
+
+    response = test_client.get("/debug/latency", params={"metric": "unknown"})
+    assert response.status_code == 404
+
+
+def test_debug_profile_returns_collapsed_stacks_and_flame_graph(test_client):
+    """Test that /debug/profile samples the worker in both output formats."""
+    response = test_client.post("/debug/profile", params={"seconds": 0.1})
+
+    assert response.status_code == 200
+    assert int(response.headers["x-profile-samples"]) > 0
+    stack, count = response.text.splitlines()[0].rsplit(" ", 1)
+    assert int(count) > 0
+
+    response = test_client.post(
+        "/debug/profile", params={"seconds": 0.1, "format": "svg"}
+    )
+    assert response.headers["content-type"] == "image/svg+xml"
+    assert "<svg" in response.text
+
+    response = test_client.post("/debug/profile", params={"seconds": 3600})
+    assert response.status_code == 422
@@ -0,0 +1,65 @@
+from src.config.settings import Settings
+from src.infrastructure.container import Container
+
+
+def test_request_scopes_have_isolated_presenters():
+    """Test that concurrent request scopes never share an output port."""
+    # Given
+    container = Container()
+
+    # When
+    first = container.acquire_scope()
+    second = container.acquire_scope()
+
+    # Then
+    assert first.presenter is not second.presenter
+    assert first.get_service_interactor.output_port is first.presenter
+    assert first.create_service_interactor.output_port is first.presenter
+    assert second.get_service_interactor.output_port is second.presenter
+
+
+def test_request_scope_shares_repository():
+    """Test that request scopes use the container's singleton repository."""
+    # Given
+    container = Container()
+
+    # When
+    with container.request_scope() as scope:
+        repository = scope.get_service_interactor.repository
+
+    # Then
+    assert repository is container.get_repository()
+
+
+def test_released_scope_is_reset_and_reused():
+    """Test that a released scope is cleared and handed out again."""
+    # Given
+    container = Container()
+    with container.request_scope() as scope:
+        scope.create_service_interactor.create_service("Pooled", "A pooled service")
+        assert scope.presenter.response is not None
+
+    # When
+    with container.request_scope() as reused:
+        pass
+
+    # Then
+    assert reused is scope
+    assert reused.presenter.response is None
+    assert reused.presenter.responses == []
+    assert reused.presenter.error is None
+
+
+def test_scope_pool_is_bounded():
+    """Test that the pool keeps at most the configured number of idle scopes."""
+    # Given
+    container = Container()
+    container.set_settings(Settings(request_scope_pool_size=2))
+    scopes = [container.acquire_scope() for _ in range(4)]
+
+    # When
+    for scope in scopes:
+        container.release_scope(scope)
+
+    # Then
+    assert len(container._scope_pool) == 2
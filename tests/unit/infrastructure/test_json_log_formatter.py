@@ -0,0 +1,113 @@
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from pythonjsonlogger.json import JsonFormatter
+
+from src.infrastructure.json_log_formatter import FastJsonFormatter
+
+FORMAT = "%(asctime)s %(name)s %(levelname)s %(message)s %(pathname)s %(lineno)s"
+
+
+def make_record(created=None, **extra):
+    record = logging.LogRecord(
+        "test", logging.INFO, "/app/module.py", 42, "Fetched %s", ("svc",), None
+    )
+    if created is not None:
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        {},
+        {
+            "request_id": "abc",
+            "service_id": uuid4(),
+            "created_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "duration_ms": 12,
+            "ratio": 0.5,
+            "is_active": True,
+            "missing": None,
+            "entity_name": "café \"quoted\"\n",
+            "tags": ["a", "b"],
+            "error": ValueError("bad"),
+        },
+    ],
+)
+def test_output_matches_python_json_logger(extra):
+    """Test that the output is identical to the formatter it replaces."""
+    # Given
+    record = make_record(**extra)
+
+    # When
+    expected = JsonFormatter(FORMAT).format(record)
+    actual = FastJsonFormatter(FORMAT).format(record)
+
+    # Then
+    assert actual == expected
+
+
+def test_exception_is_included():
+    """Test that exception info is rendered under exc_info."""
+    # Given
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = make_record()
+        record.exc_info = sys.exc_info()
+
+    # When
+    data = json.loads(FastJsonFormatter(FORMAT).format(record))
+
+    # Then
+    assert data["exc_info"].endswith("RuntimeError: boom")
+
+
+def test_caller_info_can_be_omitted():
+    """Test that call-site fields are dropped without caller info."""
+    # Given
+    record = make_record(request_id="abc")
+
+    # When
+    data = json.loads(FastJsonFormatter(FORMAT, include_caller=False).format(record))
+
+    # Then
+    assert "pathname" not in data
+    assert "lineno" not in data
+    assert data["message"] == "Fetched svc"
+    assert data["request_id"] == "abc"
+
+
+def test_private_attributes_are_skipped():
+    """Test that underscore-prefixed record attributes are not emitted."""
+    # Given
+    record = make_record(_log_route="root", operation="get")
+
+    # When
+    data = json.loads(FastJsonFormatter(FORMAT).format(record))
+
+    # Then
+    assert "_log_route" not in data
+    assert data["operation"] == "get"
+
+
+def test_cached_timestamp_follows_record_time():
+    """Test that the per-second timestamp cache tracks each record's time."""
+    # Given
+    formatter = FastJsonFormatter(FORMAT)
+    reference = logging.Formatter()
+    first = make_record(created=1_700_000_000.125)
+    same_second = make_record(created=1_700_000_000.5)
+    next_second = make_record(created=1_700_000_001.25)
+
+    # When / Then
+    for record in (first, same_second, next_second):
+        data = json.loads(formatter.format(record))
+        assert data["asctime"] == reference.formatTime(record)
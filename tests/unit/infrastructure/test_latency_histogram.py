@@ -0,0 +1,112 @@
+import random
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.infrastructure.latency_histogram import (
+    BUCKET_COUNT,
+    MAX_VALUE_NS,
+    LatencyHistogram,
+    LatencyHistogramFamily,
+    bucket_bounds,
+    bucket_index,
+    latency_report,
+    merge_snapshots,
+    snapshot,
+)
+from src.infrastructure.metrics import (
+    ConfigurableHistogram,
+    configure_histogram_buckets,
+)
+
+
+def test_bucket_resolution():
+    """Test that every value falls in a bucket at most 1/64 of it wide."""
+    rng = random.Random(42)
+    values = [0, 1, 127, 128, 129, 255, 256, MAX_VALUE_NS]
+    values += [rng.randrange(MAX_VALUE_NS) for _ in range(1000)]
+    for value in values:
+        index = bucket_index(value)
+        low, high = bucket_bounds(index)
+        assert 0 <= index < BUCKET_COUNT
+        assert low <= value <= high
+        assert high - low <= max(value, 1) / 64
+
+
+def test_percentiles():
+    """Test that percentiles are accurate to the bucket resolution."""
+    # Given 1ms to 1000ms, one value each
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms * 1_000_000)
+
+    # When
+    summary = histogram.summary([50, 99, 99.9])
+
+    # Then
+    assert summary["count"] == 1000
+    assert summary["min_ms"] == 1.0
+    assert summary["max_ms"] == 1000.0
+    assert summary["p50"] == pytest.approx(500, rel=0.016)
+    assert summary["p99"] == pytest.approx(990, rel=0.016)
+    assert summary["p999"] == pytest.approx(999, rel=0.016)
+
+
+def test_empty_histogram_summary():
+    """Test that an empty histogram reports only its count."""
+    assert LatencyHistogram().summary([50]) == {"count": 0}
+
+
+def test_snapshots_merge_across_processes():
+    """Test that snapshots of several families merge by adding counts."""
+    # Given two workers recording the same series
+    first = LatencyHistogramFamily("latency", ("route",))
+    second = LatencyHistogramFamily("latency", ("route",))
+    first.labels("/a").record(1_000_000)
+    second.labels("/a").record(3_000_000)
+    second.labels("/b").record(2_000_000)
+
+    # When
+    merged = merge_snapshots([snapshot([first]), snapshot([second])])
+
+    # Then
+    series = merged["latency"]
+    assert series[("/a",)].count == 2
+    assert series[("/a",)].sum_ns == 4_000_000
+    assert series[("/a",)].max_ns == 3_000_000
+    assert series[("/b",)].count == 1
+    report = latency_report(merged, {"latency": ("route",)}, [50])
+    assert [row["labels"] for row in report["latency"]] == [
+        {"route": "/a"},
+        {"route": "/b"},
+    ]
+
+
+def test_histogram_buckets_can_be_configured_until_first_use():
+    """Test that configured buckets are used and fixed once recording starts."""
+    # Given
+    histogram = ConfigurableHistogram(
+        "test_configurable_seconds", "Test histogram", ["route"], buckets=[0.005]
+    )
+
+    # When
+    histogram.configure([0.1, 1.0])
+    histogram.labels(route="/buckets").observe(0.5)
+
+    # Then
+    labels = {"route": "/buckets"}
+    assert REGISTRY.get_sample_value(
+        "test_configurable_seconds_bucket", {**labels, "le": "1.0"}
+    ) == 1
+    assert REGISTRY.get_sample_value(
+        "test_configurable_seconds_bucket", {**labels, "le": "0.005"}
+    ) is None
+    histogram.configure([0.1, 1.0])
+    with pytest.raises(RuntimeError):
+        histogram.configure([2.0])
+
+
+def test_configure_histogram_buckets_rejects_unknown_names():
+    """Test that buckets can only be configured for known histograms."""
+    with pytest.raises(ValueError):
+        configure_histogram_buckets({"unknown_seconds": [1.0]})
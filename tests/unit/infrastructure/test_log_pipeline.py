@@ -0,0 +1,163 @@
+import logging
+import threading
+
+from src.infrastructure.log_pipeline import (
+    BLOCK,
+    DROP,
+    BatchWriteMixin,
+    BoundedQueueHandler,
+    LogPipeline,
+)
+
+
+class RecordingHandler(BatchWriteMixin, logging.Handler):
+    """Handler that records batches instead of writing them."""
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.batches = []
+        self.records = []
+        self.release_event = threading.Event()
+        self.release_event.set()
+
+    def emit_batch(self, records):
+        self.release_event.wait()
+        self.batches.append(list(records))
+        super().emit_batch(records)
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def test_records_are_written_by_listener_on_stop():
+    """Test that queued records are flushed to the handlers when stopping."""
+    # Given
+    handler = RecordingHandler()
+    logger = make_logger("test_log_pipeline.flush", handler)
+    pipeline = LogPipeline(queue_size=100)
+    pipeline.install(logger)
+    pipeline.start()
+
+    # When
+    for i in range(10):
+        logger.info("message %d", i)
+    pipeline.stop()
+
+    # Then
+    assert [r.getMessage() for r in handler.records] == [
+        f"message {i}" for i in range(10)
+    ]
+    assert logger.handlers == [handler]
+
+
+def test_listener_writes_in_batches():
+    """Test that records queued while the writer is busy are written together."""
+    # Given
+    handler = RecordingHandler()
+    logger = make_logger("test_log_pipeline.batches", handler)
+    pipeline = LogPipeline(queue_size=100, batch_size=50)
+    pipeline.install(logger)
+    handler.release_event.clear()
+    pipeline.start()
+
+    # When
+    logger.info("first")
+    for i in range(20):
+        logger.info("queued %d", i)
+    handler.release_event.set()
+    pipeline.stop()
+
+    # Then
+    assert len(handler.records) == 21
+    assert len(handler.batches) < 21
+
+
+def test_handler_levels_are_respected():
+    """Test that the listener filters records by each handler's level."""
+    # Given
+    handler = RecordingHandler(level=logging.WARNING)
+    logger = make_logger("test_log_pipeline.levels", handler)
+    pipeline = LogPipeline()
+    pipeline.install(logger)
+    pipeline.start()
+
+    # When
+    logger.info("ignored")
+    logger.warning("kept")
+    pipeline.stop()
+
+    # Then
+    assert [r.getMessage() for r in handler.records] == ["kept"]
+
+
+def test_drop_policy_counts_and_reports_dropped_records():
+    """Test that a full queue drops records and the listener reports it."""
+    # Given
+    handler = RecordingHandler()
+    logger = make_logger("test_log_pipeline.drop", handler)
+    pipeline = LogPipeline(queue_size=5, policy=DROP)
+    pipeline.install(logger)
+
+    # When - nothing drains the queue until the listener starts
+    for i in range(8):
+        logger.info("message %d", i)
+    pipeline.start()
+    pipeline.stop()
+
+    # Then
+    assert pipeline.dropped == 3
+    messages = [r.getMessage() for r in handler.records]
+    assert messages[:5] == [f"message {i}" for i in range(5)]
+    assert messages[5] == "Log queue full, dropped 3 records"
+
+
+def test_block_policy_waits_for_room():
+    """Test that the block policy waits for the listener instead of dropping."""
+    # Given
+    handler = RecordingHandler()
+    logger = make_logger("test_log_pipeline.block", handler)
+    pipeline = LogPipeline(queue_size=2, policy=BLOCK, block_timeout=5.0)
+    pipeline.install(logger)
+    pipeline.start()
+
+    # When
+    for i in range(50):
+        logger.info("message %d", i)
+    pipeline.stop()
+
+    # Then
+    assert pipeline.dropped == 0
+    assert len(handler.records) == 50
+
+
+def test_unknown_policy_is_rejected():
+    """Test that only the drop and block policies are accepted."""
+    try:
+        BoundedQueueHandler(None, "root", policy="spill")
+    except ValueError as e:
+        assert "spill" in str(e)
+    else:
+        raise AssertionError("Expected ValueError")
+
+
+def test_queue_handler_skips_levels_no_handler_writes():
+    """Test that records below every handler's level are not enqueued."""
+    # Given
+    handler = RecordingHandler(level=logging.INFO)
+    logger = make_logger("test_log_pipeline.level", handler)
+    pipeline = LogPipeline(queue_size=100)
+
+    # When
+    queue_handler = pipeline.install(logger)
+
+    # Then
+    assert queue_handler.level == logging.INFO
+    pipeline.stop()
@@ -0,0 +1,118 @@
+import json
+import logging
+
+from src.config.logging_config import configure_logging, shutdown_logging
+from src.config.settings import Settings
+from src.infrastructure.log_ring_buffer import LogRingBuffer
+from src.infrastructure.logging_context import (
+    get_contextual_logger,
+    operation_id,
+    request_id,
+)
+
+
+def make_logger(name, ring_buffer):
+    logger = logging.getLogger(name)
+    logger.handlers = [ring_buffer]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def test_keeps_only_the_most_recent_records():
+    """Test that the ring overwrites the oldest records once full."""
+    # Given
+    ring_buffer = LogRingBuffer(capacity=3)
+    logger = make_logger("test_log_ring_buffer.wrap", ring_buffer)
+
+    # When
+    for i in range(5):
+        logger.debug("message %d", i)
+
+    # Then
+    assert len(ring_buffer) == 3
+    assert [r.getMessage() for r in ring_buffer.records()] == [
+        "message 2",
+        "message 3",
+        "message 4",
+    ]
+
+
+def test_query_filters_by_request_operation_and_level():
+    """Test filtering on the context fields ContextualLogger adds."""
+    # Given
+    ring_buffer = LogRingBuffer(capacity=100)
+    make_logger("test_log_ring_buffer.query", ring_buffer)
+    logger = get_contextual_logger("test_log_ring_buffer.query")
+    request_token = request_id.set("req-1")
+    operation_token = operation_id.set("op-1")
+    try:
+        logger.info("Starting operation", extra={"operation": "get_service"})
+        logger.debug("inside")
+        logger.warning("careful")
+    finally:
+        operation_id.reset(operation_token)
+        request_id.reset(request_token)
+    logger.info("other request")
+
+    # When
+    by_request = ring_buffer.query(request_id="req-1")
+    by_operation_name = ring_buffer.query(operation="get_service")
+    by_operation_id = ring_buffer.query(operation="op-1")
+    warnings = ring_buffer.query(level=logging.WARNING)
+    limited = ring_buffer.query(limit=1)
+
+    # Then
+    assert [r.getMessage() for r in by_request] == [
+        "Starting operation",
+        "inside",
+        "careful",
+    ]
+    assert [r.getMessage() for r in by_operation_name] == ["Starting operation"]
+    assert by_operation_id == by_request
+    assert [r.getMessage() for r in warnings] == ["careful"]
+    assert [r.getMessage() for r in limited] == ["other request"]
+
+
+def test_exception_records_keep_the_rendered_traceback():
+    """Test that buffered records hold the traceback text, not the frames."""
+    # Given
+    ring_buffer = LogRingBuffer(capacity=10)
+    logger = make_logger("test_log_ring_buffer.exc", ring_buffer)
+
+    # When
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("failed")
+
+    # Then
+    (record,) = ring_buffer.records()
+    assert record.exc_info is None
+    (rendered,) = json.loads(ring_buffer.render([record]))
+    assert rendered["message"] == "failed"
+    assert rendered["exc_info"].endswith("RuntimeError: boom")
+
+
+def test_default_settings_leave_debug_disabled():
+    """Test that the ring does not lower the root logger to DEBUG by default."""
+    # Given
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    settings = Settings()
+
+    # When
+    try:
+        configure_logging(
+            debug=settings.debug,
+            ring_size=settings.log_ring_size,
+            ring_level=settings.log_ring_level,
+        )
+        debug_enabled = root.isEnabledFor(logging.DEBUG)
+    finally:
+        shutdown_logging()
+        root.handlers = handlers
+        root.setLevel(level)
+
+    # Then
+    assert not debug_enabled
@@ -0,0 +1,251 @@
+import logging
+import time
+
+import pytest
+
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.logging_context import (
+    OperationLogSampler,
+    OperationSamplingConfig,
+    configure_operation_sampling,
+    get_contextual_logger,
+    operation_context,
+    request_id,
+)
+
+
+class RecordingLogger:
+    """Logger stand-in that records the messages it receives."""
+
+    def __init__(self):
+        self.messages = []
+
+    def info(self, msg, extra=None):
+        self.messages.append(msg)
+
+    def error(self, msg, extra=None):
+        self.messages.append(msg)
+
+
+class CaptureHandler(logging.Handler):
+    """Handler that keeps emitted records."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def captured():
+    """Contextual logger at INFO level and the records it emits."""
+    handler = CaptureHandler()
+    stdlib_logger = logging.getLogger("test_logging_context.captured")
+    stdlib_logger.handlers = [handler]
+    stdlib_logger.setLevel(logging.INFO)
+    stdlib_logger.propagate = False
+    return get_contextual_logger(stdlib_logger.name), handler.records
+
+
+@pytest.fixture(autouse=True)
+def default_sampling():
+    """Restore full operation logging after each test."""
+    yield
+    configure_operation_sampling(OperationSamplingConfig())
+
+
+def test_all_operations_are_logged_by_default():
+    """Test that without sampling every start and completion is logged."""
+    # Given
+    logger = RecordingLogger()
+
+    # When
+    with operation_context("op", logger):
+        pass
+
+    # Then
+    assert logger.messages == ["Starting operation: op", "Operation completed: op"]
+
+
+def test_unsampled_operations_are_not_logged():
+    """Test that operations outside the sample are not logged."""
+    # Given
+    configure_operation_sampling(OperationSamplingConfig(sample_rate=0.0))
+    logger = RecordingLogger()
+
+    # When
+    for _ in range(10):
+        with operation_context("op", logger):
+            pass
+
+    # Then
+    assert logger.messages == []
+
+
+def test_per_operation_rate_overrides_default():
+    """Test that a per-name sample rate takes precedence over the default."""
+    # Given
+    configure_operation_sampling(
+        OperationSamplingConfig(sample_rate=0.0, sample_rates={"important": 1.0})
+    )
+    logger = RecordingLogger()
+
+    # When
+    with operation_context("noisy", logger):
+        pass
+    with operation_context("important", logger):
+        pass
+
+    # Then
+    assert logger.messages == [
+        "Starting operation: important",
+        "Operation completed: important",
+    ]
+
+
+def test_failures_are_always_logged():
+    """Test that a failing operation is logged even when not sampled."""
+    # Given
+    configure_operation_sampling(OperationSamplingConfig(sample_rate=0.0))
+    logger = RecordingLogger()
+
+    # When
+    with pytest.raises(ValueError):
+        with operation_context("op", logger):
+            raise ValueError("boom")
+
+    # Then
+    assert logger.messages == ["Operation failed: op"]
+
+
+def test_slow_operations_are_always_logged():
+    """Test that operations over the slow threshold are logged when not sampled."""
+    # Given
+    configure_operation_sampling(
+        OperationSamplingConfig(sample_rate=0.0, slow_threshold_ms=1)
+    )
+    logger = RecordingLogger()
+
+    # When
+    with operation_context("op", logger):
+        time.sleep(0.005)
+
+    # Then
+    assert logger.messages == ["Operation completed: op"]
+
+
+def test_rate_limit_is_per_operation_name():
+    """Test that the rate limit caps each operation name independently."""
+    # Given
+    sampler = OperationLogSampler(OperationSamplingConfig(rate_limit_per_second=3))
+
+    # When
+    first = [sampler.should_log("a") for _ in range(5)]
+    second = [sampler.should_log("b") for _ in range(5)]
+
+    # Then
+    assert first == [True, True, True, False, False]
+    assert second == [True, True, True, False, False]
+
+
+def test_disabled_level_does_not_evaluate_lazy_extra(captured):
+    """Test that a lazy extra is never built for a disabled level."""
+    # Given
+    logger, records = captured
+
+    def build_extra():
+        raise AssertionError("extra evaluated for a disabled level")
+
+    # When
+    logger.debug("Not emitted", extra=build_extra)
+
+    # Then
+    assert records == []
+
+
+def test_lazy_extra_is_evaluated_for_enabled_level(captured):
+    """Test that a lazy extra ends up on the record like a plain one."""
+    # Given
+    logger, records = captured
+
+    # When
+    logger.info("Emitted %s", "lazily", extra=lambda: {"name": "svc", "count": 2})
+
+    # Then
+    (record,) = records
+    assert record.getMessage() == "Emitted lazily"
+    assert record.entity_name == "svc"
+    assert record.count == 2
+
+
+def test_context_follows_request_id_changes(captured):
+    """Test that the cached context is rebuilt when the request changes."""
+    # Given
+    logger, records = captured
+
+    # When
+    token = request_id.set("first")
+    logger.info("one")
+    logger.info("two")
+    request_id.set("second")
+    logger.info("three")
+    request_id.reset(token)
+    logger.info("four")
+
+    # Then
+    assert [getattr(r, "request_id", None) for r in records] == [
+        "first",
+        "first",
+        "second",
+        None,
+    ]
+
+
+def test_records_are_attributed_to_the_caller(captured):
+    """Test that caller info points at the call site, not the wrapper."""
+    # Given
+    logger, records = captured
+
+    # When
+    logger.info("where")
+
+    # Then
+    assert records[0].funcName == "test_records_are_attributed_to_the_caller"
+
+
+def test_adapter_records_are_attributed_to_the_caller(captured):
+    """Test that records logged through the logger port point at its caller."""
+    # Given
+    _, records = captured
+    adapter = LoggerAdapter("test_logging_context.captured")
+
+    # When
+    adapter.info("where", service_id="abc")
+
+    # Then
+    assert records[0].funcName == "test_adapter_records_are_attributed_to_the_caller"
+    assert records[0].service_id == "abc"
+
+
+def test_adapter_extra_is_only_built_when_emitted(captured):
+    """Test that a callable extra is not called for disabled levels."""
+    # Given
+    _, records = captured
+    adapter = LoggerAdapter("test_logging_context.captured")
+    calls = []
+
+    def extra():
+        calls.append(1)
+        return {"expensive": True}
+
+    # When
+    adapter.debug("skipped", extra=extra, service_id="abc")
+    adapter.info("emitted", extra=extra, service_id="abc")
+
+    # Then
+    assert calls == [1]
+    assert [record.getMessage() for record in records] == ["emitted"]
+    assert records[0].expensive is True
+    assert records[0].service_id == "abc"
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.infrastructure import metric_recorder
+from src.infrastructure.metric_recorder import (
+    OperationMetrics,
+    flush_metrics,
+    set_thread_accumulation,
+)
+from src.infrastructure.metrics_decorator import track_operation
+
+
+def operations(name, status):
+    value = REGISTRY.get_sample_value(
+        "service_operations_total", {"operation": name, "status": status}
+    )
+    return value or 0
+
+
+def latency(name, suffix, le=None):
+    labels = {"operation": name}
+    if le is not None:
+        labels["le"] = le
+    value = REGISTRY.get_sample_value(
+        f"service_operation_duration_seconds_{suffix}", labels
+    )
+    return value or 0
+
+
+@pytest.fixture
+def accumulate():
+    set_thread_accumulation(True)
+    yield
+    set_thread_accumulation(False)
+
+
+def test_decorator_records_success_and_failure():
+    """Test that the decorator counts outcomes and observes durations."""
+    # Given
+    @track_operation("test_recorder_decorator")
+    def operation(fail):
+        if fail:
+            raise ValueError("boom")
+
+    # When
+    operation(False)
+    with pytest.raises(ValueError):
+        operation(True)
+
+    # Then
+    assert operations("test_recorder_decorator", "success") == 1
+    assert operations("test_recorder_decorator", "error") == 1
+    assert latency("test_recorder_decorator", "count") == 2
+
+
+def test_accumulated_metrics_appear_on_flush(accumulate):
+    """Test that per-thread observations reach the metrics only when flushed."""
+    # Given
+    metrics = OperationMetrics("test_recorder_accumulate")
+
+    def record():
+        for _ in range(100):
+            metrics.record(2_000_000, success=True)  # 2ms
+        metrics.record(20_000_000, success=False)  # 20ms
+
+    threads = [threading.Thread(target=record) for _ in range(3)]
+
+    # When
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    before_flush = operations("test_recorder_accumulate", "success")
+    flush_metrics()
+    flush_metrics()
+
+    # Then
+    assert before_flush == 0
+    assert operations("test_recorder_accumulate", "success") == 300
+    assert operations("test_recorder_accumulate", "error") == 3
+    assert latency("test_recorder_accumulate", "count") == 303
+    assert latency("test_recorder_accumulate", "sum") == pytest.approx(0.66)
+    assert latency("test_recorder_accumulate", "bucket", le="0.005") == 300
+    assert latency("test_recorder_accumulate", "bucket", le="0.025") == 303
+
+
+def test_exited_threads_are_flushed_and_dropped(accumulate):
+    """Test that accumulators of finished threads do not pile up."""
+    # Given
+    metrics = OperationMetrics("test_recorder_exited")
+    thread = threading.Thread(target=metrics.record, args=(1_000, True))
+    thread.start()
+    thread.join()
+
+    # When
+    flush_metrics()
+
+    # Then
+    assert operations("test_recorder_exited", "success") == 1
+    assert not [
+        registration
+        for registration in metric_recorder._registered
+        if registration[0] is thread
+    ]
+
+
+def test_disabling_accumulation_flushes(accumulate):
+    """Test that switching back to direct recording keeps accumulated values."""
+    # Given
+    metrics = OperationMetrics("test_recorder_disable")
+    metrics.record(1_000, success=True)
+
+    # When
+    set_thread_accumulation(False)
+    metrics.record(1_000, success=True)
+
+    # Then
+    assert operations("test_recorder_disable", "success") == 2
@@ -0,0 +1,51 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from src.application.metrics_catalog import METRIC_CATALOG
+from src.domain.ports.metrics_port import UnknownMetricError
+from src.infrastructure.adapters.metrics_adapter import MetricsAdapter
+from src.infrastructure.metrics import CATALOG_METRICS
+
+
+def test_catalog_metrics_are_registered():
+    """Test that every catalog entry is exported under its export name."""
+    for name, definition in METRIC_CATALOG.items():
+        [description] = CATALOG_METRICS[name].describe()
+        assert description.name in (
+            definition.export_name or name,
+            (definition.export_name or name).removesuffix("_total"),
+        )
+
+
+def test_adapter_records_catalog_metrics():
+    """Test that each kind of metric is recorded on its labelled child."""
+    # Given
+    adapter = MetricsAdapter()
+    labels = {"operation": "adapter_test", "status": "success"}
+
+    # When
+    adapter.increment_counter("operation_count", 2, **labels)
+    adapter.increment_counter("operation_count", **labels)
+    adapter.observe_histogram(
+        "operation_duration_seconds", 0.5, operation="adapter_test"
+    )
+    adapter.set_gauge("services_count", 7)
+
+    # Then
+    assert REGISTRY.get_sample_value("service_operations_total", labels) == 3
+    assert REGISTRY.get_sample_value(
+        "service_operation_duration_seconds_sum", {"operation": "adapter_test"}
+    ) == 0.5
+    assert REGISTRY.get_sample_value("services_total") == 7
+
+
+def test_adapter_rejects_unknown_metrics():
+    """Test that names missing from the catalog, or of another kind, fail."""
+    adapter = MetricsAdapter()
+
+    with pytest.raises(UnknownMetricError):
+        adapter.increment_counter("no_such_metric")
+    with pytest.raises(UnknownMetricError):
+        adapter.increment_counter("services_count")
+    with pytest.raises(ValueError):
+        adapter.observe_histogram("operation_duration_seconds", 1.0, op="x")
@@ -0,0 +1,58 @@
+import asyncio
+import gzip
+
+from src.infrastructure import metrics_exposition
+from src.infrastructure.metrics_exposition import MetricsExposition
+
+
+def counting_render(monkeypatch):
+    calls = []
+
+    def render(openmetrics):
+        calls.append(openmetrics)
+        raw = f"render {len(calls)}".encode()
+        return raw, gzip.compress(raw)
+
+    monkeypatch.setattr(metrics_exposition, "_render", render)
+    return calls
+
+
+def test_concurrent_scrapes_share_one_rendering(monkeypatch):
+    """Test that scrapes within the cache window reuse one rendering."""
+    # Given
+    calls = counting_render(monkeypatch)
+    exposition = MetricsExposition(cache_seconds=60)
+
+    async def scrape():
+        return await asyncio.gather(*(exposition.render(False) for _ in range(5)))
+
+    # When
+    results = asyncio.run(scrape())
+
+    # Then
+    assert calls == [False]
+    assert {raw for raw, _ in results} == {b"render 1"}
+
+
+def test_formats_are_cached_separately(monkeypatch):
+    """Test that OpenMetrics and text renderings do not share a cache entry."""
+    calls = counting_render(monkeypatch)
+    exposition = MetricsExposition(cache_seconds=60)
+
+    asyncio.run(exposition.render(False))
+    asyncio.run(exposition.render(True))
+    asyncio.run(exposition.render(True))
+
+    assert calls == [False, True]
+
+
+def test_cache_can_be_disabled(monkeypatch):
+    """Test that every scrape renders when the cache window is 0."""
+    calls = counting_render(monkeypatch)
+    exposition = MetricsExposition(cache_seconds=0)
+
+    asyncio.run(exposition.render(False))
+    raw, gzipped = asyncio.run(exposition.render(False))
+
+    assert len(calls) == 2
+    assert gzip.decompress(gzipped) == raw == b"render 2"
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Multi-process mode is fixed when prometheus_client is imported, so each
+# worker runs in its own interpreter
+WORKER = """
+from src.infrastructure.metrics import REQUEST_COUNT, REQUESTS_IN_PROGRESS
+REQUEST_COUNT.labels(method="GET", endpoint="/health", status=200).inc()
+REQUESTS_IN_PROGRESS.labels(method="GET").inc()
+"""
+
+SCRAPER = WORKER + """
+from src.infrastructure.multiprocess_metrics import generate_metrics
+print(generate_metrics().decode())
+"""
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def run(code, directory):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(directory)}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def sample(exposition, name):
+    for line in exposition.splitlines():
+        if line.startswith(name):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{name} not in exposition")
+
+
+def test_workers_are_aggregated_and_dead_workers_are_dropped(tmp_path):
+    """Test that counters sum over all workers and live gauges over live ones."""
+    # Given two workers that exited without cleaning up
+    run(WORKER, tmp_path)
+    run(WORKER, tmp_path)
+    dead_files = set(tmp_path.glob("gauge_livesum_*.db"))
+    assert len(dead_files) == 2
+
+    # When a third worker serves a scrape
+    exposition = run(SCRAPER, tmp_path)
+
+    # Then
+    assert sample(exposition, "http_requests_total{") == 3
+    assert sample(exposition, "http_requests_in_progress{") == 1
+    assert dead_files.isdisjoint(tmp_path.glob("gauge_livesum_*.db"))
+
+
+def test_latency_histograms_are_merged_across_workers(tmp_path):
+    """Test that /debug/latency data includes the snapshots of other workers."""
+    record = """
+from src.infrastructure.metrics import REQUEST_LATENCY_HDR
+from src.infrastructure.multiprocess_metrics import write_latency_snapshot
+REQUEST_LATENCY_HDR.labels("GET", "/health").record(2_000_000)
+write_latency_snapshot()
+"""
+    report = """
+from src.infrastructure.multiprocess_metrics import collect_latency
+series = collect_latency()["http_request_duration"][("GET", "/health")]
+print(series.count)
+"""
+    run(record, tmp_path)
+    run(record, tmp_path)
+
+    assert run(record + report, tmp_path).strip() == "3"
+    assert len(list(tmp_path.glob("latency_*.json"))) == 3
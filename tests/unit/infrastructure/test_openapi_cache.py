@@ -0,0 +1,90 @@
+import gzip
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config.settings import Settings
+from src.infrastructure.openapi_cache import FINGERPRINT_KEY
+from src.infrastructure.rest_server import create_app
+
+
+def test_precomputed_schema_is_loaded(tmp_path):
+    """Test that a schema written by the build step is loaded at startup."""
+    # Given
+    settings = Settings(openapi_cache_path=str(tmp_path / "openapi.json.gz"))
+    create_app(settings).state.openapi_cache.write()
+
+    # When
+    app = create_app(settings)
+
+    # Then
+    assert app.openapi_schema is not None
+    assert app.openapi_schema[FINGERPRINT_KEY] == app.state.openapi_cache.fingerprint
+
+
+def test_stale_schema_is_ignored(tmp_path):
+    """Test that a schema built for different routes is not served."""
+    # Given
+    cache_path = str(tmp_path / "openapi.json.gz")
+    create_app(Settings(openapi_cache_path=cache_path)).state.openapi_cache.write()
+
+    # When
+    app = create_app(Settings(openapi_cache_path=cache_path, app_version="2.0.0"))
+
+    # Then
+    assert app.openapi_schema is None
+    with TestClient(app) as client:
+        assert client.get("/openapi.json").json()["info"]["version"] == "2.0.0"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"not gzip", gzip.compress(b"not json"), gzip.compress(b"[]")[:-4]],
+    ids=["empty", "not_gzip", "not_json", "truncated"],
+)
+def test_unreadable_schema_is_regenerated(tmp_path, content):
+    """Test that a corrupt schema file is ignored instead of failing startup."""
+    # Given
+    cache_path = tmp_path / "openapi.json.gz"
+    cache_path.write_bytes(content)
+
+    # When
+    app = create_app(Settings(openapi_cache_path=str(cache_path)))
+
+    # Then
+    assert app.openapi_schema is None
+    with TestClient(app) as client:
+        assert "/v1/services" in client.get("/openapi.json").json()["paths"]
+
+
+def test_schema_served_compressed(tmp_path):
+    """Test gzip and ETag handling of the schema endpoint."""
+    # Given
+    app = create_app(Settings(openapi_cache_path=str(tmp_path / "missing.json.gz")))
+
+    with TestClient(app) as client:
+        # When
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "/v1/services" in response.json()["paths"]
+
+        refused = client.get("/openapi.json", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "content-encoding" not in refused.headers
+
+        etag = response.headers["etag"]
+        response = client.get("/openapi.json", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+def test_docs_can_be_disabled():
+    """Test that docs pages are not registered when disabled."""
+    with TestClient(create_app(Settings(docs_enabled=False))) as client:
+        assert client.get("/docs").status_code == 404
+        assert client.get("/redoc").status_code == 404
+        assert client.get("/openapi.json").status_code == 200
+
+    with TestClient(create_app(Settings())) as client:
+        assert client.get("/docs").status_code == 200
@@ -0,0 +1,74 @@
+import asyncio
+import time
+import tracemalloc
+
+from src.infrastructure.request_accounting import RequestAccounting
+
+
+async def account(accounting, work):
+    """Run ``work`` in a task of its own, as call_next does, and account it."""
+    usage = accounting.begin()
+    try:
+        await asyncio.create_task(work())
+    finally:
+        accounting.end(usage)
+    return usage
+
+
+async def burn_cpu():
+    start = time.thread_time()
+    while time.thread_time() - start < 0.05:
+        pass
+
+
+async def idle():
+    await asyncio.sleep(0.01)
+
+
+def test_cpu_is_charged_to_the_request_that_used_it():
+    """Test that interleaved requests are not charged for each other's CPU."""
+
+    async def run():
+        accounting = RequestAccounting(cpu=True, alloc_sample_rate=0.0)
+        accounting.install()
+        try:
+            return await asyncio.gather(
+                account(accounting, burn_cpu), account(accounting, idle)
+            )
+        finally:
+            accounting.uninstall()
+
+    busy, waiting = asyncio.run(run())
+
+    assert busy.cpu_ns >= 50_000_000
+    assert waiting.cpu_ns < 10_000_000
+    assert busy.alloc_bytes is None
+
+
+def test_allocations_are_traced_only_while_sampled_requests_run():
+    """Test that tracemalloc measures sampled requests and is stopped after."""
+
+    async def allocate():
+        chunks = [bytearray(100_000) for _ in range(10)]
+        await asyncio.sleep(0)
+        del chunks
+
+    async def run():
+        accounting = RequestAccounting(cpu=False, alloc_sample_rate=1.0)
+        accounting.install()
+        try:
+            return await account(accounting, allocate)
+        finally:
+            accounting.uninstall()
+
+    usage = asyncio.run(run())
+
+    assert usage.alloc_bytes >= 1_000_000
+    assert not tracemalloc.is_tracing()
+
+
+def test_unselected_requests_are_not_accounted():
+    """Test that nothing is accounted when CPU and sampling are off."""
+    accounting = RequestAccounting(cpu=False, alloc_sample_rate=0.0)
+
+    assert accounting.begin() is None
@@ -0,0 +1,70 @@
+from fastapi import APIRouter, FastAPI
+
+from src.infrastructure.route_templates import (
+    UNMATCHED_ROUTE,
+    iter_routes,
+    route_template,
+)
+
+
+def make_app():
+    app = FastAPI()
+    router = APIRouter()
+
+    @router.get("/{item_id}")
+    async def get_item(item_id: str):
+        return {}
+
+    @app.get("/health")
+    async def health():
+        return {}
+
+    app.include_router(router, prefix="/v1/items")
+    return app, router
+
+
+def test_included_routes_resolve_to_their_full_template():
+    """Test that routes of included routers get the include prefix."""
+    # Given
+    app, router = make_app()
+    (item_route,) = router.routes
+    paths = [path for path, _ in iter_routes(app.routes)]
+
+    # When
+    template = route_template({"app": app, "route": item_route})
+
+    # Then
+    assert template == "/v1/items/{item_id}"
+    assert "/health" in paths
+
+
+def test_unmatched_requests_share_one_bucket():
+    """Test that requests without a matched route get the unmatched label."""
+    # Given
+    app, _ = make_app()
+
+    # When
+    template = route_template({"app": app})
+
+    # Then
+    assert template == UNMATCHED_ROUTE
+
+
+def test_routes_added_later_are_resolved():
+    """Test that the cached map is rebuilt for routes registered afterwards."""
+    # Given
+    app, router = make_app()
+    route_template({"app": app, "route": router.routes[0]})
+    late_router = APIRouter()
+
+    @late_router.get("/{name}")
+    async def late(name: str):
+        return {}
+
+    app.include_router(late_router, prefix="/late")
+
+    # When
+    template = route_template({"app": app, "route": late_router.routes[0]})
+
+    # Then
+    assert template == "/late/{name}"
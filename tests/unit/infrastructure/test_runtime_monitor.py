@@ -0,0 +1,77 @@
+import asyncio
+import gc
+import time
+
+from prometheus_client import REGISTRY
+
+from src.infrastructure.runtime_monitor import RuntimeMonitor
+
+
+def block_loop(seconds):
+    time.sleep(seconds)
+
+
+def test_slow_callback_is_captured_with_its_stack():
+    """Test that a blocking call is reported with the stack it blocked in."""
+
+    async def run():
+        monitor = RuntimeMonitor(interval=0.01, slow_callback_threshold_ms=50)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        block_loop(0.3)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+        return monitor.summary()
+
+    summary = asyncio.run(run())
+
+    [event] = [
+        event
+        for event in summary["recent_slow_callbacks"]
+        if any("in block_loop" in frame for frame in event["stack"])
+    ]
+    assert event["blocked_ms"] >= 250
+    assert summary["loop_lag_max_ms"] >= 250
+
+
+def test_slow_callback_between_lag_samples_is_captured():
+    """Test that a block is caught even when the lag task is mid-sleep."""
+
+    async def run():
+        monitor = RuntimeMonitor(interval=5.0, slow_callback_threshold_ms=50)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        block_loop(0.2)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+        return monitor.summary()
+
+    summary = asyncio.run(run())
+
+    assert summary["slow_callbacks"] == 1
+    [event] = summary["recent_slow_callbacks"]
+    assert any("in block_loop" in frame for frame in event["stack"])
+    assert event["blocked_ms"] >= 200
+    assert summary["loop_lag_max_ms"] == 0.0
+
+
+def test_gc_pauses_are_recorded_per_generation():
+    """Test that collections are counted and their pauses observed."""
+
+    def pauses():
+        value = REGISTRY.get_sample_value("gc_pause_seconds_count", {"generation": "2"})
+        return value or 0
+
+    async def run():
+        monitor = RuntimeMonitor(interval=0.01)
+        monitor.start()
+        gc.collect()
+        await monitor.stop()
+        return monitor.summary()
+
+    before = pauses()
+    summary = asyncio.run(run())
+
+    assert summary["gc"]["2"]["collections"] == 1
+    assert summary["gc"]["2"]["pause_total_ms"] > 0
+    assert pauses() == before + 1
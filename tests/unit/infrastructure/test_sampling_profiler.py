@@ -0,0 +1,76 @@
+import threading
+from xml.etree import ElementTree
+
+import pytest
+
+from src.infrastructure import sampling_profiler
+from src.infrastructure.flamegraph import render_flamegraph
+from src.infrastructure.sampling_profiler import (
+    OVERFLOW_STACK,
+    ProfilerBusyError,
+    SamplingProfiler,
+    run_profile,
+)
+
+
+def spin_here(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def spinning_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=spin_here, args=(stop,), name="spinner")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def test_profile_counts_folded_stacks(spinning_thread):
+    """Test that a busy thread's stack is sampled in folded form."""
+    profiler = run_profile(0.2, interval=0.005)
+
+    spinner_samples = sum(
+        count
+        for stack, count in profiler.counts.items()
+        if stack.startswith("spinner;")
+        and ";spin_here (test_sampling_profiler.py:16)" in stack
+    )
+    assert profiler.samples > 5
+    assert spinner_samples > 5
+    first_line = profiler.collapsed().splitlines()[0]
+    stack, count = first_line.rsplit(" ", 1)
+    assert int(count) == max(profiler.counts.values())
+
+
+def test_distinct_stacks_are_bounded(spinning_thread):
+    """Test that stacks beyond the limit are counted as one."""
+    profiler = SamplingProfiler(max_stacks=1)
+
+    for _ in range(5):
+        profiler.sample()
+
+    assert len(profiler.counts) == 2
+    assert OVERFLOW_STACK in profiler.counts
+
+
+def test_only_one_profile_runs_at_a_time():
+    """Test that a concurrent profile request is rejected."""
+    with sampling_profiler._profile_lock:
+        with pytest.raises(ProfilerBusyError):
+            run_profile(0.01)
+
+
+def test_flamegraph_is_valid_svg():
+    """Test that the flame graph is well-formed and escapes frame names."""
+    svg = render_flamegraph({"main;<module> (app.py:1);work": 3, "main;idle": 1})
+
+    root = ElementTree.fromstring(svg)
+    titles = [
+        element.text for element in root.iter("{http://www.w3.org/2000/svg}title")
+    ]
+    assert "all (4 samples, 100.00%)" in titles
+    assert "<module> (app.py:1) (3 samples, 75.00%)" in titles
+    assert "idle (1 samples, 25.00%)" in titles
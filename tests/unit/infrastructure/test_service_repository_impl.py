@@ -1,6 +1,7 @@
 import pytest
 from uuid import UUID
 
+from src.domain.service_entity import Service
 from src.domain.exceptions import ServiceNotFoundError, ServiceAlreadyExistsError
 from src.infrastructure.service_repository_impl import InMemoryServiceRepository
 
@@ -139,3 +140,31 @@ def test_save_duplicate_service(service_entity):
     # When / Then
     with pytest.raises(ServiceAlreadyExistsError):
         repository.save(service_entity)
+
+
+def test_get_many_services(service_entity):
+    """Test retrieving several services by ID in one call."""
+    # Given
+    repository = InMemoryServiceRepository()
+    repository.save(service_entity)
+    missing_id = UUID("00000000-0000-0000-0000-000000000000")
+
+    # When
+    found = repository.get_many([service_entity.id, missing_id])
+
+    # Then
+    assert list(found) == [service_entity.id]
+    assert found[service_entity.id].name == service_entity.name
+
+
+def test_save_many_is_all_or_nothing(service_entity):
+    """Test that a batch containing an existing service saves nothing."""
+    # Given
+    repository = InMemoryServiceRepository()
+    repository.save(service_entity)
+    new_service = Service.create("New", "A new service")
+
+    # When / Then
+    with pytest.raises(ServiceAlreadyExistsError):
+        repository.save_many([new_service, service_entity])
+    assert len(repository.get_all()) == 1
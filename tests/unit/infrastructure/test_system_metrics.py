@@ -0,0 +1,43 @@
+import time
+
+from prometheus_client import REGISTRY
+
+from src.infrastructure.system_metrics import SystemMetricsSampler, sample_to_dict
+
+
+def wait_for_samples(sampler, count, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while len(sampler.samples()) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_sampler_keeps_recent_samples_and_publishes_gauges():
+    """Test that samples are taken in the background into a bounded buffer."""
+    # Given
+    sampler = SystemMetricsSampler(interval=0.02, history=2)
+
+    # When
+    sampler.start()
+    try:
+        wait_for_samples(sampler, 2)
+        time.sleep(0.1)
+    finally:
+        sampler.stop()
+
+    # Then
+    samples = sampler.samples()
+    assert len(samples) == 2
+    assert samples[0].monotonic < samples[1].monotonic
+    latest = sampler.latest()
+    assert 0 <= latest.memory_usage <= 100
+    assert REGISTRY.get_sample_value("system_memory_usage_percent") == (
+        latest.memory_usage
+    )
+    data = sample_to_dict(latest)
+    assert "monotonic" not in data
+    assert data["age_seconds"] >= 0
+
+
+def test_latest_is_none_before_first_sample():
+    """Test that a stopped sampler has nothing to report."""
+    assert SystemMetricsSampler().latest() is None
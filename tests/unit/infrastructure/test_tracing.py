@@ -0,0 +1,247 @@
+import contextvars
+import json
+
+import pytest
+
+from src.infrastructure.logging_context import operation_context, operation_id
+from src.infrastructure.tracing import (
+    DECISION_BASELINE,
+    DECISION_ERROR,
+    DECISION_SLOW,
+    STATUS_ERROR,
+    BatchTraceProcessor,
+    OTLPJsonFileExporter,
+    SpanExporter,
+    TailSampler,
+    TailSamplingProcessor,
+    TraceStore,
+    current_span,
+    set_max_spans_per_trace,
+    set_processor,
+    shutdown_tracing,
+    start_span,
+)
+
+
+class RecordingExporter(SpanExporter):
+    """Exporter that keeps every batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self.shut_down = False
+
+    def export(self, traces):
+        self.batches.append(list(traces))
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+@pytest.fixture
+def exporter():
+    """Route completed traces to a recording exporter for the test."""
+    exporter = RecordingExporter()
+    set_processor(BatchTraceProcessor(exporter, batch_size=100, export_interval=60))
+    yield exporter
+    shutdown_tracing()
+
+
+def test_nested_spans_link_to_their_parent():
+    """Test that a span started inside another becomes its child."""
+    # When
+    with start_span("outer") as outer:
+        with start_span("inner") as inner:
+            assert current_span.get() is inner
+        assert current_span.get() is outer
+
+    # Then
+    assert current_span.get() is None
+    assert inner.parent is outer
+    assert inner.trace is outer.trace
+    assert outer.parent is None
+    assert inner.span_id != outer.span_id
+    assert inner.duration_ns <= outer.duration_ns
+
+
+def test_separate_roots_start_separate_traces():
+    """Test that each root span gets its own trace ID."""
+    # When
+    with start_span("first") as first:
+        pass
+    with start_span("second") as second:
+        pass
+
+    # Then
+    assert first.trace_id != second.trace_id
+
+
+def test_exception_marks_span_as_error():
+    """Test that a span exited by an exception records the error."""
+    # When
+    with pytest.raises(ValueError):
+        with start_span("failing") as span:
+            raise ValueError("boom")
+
+    # Then
+    assert span.status_code == STATUS_ERROR
+    assert span.status_message == "ValueError: boom"
+
+
+def test_operation_context_restores_enclosing_operation_id():
+    """Test that nested operations keep distinct IDs and restore the outer one."""
+    # When
+    with operation_context("outer"):
+        outer_id = operation_id.get()
+        with operation_context("inner"):
+            inner_id = operation_id.get()
+        restored_id = operation_id.get()
+
+    # Then
+    assert outer_id != inner_id
+    assert restored_id == outer_id
+    assert operation_id.get() is None
+
+
+def test_completed_traces_are_exported_on_shutdown(exporter):
+    """Test that a trace is exported with all its spans once its root ends."""
+    # Given
+    with start_span("request"):
+        with operation_context("get_service", service_id="abc"):
+            pass
+
+    # When
+    shutdown_tracing()
+
+    # Then
+    assert exporter.shut_down
+    (batch,) = exporter.batches
+    (trace,) = batch
+    assert sorted(span.name for span in trace.spans) == ["get_service", "request"]
+    child = next(span for span in trace.spans if span.name == "get_service")
+    assert child.attributes == {"service_id": "abc"}
+    assert child.parent is trace.root
+
+
+def test_spans_ending_after_their_root_are_dropped(exporter):
+    """Test that a child outliving its root does not change the exported trace."""
+    # Given
+    child_context = contextvars.copy_context()
+    with start_span("request"):
+        child = child_context.run(start_span("background").__enter__)
+
+    # When
+    child_context.run(child.__exit__, None, None, None)
+    shutdown_tracing()
+
+    # Then
+    (batch,) = exporter.batches
+    (trace,) = batch
+    assert [span.name for span in trace.spans] == ["request"]
+    assert trace.dropped_spans == 1
+
+
+def test_otlp_file_exporter_writes_json_lines(tmp_path):
+    """Test that the file exporter writes one OTLP request per batch."""
+    # Given
+    path = tmp_path / "traces.jsonl"
+    file_exporter = OTLPJsonFileExporter(path, "test-service")
+    set_processor(BatchTraceProcessor(file_exporter))
+    with start_span("request", {"http.status_code": 200}) as root:
+        with start_span("child"):
+            pass
+
+    # When
+    shutdown_tracing()
+
+    # Then
+    (line,) = path.read_text().splitlines()
+    resource_spans = json.loads(line)["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0]["value"] == {
+        "stringValue": "test-service"
+    }
+    spans = {s["name"]: s for s in resource_spans["scopeSpans"][0]["spans"]}
+    assert spans["request"]["traceId"] == root.trace_id_hex
+    assert "parentSpanId" not in spans["request"]
+    assert spans["child"]["parentSpanId"] == root.span_id_hex
+    assert spans["request"]["attributes"] == [
+        {"key": "http.status_code", "value": {"intValue": "200"}}
+    ]
+    assert int(spans["request"]["endTimeUnixNano"]) >= int(
+        spans["request"]["startTimeUnixNano"]
+    )
+
+
+def run_trace(processor, name="request", fail=False, children=1):
+    """Record a trace through ``processor`` and return its root span."""
+    set_processor(processor)
+    try:
+        with start_span(name) as root:
+            for i in range(children):
+                with start_span(f"child_{i}") as child:
+                    if fail:
+                        child.status_code = STATUS_ERROR
+    finally:
+        set_processor(None)
+    return root
+
+
+@pytest.mark.parametrize(
+    "fail, threshold_ms, rate, expected",
+    [
+        (True, None, 0.0, DECISION_ERROR),
+        (False, 0.0, 0.0, DECISION_SLOW),
+        (False, 60_000.0, 1.0, DECISION_BASELINE),
+        (False, 60_000.0, 0.0, None),
+    ],
+)
+def test_tail_sampler_decides_after_the_trace_ends(fail, threshold_ms, rate, expected):
+    """Test that errors, then latency, then the baseline rate decide."""
+    # Given
+    store = TraceStore()
+    processor = TailSamplingProcessor(TailSampler(threshold_ms, rate), store)
+
+    # When
+    root = run_trace(processor, fail=fail)
+
+    # Then
+    if expected is None:
+        assert len(store) == 0
+    else:
+        assert store.get(root.trace_id_hex).decision == expected
+
+
+def test_store_keeps_a_bounded_ring_per_decision():
+    """Test that baseline traffic does not evict kept error traces."""
+    # Given
+    store = TraceStore(max_traces_per_decision=2)
+    processor = TailSamplingProcessor(TailSampler(None, 1.0), store)
+    error_root = run_trace(processor, name="failing", fail=True)
+
+    # When
+    roots = [run_trace(processor, name=f"ok_{i}") for i in range(5)]
+
+    # Then
+    assert len(store) == 3
+    assert store.get(error_root.trace_id_hex) is not None
+    newest = [trace.root.name for trace in store.query(DECISION_BASELINE)]
+    assert newest == [roots[4].name, roots[3].name]
+
+
+def test_spans_per_trace_are_bounded():
+    """Test that spans beyond the limit are counted instead of buffered."""
+    # Given
+    store = TraceStore()
+    processor = TailSamplingProcessor(TailSampler(None, 1.0), store)
+    set_max_spans_per_trace(4)
+
+    # When
+    try:
+        root = run_trace(processor, children=10)
+    finally:
+        set_max_spans_per_trace(256)
+
+    # Then
+    trace = store.get(root.trace_id_hex)
+    assert len(trace.spans) == 4
+    assert trace.root is root
+    assert trace.dropped_spans == 7
@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.interface_adapters.serializers import msgpack_serializer
+
+
+def test_encode_decode_round_trip():
+    """Test that UUIDs travel as 16-byte bins and datetimes as timestamps."""
+    # Given
+    service_id = uuid4()
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 250000)
+
+    # When
+    decoded = msgpack_serializer.decode(
+        msgpack_serializer.encode({"id": service_id, "created_at": created_at})
+    )
+
+    # Then
+    assert decoded["id"] == service_id.bytes
+    assert decoded["created_at"] == created_at.replace(tzinfo=timezone.utc)
+
+
+def test_decode_invalid_payload():
+    """Test that malformed payloads raise ValueError."""
+    with pytest.raises(ValueError):
+        msgpack_serializer.decode(b"\xc1")
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        ("application/msgpack", True),
+        ("application/x-msgpack", True),
+        ("application/msgpack, */*", True),
+        ("application/json, application/msgpack", False),
+        ("application/json;q=0.5, application/msgpack", True),
+        ("application/msgpack;q=0.5, */*", False),
+        ("*/*", False),
+        ("", False),
+    ],
+)
+def test_prefers_msgpack(accept, expected):
+    """Test Accept header negotiation keeps JSON as the default."""
+    assert msgpack_serializer.prefers_msgpack(accept) is expected
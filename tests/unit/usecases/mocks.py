@@ -1,4 +1,4 @@
-from typing import Optional, List, Callable
+from typing import Dict, Iterable, Optional, List, Callable
 from uuid import UUID
 
 from src.domain.service_entity import Service
@@ -8,9 +8,12 @@ from src.application.get_service_output_port import GetServiceOutputPort
 from src.application.create_service_output_port import CreateServiceOutputPort
 from src.interface_adapters.dtos.service_dto import ServiceDTO  # Updated import
 from src.domain.ports.metrics_port import MetricsPort
+from src.application.metrics_catalog import METRIC_CATALOG
 from src.domain.ports.logger_port import LoggerPort, LoggingContextPort
 from contextlib import contextmanager
 
+import pytest
+
 
 class MockServiceRepository(ServiceRepository):
     """Mock implementation of ServiceRepository for testing."""
@@ -18,7 +21,9 @@ class MockServiceRepository(ServiceRepository):
     def __init__(self):
         self.services = {}
         self.save_called = False
+        self.save_many_called = False
         self.get_by_id_called = False
+        self.get_many_called = False
         self.get_all_called = False
         self.update_called = False
         self.delete_called = False
@@ -28,6 +33,12 @@ class MockServiceRepository(ServiceRepository):
         self.services[service.id] = service
         return service
 
+    def save_many(self, services: List[Service]) -> List[Service]:
+        self.save_many_called = True
+        for service in services:
+            self.services[service.id] = service
+        return services
+
     def get_by_id(self, service_id: UUID) -> Service:
         self.get_by_id_called = True
         service = self.services.get(service_id)
@@ -35,6 +46,10 @@ class MockServiceRepository(ServiceRepository):
             raise ServiceNotFoundError(f"Service with ID {service_id} not found")
         return service
 
+    def get_many(self, service_ids: Iterable[UUID]) -> Dict[UUID, Service]:
+        self.get_many_called = True
+        return {sid: self.services[sid] for sid in service_ids if sid in self.services}
+
     def get_all(self) -> List[Service]:
         self.get_all_called = True
         return list(self.services.values())
@@ -60,6 +75,7 @@ class MockGetServiceOutputPort(GetServiceOutputPort):
     def __init__(self):
         self.presented_service = None
         self.presented_services = None
+        self.not_found = None
         self.error = None
 
     def present_service(self, service: Optional[Service]) -> None:
@@ -68,6 +84,12 @@ class MockGetServiceOutputPort(GetServiceOutputPort):
     def present_services(self, services: List[Service]) -> None:
         self.presented_services = services
 
+    def present_service_batch(
+        self, services: List[Service], not_found: List[UUID]
+    ) -> None:
+        self.presented_services = services
+        self.not_found = not_found
+
     def present_error(self, message: str) -> None:
         self.error = message
 
@@ -77,29 +99,53 @@ class MockCreateServiceOutputPort(CreateServiceOutputPort):
 
     def __init__(self):
         self.presented_service = None
+        self.presented_services = None
+        self.batch_errors = None
         self.error = None
 
     def present_created_service(self, service: ServiceDTO) -> None:
         self.presented_service = service
 
+    def present_created_services(
+        self, services: List[Optional[Service]], errors: List[Optional[str]]
+    ) -> None:
+        self.presented_services = services
+        self.batch_errors = errors
+
     def present_creation_error(self, message: str) -> None:
         self.error = message
 
 
 class MockMetricsPort(MetricsPort):
-    """Mock implementation of MetricsPort for testing."""
+    """Mock implementation of MetricsPort for testing.
+
+    Records every call and fails the test on metrics that do not match the
+    catalog. ``pytest.fail`` is not an ``Exception``, so use cases that
+    swallow metric errors cannot hide it.
+    """
+
+    def __init__(self):
+        self.recorded = []
+
+    def _record(self, kind: str, name: str, value: float, labels: dict) -> None:
+        definition = METRIC_CATALOG.get(name)
+        if definition is None or definition.kind != kind:
+            pytest.fail(f"No {kind} named {name!r} in the metric catalog")
+        if set(labels) != set(definition.labels):
+            pytest.fail(f"Metric {name!r} takes labels {definition.labels}")
+        self.recorded.append((name, value, labels))
 
     def increment_counter(self, name: str, value: float = 1, **labels) -> None:
         """Mock implementation of increment_counter."""
-        pass
+        self._record("counter", name, value, labels)
 
     def set_gauge(self, name: str, value: float, **labels) -> None:
         """Mock implementation of set_gauge."""
-        pass
+        self._record("gauge", name, value, labels)
 
     def observe_histogram(self, name: str, value: float, **labels) -> None:
         """Mock implementation of observe_histogram."""
-        pass
+        self._record("histogram", name, value, labels)
 
     def track_operation(self, operation_name: str) -> Callable[[Callable], Callable]:
         """Mock implementation of track_operation."""
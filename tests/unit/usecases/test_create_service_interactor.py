@@ -147,3 +147,31 @@ def test_create_service_description_too_long():
     assert output_port.presented_service is None
     assert output_port.error is not None
     assert "description too long" in output_port.error.lower()
+
+
+def test_create_services_batch():
+    """Test creating a batch with one repository write and per-item errors."""
+    # Given
+    repository = MockServiceRepository()
+    output_port = MockCreateServiceOutputPort()
+    interactor = CreateServiceInteractor(
+        repository=repository,
+        output_port=output_port,
+        logger=MockLoggerPort(),
+        logging_context=MockLoggingContextPort(),
+        metrics=MockMetricsPort(),
+    )
+
+    # When
+    results = interactor.create_services(
+        [("First", "one"), ("", "missing name"), ("Third", "three")]
+    )
+
+    # Then
+    assert repository.save_many_called is True
+    assert repository.save_called is False
+    assert [r.name if r else None for r in results] == ["First", None, "Third"]
+    assert output_port.presented_services == results
+    assert output_port.batch_errors[0] is None
+    assert "name cannot be empty" in output_port.batch_errors[1].lower()
+    assert len(repository.services) == 2
@@ -143,3 +143,32 @@ def test_get_all_services_empty():
     # Verify the output port was called with empty list
     assert output_port.presented_services is not None
     assert len(output_port.presented_services) == 0
+
+    # Verify the services count was recorded
+    assert metrics.recorded == [("services_count", 0, {})]
+
+
+def test_get_services_reports_not_found(service_entity):
+    """Test that a multi-get presents missing IDs instead of failing."""
+    # Given
+    repository = MockServiceRepository()
+    output_port = MockGetServiceOutputPort()
+    repository.save(service_entity)
+    missing_id = UUID("00000000-0000-0000-0000-000000000000")
+
+    # When
+    interactor = GetServiceInteractor(
+        repository=repository,
+        output_port=output_port,
+        logger=MockLoggerPort(),
+        logging_context=MockLoggingContextPort(),
+        metrics=MockMetricsPort(),
+    )
+    result = interactor.get_services([service_entity.id, missing_id, service_entity.id])
+
+    # Then
+    assert [s.id for s in result] == [service_entity.id]
+    assert repository.get_many_called is True
+    assert [s.id for s in output_port.presented_services] == [service_entity.id]
+    assert output_port.not_found == [missing_id]
+    assert output_port.error is None